@@ -0,0 +1,135 @@
+"""
+Asyncio-Spielmodul für Tic-Tac-Toe
+Ereignisgesteuerte Variante von TicTacToeGame ohne festen Schleifentakt
+"""
+
+from typing import Optional, Tuple
+from time import monotonic
+import asyncio
+
+from game import TicTacToeGame
+from keypad_input import InputAction
+import latency
+
+
+class AsyncTicTacToeGame(TicTacToeGame):
+    """Spiel-Koordinator auf Basis von asyncio
+
+    Tasten kommen als Ereignisse in eine asyncio.Queue. Im Interrupt-Betrieb des
+    Keypads übergibt der Flanken-Callback sie direkt an die Event-Loop, sonst
+    pollt ein Executor-Thread. Computer-Züge werden im Executor berechnet.
+    Ereignisse werden nacheinander abgearbeitet, dadurch greift nie mehr als
+    ein Handler gleichzeitig auf game_logic zu.
+    """
+
+    MAINTENANCE_INTERVAL = 1.0
+
+    def start(self) -> None:
+        """Startet das Spiel in einer eigenen Event-Loop"""
+        self.running = True
+        try:
+            asyncio.run(self._run_async())
+        except KeyboardInterrupt:
+            print("\nSpiel durch Benutzer beendet.")
+        except Exception as e:
+            print(f"Unerwarteter Fehler: {e}")
+        finally:
+            self.cleanup()
+
+    async def _run_async(self) -> None:
+        """Hauptkoroutine: Eingabe starten, Willkommen zeigen, Ereignisse verarbeiten"""
+        self._loop = asyncio.get_running_loop()
+        self._events: "asyncio.Queue[Tuple[int, int]]" = asyncio.Queue()
+        self._searching = False
+
+        self._resume_state()
+        input_task = self._start_input()
+        maintenance_task = (asyncio.create_task(self._maintain_periodically())
+                            if self.state_file or self.game_logic.recorder else None)
+        try:
+            await self._show_welcome_screen_async()
+            await self._consume_events()
+        finally:
+            self.running = False
+            self.keypad.on_key = None
+            for task in (input_task, maintenance_task):
+                if task:
+                    task.cancel()
+
+    async def _maintain_periodically(self) -> None:
+        """Sichert Spielstand und Partie-Log in festen Abständen
+
+        StateFile und GameRecorder begrenzen ihre Schreibzugriffe selbst.
+        """
+        while self.running:
+            await asyncio.sleep(self.MAINTENANCE_INTERVAL)
+            self._save_state_if_idle()
+            self._flush_recorder()
+
+    def _save_state_if_idle(self) -> None:
+        """Sichert den Spielstand, außer während einer Suche im Executor
+
+        Die Suche probiert Züge auf game_logic aus und nimmt sie wieder zurück;
+        ein Snapshot in dieser Zeit enthielte eine nie gespielte Stellung.
+        """
+        if not self._searching:
+            self._save_state()
+
+    def _start_input(self) -> Optional["asyncio.Task"]:
+        """Verbindet das Keypad mit der Event-Queue"""
+        if getattr(self.keypad, "edge_triggered", False) is True:
+            self.keypad.on_key = self._post_key_threadsafe
+            return None
+        return asyncio.create_task(self._poll_keypad())
+
+    def _post_key_threadsafe(self, key: Tuple[int, int]) -> None:
+        """Callback aus dem GPIO-Thread: Taste an die Event-Loop übergeben"""
+        self._loop.call_soon_threadsafe(self._events.put_nowait, key)
+
+    async def _poll_keypad(self) -> None:
+        """Fallback ohne Interrupts: Keypad im Executor pollen"""
+        while self.running:
+            key = await self._loop.run_in_executor(
+                None, self.keypad.wait_for_input, self.MAIN_LOOP_DELAY
+            )
+            if key:
+                self._events.put_nowait(key)
+
+    async def _show_welcome_screen_async(self) -> None:
+        """Willkommensbildschirm als Timer; die erste Taste schließt ihn vorzeitig"""
+        self._ensure_welcome_shown()
+        remaining = self._welcome_shown_at + self.WELCOME_DELAY - monotonic()
+        if remaining > 0:
+            try:
+                await asyncio.wait_for(self._events.get(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        self._update_display()
+
+    async def _consume_events(self) -> None:
+        """Wartet auf Tasten und ruft die Handler auf"""
+        while self.running:
+            key = await self._events.get()
+            try:
+                action, data = self.keypad.map_key_to_action(key)
+                if latency.tracer is not None:
+                    latency.tracer.mark("map")
+                if action == InputAction.RANDOM_MOVE:
+                    await self._handle_random_move_async()
+                else:
+                    self._dispatch_action(action, data)
+            except Exception as e:
+                print(f"Fehler bei der Ereignisverarbeitung: {e}")
+
+    async def _handle_random_move_async(self) -> None:
+        """Berechnet den Computer-Zug im Executor und führt ihn dann aus"""
+        if self.game_logic.game_over:
+            return
+
+        self._searching = True
+        try:
+            move = await self._loop.run_in_executor(None, self.computer.choose_move, self.game_logic)
+        finally:
+            self._searching = False
+        if move:
+            self._handle_game_move(move[0], move[1])
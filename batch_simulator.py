@@ -0,0 +1,151 @@
+"""
+Batch-Simulator Module für Tic-Tac-Toe
+Spielt K Partien gleichzeitig als NumPy-Array der Form (K, 9)
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from typing import Callable, List, Optional, Tuple
+
+from bitboard import BOARD_SIZE, CELL_COUNT, SYMBOLS, WIN_LINES, WIN_MASKS
+
+
+# Zellwerte im Array: 0 = leer, 1 = X, 2 = O
+EMPTY_CELL = 0
+NO_WINNER = 0
+NO_LINE = -1
+
+# Breite einer Zeile der Tabelle nth_empty (siehe BatchSimulator.__init__)
+_ROW_WIDTH = CELL_COUNT + 1
+
+# Policy: (boards, Spieler 1/2, aktive Partien) -> Feldindex pro Partie
+BatchPolicy = Callable[["np.ndarray", int, "np.ndarray"], "np.ndarray"]
+
+
+class BatchSimulator:
+    """Simuliert viele Partien im Gleichschritt (alle Partien haben denselben Spieler am Zug)
+    
+    Intern wird pro Spieler eine Bitmaske je Partie geführt; die (K, 9)-Ansicht
+    ``boards`` wird daraus nur bei Bedarf erzeugt (z.B. für eigene Policies).
+    """
+
+    def __init__(self, games: int, seed: Optional[int] = None):
+        """Initialisiert K leere Boards"""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy wird für den Batch-Simulator benötigt")
+
+        self.games = games
+        self.rng = np.random.default_rng(seed)
+
+        # Für jede Belegungsmaske: Anzahl freier Felder und (flach) das n-te freie Feld.
+        # Jede Zeile hat einen Platz mehr als freie Felder möglich sind und wiederholt
+        # das letzte freie Feld, falls der Float-Zufallswert auf die Anzahl aufrundet.
+        self.empty_counts = np.zeros(1 << CELL_COUNT, dtype=np.float32)
+        self.nth_empty = np.zeros((1 << CELL_COUNT) * _ROW_WIDTH, dtype=np.uint8)
+        for occupied in range(1 << CELL_COUNT):
+            free = [index for index in range(CELL_COUNT) if not (occupied >> index) & 1]
+            self.empty_counts[occupied] = len(free)
+            if free:
+                start = occupied * _ROW_WIDTH
+                padding = free[-1:] * (_ROW_WIDTH - len(free))
+                self.nth_empty[start:start + _ROW_WIDTH] = free + padding
+
+        # Für jede Maske eines Spielers: Index der ersten vollständigen Linie (oder NO_LINE)
+        all_masks = np.arange(1 << CELL_COUNT)
+        self.win_line_of = np.full(1 << CELL_COUNT, NO_LINE, dtype=np.int8)
+        for line_index in reversed(range(len(WIN_MASKS))):
+            mask = WIN_MASKS[line_index]
+            self.win_line_of[(all_masks & mask) == mask] = line_index
+        self.cell_bits = np.array([1 << index for index in range(CELL_COUNT)], dtype=np.uint16)
+
+        self._cell_shifts = np.arange(CELL_COUNT, dtype=np.uint16)
+        self.reset()
+
+    def reset(self) -> None:
+        """Setzt alle Partien zurück"""
+        # Bitmaske pro Spieler und Partie (Bit = Feldindex)
+        self.bits = np.zeros((2, self.games), dtype=np.uint16)
+        self.winners = np.full(self.games, NO_WINNER, dtype=np.int8)
+        self.winning_line_indices = np.full(self.games, NO_LINE, dtype=np.int8)
+        self.game_over = np.zeros(self.games, dtype=bool)
+        self.ply = 0
+
+    @property
+    def boards(self) -> "np.ndarray":
+        """Alle Boards als Array der Form (K, 9) mit 0 = leer, 1 = X, 2 = O"""
+        x_cells = (self.bits[0][:, None] >> self._cell_shifts) & 1
+        o_cells = (self.bits[1][:, None] >> self._cell_shifts) & 1
+        return (x_cells + 2 * o_cells).astype(np.int8)
+
+    @property
+    def current_player(self) -> int:
+        """Spieler am Zug (1 = X, 2 = O)"""
+        return 1 + self.ply % 2
+
+    def random_moves(self, boards: Optional["np.ndarray"], player: int,
+                     active: "np.ndarray") -> "np.ndarray":
+        """Wählt pro Partie gleichverteilt ein freies Feld (nutzt die internen Bitmasken)"""
+        occupied = self.bits[0] | self.bits[1]
+        draws = self.rng.random(self.games, dtype=np.float32) * self.empty_counts.take(occupied)
+        return self.nth_empty.take(occupied.astype(np.intp) * _ROW_WIDTH + draws.astype(np.intp))
+
+    def step(self, policy: Optional[BatchPolicy] = None) -> None:
+        """Führt in allen laufenden Partien einen Zug aus"""
+        active = ~self.game_over
+        if not active.any():
+            return
+
+        player = self.current_player
+        if policy is None:
+            moves = self.random_moves(None, player, active)
+        else:
+            moves = np.asarray(policy(self.boards, player, active))
+
+        move_bits = self.cell_bits.take(moves) * active
+        if policy is not None and ((self.bits[0] | self.bits[1]) & move_bits).any():
+            raise ValueError("Policy hat ein belegtes Feld gewählt")
+        player_bits = self.bits[player - 1]
+        player_bits |= move_bits
+        self.ply += 1
+
+        # Vor dem fünften Zug kann niemand eine Linie vollständig haben
+        if self.ply < 2 * BOARD_SIZE - 1:
+            return
+
+        # Gewinnprüfung: ein Tabellenzugriff pro Partie statt Vergleich mit allen 8 Linien
+        lines = self.win_line_of.take(player_bits)
+        won = (lines != NO_LINE) & active
+
+        self.winners[won] = player
+        self.winning_line_indices[won] = lines[won]
+        self.game_over |= won
+
+        if self.ply >= CELL_COUNT:
+            self.game_over[:] = True
+
+    def play(self, policy: Optional[BatchPolicy] = None) -> "np.ndarray":
+        """Spielt alle Partien zu Ende und gibt die Gewinner zurück (0 = Unentschieden)"""
+        while not self.game_over.all():
+            self.step(policy)
+        return self.winners
+
+    def results(self) -> List[Optional[str]]:
+        """Gewinner pro Partie im Format von GameLogic.winner"""
+        return [SYMBOLS[winner - 1] if winner else None for winner in self.winners.tolist()]
+
+    def winning_lines(self) -> List[Tuple[Tuple[int, int], ...]]:
+        """Gewinnlinie pro Partie im Format von GameLogic.winning_line"""
+        return [
+            WIN_LINES[line_index] if line_index != NO_LINE else ()
+            for line_index in self.winning_line_indices.tolist()
+        ]
+
+    def summary(self) -> Tuple[int, int, int]:
+        """Gibt (Siege X, Siege O, Unentschieden) zurück"""
+        x_wins = int((self.winners == 1).sum())
+        o_wins = int((self.winners == 2).sum())
+        return x_wins, o_wins, self.games - x_wins - o_wins
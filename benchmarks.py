@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks für Tic-Tac-Toe
+Misst Spiellogik, Bildaufbau und Tasten-Mapping; Baseline als JSON und Regressionsvergleich.
+Zusätzlich Speicherbedarf pro Instanz der Spielzustände (--memory).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from display import PIL_AVAILABLE
+from game_logic import GameLogic
+from keypad_input import map_key_to_action
+
+
+# Eine Partie ohne Gewinner (alle 9 Züge) für den make_move-Benchmark
+DRAW_GAME = [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)]
+ALL_KEYS = [(row, col) for row in range(4) for col in range(4)]
+
+# Ein Benchmark: Setup liefert (Funktion, Anzahl Operationen pro Aufruf)
+Benchmark = Callable[[], Tuple[Callable[[], None], int]]
+
+
+def bench_make_move() -> Tuple[Callable[[], None], int]:
+    """Züge inklusive inkrementeller Gewinnprüfung (eine volle Partie + Reset)"""
+    game = GameLogic()
+
+    def run():
+        for row, col in DRAW_GAME:
+            game.make_move(row, col)
+        game.reset_game()
+    return run, len(DRAW_GAME)
+
+
+def bench_check_winner() -> Tuple[Callable[[], None], int]:
+    """Vollständige Gewinnprüfung auf einem halbvollen Board"""
+    game = GameLogic()
+    for row, col in DRAW_GAME[:5]:
+        game.make_move(row, col)
+    check_winner = game._check_winner
+
+    def run():
+        for _ in range(100):
+            check_winner()
+    return run, 100
+
+
+def bench_random_game() -> Tuple[Callable[[], None], int]:
+    """Komplette Zufallspartie über make_random_move"""
+    game = GameLogic()
+
+    def run():
+        while not game.game_over:
+            game.make_random_move()
+        game.reset_game()
+    return run, 1
+
+
+def bench_map_key() -> Tuple[Callable[[], None], int]:
+    """Tasten-Mapping für alle 16 Tasten"""
+    def run():
+        for key in ALL_KEYS:
+            map_key_to_action(key)
+    return run, len(ALL_KEYS)
+
+
+def _recording_display():
+    """Display auf einem MemoryDevice mit einem Board mitten im Spiel"""
+    from virtual_devices import RecordingDisplay
+
+    display = RecordingDisplay(max_frames=1)
+    game = GameLogic()
+    for row, col in DRAW_GAME[:5]:
+        game.make_move(row, col)
+    return display, game.board, game.get_status_message()
+
+
+def bench_compose_frame() -> Tuple[Callable[[], None], int]:
+    """Bildaufbau aus den Sprites (ohne Übertragung)"""
+    display, board, status = _recording_display()
+
+    def run():
+        display._compose_frame(board, status).close()
+    return run, 1
+
+
+def bench_show_game() -> Tuple[Callable[[], None], int]:
+    """Bildaufbau, Page-Umwandlung, Diff und Übertragung an ein MemoryDevice"""
+    display, board, status = _recording_display()
+    other_status = "Benchmark"
+
+    def run():
+        # Wechselnder Header, damit jeder Frame eine Übertragung erzeugt
+        display.show_game(board, status)
+        display.show_game(board, other_status)
+    return run, 2
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "make_move": bench_make_move,
+    "check_winner": bench_check_winner,
+    "random_game": bench_random_game,
+    "map_key": bench_map_key,
+    "compose_frame": bench_compose_frame,
+    "show_game": bench_show_game,
+}
+
+# Benötigen Pillow für das Rendern
+DISPLAY_BENCHMARKS = ("compose_frame", "show_game")
+
+
+def _game_in_progress() -> GameLogic:
+    game = GameLogic()
+    for row, col in DRAW_GAME[:4]:
+        game.make_move(row, col)
+    return game
+
+
+def _game_won() -> GameLogic:
+    game = GameLogic()
+    for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+        game.make_move(row, col)
+    return game
+
+
+def _server_session():
+    from game_server import Session
+    return Session(GameLogic(), 0.0)
+
+
+# Speicher-Messungen: Factory für eine Instanz im typischen Zustand
+MEMORY_BENCHMARKS: Dict[str, Callable[[], Any]] = {
+    "game_new": GameLogic,
+    "game_in_progress": _game_in_progress,
+    "game_won": _game_won,
+    "server_session": _server_session,
+}
+
+
+def measure_memory(factory: Callable[[], Any], count: int = 10000) -> float:
+    """Bytes pro Instanz: per tracemalloc gemessener Zuwachs beim Halten von count Instanzen
+
+    Enthält alles, was pro Instanz alloziert wird; geteilte Tabellen (Geometrie,
+    Gewinnlinien) werden vorher einmal erzeugt und zählen nicht mit.
+    """
+    factory()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Die Liste selbst gehört nicht zu den Instanzen
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+def measure(run: Callable[[], None], ops: int, repeat: int = 5,
+            min_time: float = 0.1) -> float:
+    """Bestes Ergebnis aus repeat Durchläufen in Nanosekunden pro Operation"""
+    # Anzahl Aufrufe pro Durchlauf so wählen, dass ein Durchlauf min_time dauert
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return best / (calls * ops) * 1e9
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeat: int = 5,
+                   min_time: float = 0.1) -> Dict:
+    """Führt die Benchmarks aus und gibt das Ergebnis im Baseline-Format zurück"""
+    results = {}
+    for name in names or list(BENCHMARKS):
+        if name in DISPLAY_BENCHMARKS and not PIL_AVAILABLE:
+            print(f"{name}: übersprungen (Pillow fehlt)")
+            continue
+        run, ops = BENCHMARKS[name]()
+        ns_per_op = measure(run, ops, repeat, min_time)
+        results[name] = {"ns_per_op": ns_per_op, "ops_per_second": 1e9 / ns_per_op}
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[Tuple[str, float, float, float]]:
+    """Gibt (Name, Baseline ns, aktuell ns, Verhältnis) aller Regressionen über threshold zurück"""
+    regressions = []
+    for name, entry in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = entry["ns_per_op"] / base["ns_per_op"]
+        if ratio > 1 + threshold:
+            regressions.append((name, base["ns_per_op"], entry["ns_per_op"], ratio))
+    return regressions
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None) -> None:
+    """Gibt die Ergebnisse aus, optional mit Verhältnis zur Baseline"""
+    print(f"{'Benchmark':<16}{'ns/Op':>12}{'Ops/s':>14}{'vs. Baseline':>14}")
+    print("-" * 56)
+    for name, entry in report["results"].items():
+        line = f"{name:<16}{entry['ns_per_op']:>12.1f}{entry['ops_per_second']:>14.0f}"
+        if baseline and name in baseline["results"]:
+            ratio = entry["ns_per_op"] / baseline["results"][name]["ns_per_op"]
+            line += f"{ratio:>13.2f}x"
+        print(line)
+
+
+def main():
+    """Einstiegspunkt für die Benchmarks"""
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe Microbenchmarks")
+    parser.add_argument("benchmarks", nargs="*",
+                        help=f"Auszuführende Benchmarks (Standard: alle): {', '.join(BENCHMARKS)}")
+    parser.add_argument("--save", metavar="DATEI", help="Ergebnis als Baseline speichern")
+    parser.add_argument("--compare", metavar="DATEI", help="Mit gespeicherter Baseline vergleichen")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Erlaubte Verlangsamung beim Vergleich (0.15 = 15%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="Durchläufe pro Benchmark")
+    parser.add_argument("--memory", action="store_true",
+                        help="Nur Speicherbedarf pro Instanz der Spielzustände messen")
+    args = parser.parse_args()
+
+    if args.memory:
+        print(f"{'Zustand':<20}{'Bytes/Instanz':>14}")
+        print("-" * 34)
+        for name, factory in MEMORY_BENCHMARKS.items():
+            print(f"{name:<20}{measure_memory(factory):>14.0f}")
+        return
+
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unbekannte Benchmarks: {', '.join(unknown)}")
+
+    report = run_benchmarks(args.benchmarks or None, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_report(report, baseline)
+
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+
+    if baseline:
+        regressions = compare(report, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.1f} -> {after:.1f} ns/Op ({ratio:.2f}x)")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Bitboard Module für Tic-Tac-Toe
+Kompakte Board-Darstellung mit zwei Integer-Bitmasken (X und O)
+"""
+
+from array import array
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+SYMBOLS = ("X", "O")
+EMPTY = "*"
+
+# Richtungen der Gewinnlinien in Prüfreihenfolge: Reihen, Spalten, Diagonalen
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class BoardGeometry:
+    """Vorberechnete Linien und Masken für ein N×N Board mit K-in-einer-Reihe"""
+
+    __slots__ = ("size", "win_length", "cell_count", "full_mask", "lines", "masks", "cell_lines",
+                 "cell_masks")
+
+    def __init__(self, size: int, win_length: int):
+        if size < 1 or not 1 <= win_length <= size:
+            raise ValueError("Ungültige Board-Größe oder Gewinnlänge")
+
+        self.size = size
+        self.win_length = win_length
+        self.cell_count = size * size
+        self.full_mask = (1 << self.cell_count) - 1
+
+        # Feldindex = Reihe * size + Spalte
+        lines = []
+        for d_row, d_col in _DIRECTIONS:
+            for row in range(size):
+                for col in range(size):
+                    end_row = row + d_row * (win_length - 1)
+                    end_col = col + d_col * (win_length - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        lines.append(tuple(
+                            (row + d_row * step, col + d_col * step) for step in range(win_length)
+                        ))
+        self.lines: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(lines)
+        self.masks: Tuple[int, ...] = tuple(
+            sum(1 << (row * size + col) for row, col in line) for line in self.lines
+        )
+
+        # Für jedes Feld: Indizes der Gewinnlinien, die durch dieses Feld laufen
+        cell_lines: List[List[int]] = [[] for _ in range(self.cell_count)]
+        for line_index, line in enumerate(self.lines):
+            for row, col in line:
+                cell_lines[row * size + col].append(line_index)
+        self.cell_lines: Tuple[Tuple[int, ...], ...] = tuple(tuple(lines) for lines in cell_lines)
+        # Für jedes Feld: Masken dieser Linien (Gewinnprüfung ohne Zähler)
+        self.cell_masks: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self.masks[line_index] for line_index in lines) for lines in self.cell_lines
+        )
+
+    def completed_line(self, bits: int, index: int) -> Optional[int]:
+        """Index einer vollständigen Linie durch das Feld index in bits (oder None)
+
+        Gewinnprüfung nach einem Zug für Zustände ohne BitBoard (Server-Sessions,
+        Suchbäume); geprüft werden nur die Linien durch das gesetzte Feld.
+        """
+        masks = self.cell_masks[index]
+        for mask in masks:
+            if bits & mask == mask:
+                # Liniennummer nur im (seltenen) Gewinnfall nachschlagen
+                return self.cell_lines[index][masks.index(mask)]
+        return None
+
+    def is_full(self, occupied: int) -> bool:
+        """Prüft ob alle Felder belegt sind"""
+        return occupied == self.full_mask
+
+
+@lru_cache(maxsize=None)
+def get_geometry(size: int = 3, win_length: Optional[int] = None) -> BoardGeometry:
+    """Gibt die (geteilte) Geometrie für Board-Größe und Gewinnlänge zurück"""
+    return BoardGeometry(size, size if win_length is None else win_length)
+
+
+# Klassisches 3×3 Board (genutzt von Lösungstabelle, Symmetrie und Batch-Simulator)
+CLASSIC = get_geometry(3)
+BOARD_SIZE = CLASSIC.size
+CELL_COUNT = CLASSIC.cell_count
+FULL_MASK = CLASSIC.full_mask
+WIN_LINES = CLASSIC.lines
+WIN_MASKS = CLASSIC.masks
+CELL_LINES = CLASSIC.cell_lines
+
+
+def cell_index(row: int, col: int) -> int:
+    """Wandelt (Reihe, Spalte) des 3×3 Boards in einen Bit-Index um"""
+    return row * BOARD_SIZE + col
+
+
+class BitBoard:
+    """Board als zwei Bitmasken: bits[0] für X, bits[1] für O
+
+    Zusätzlich führt jeder Spieler pro Gewinnlinie einen Zähler seiner Steine,
+    damit ein Zug nur die Linien durch sein Feld aktualisieren muss. Die Zähler
+    liegen kompakt in je einem array("H"), Linien und Masken in der geteilten
+    BoardGeometry.
+    """
+
+    __slots__ = ("geometry", "bits", "line_counts")
+
+    def __init__(self, geometry: BoardGeometry = CLASSIC):
+        self.geometry = geometry
+        self.bits = [0, 0]
+        self.line_counts = (array("H", bytes(2 * len(geometry.masks))),
+                            array("H", bytes(2 * len(geometry.masks))))
+
+    def clear(self) -> None:
+        """Leert das Board"""
+        self.bits[0] = 0
+        self.bits[1] = 0
+        for counts in self.line_counts:
+            counts[:] = array("H", bytes(2 * len(counts)))
+
+    def index(self, row: int, col: int) -> int:
+        """Wandelt (Reihe, Spalte) in einen Bit-Index um"""
+        return row * self.geometry.size + col
+
+    def key(self) -> int:
+        """Eindeutiger Positionsschlüssel (X-Bits unten, O-Bits darüber)"""
+        return self.bits[0] | (self.bits[1] << self.geometry.cell_count)
+
+    @property
+    def occupied(self) -> int:
+        """Bitmaske aller belegten Felder"""
+        return self.bits[0] | self.bits[1]
+
+    def is_empty(self, index: int) -> bool:
+        """Prüft ob ein Feld frei ist"""
+        return not (self.occupied >> index) & 1
+
+    def place(self, index: int, player: int) -> Optional[int]:
+        """Setzt ein Symbol des Spielers auf das Feld
+
+        Gibt den Index der dadurch vervollständigten Gewinnlinie zurück (oder None).
+        """
+        self.bits[player] |= 1 << index
+        counts = self.line_counts[player]
+        win_length = self.geometry.win_length
+        completed = None
+        for line_index in self.geometry.cell_lines[index]:
+            counts[line_index] += 1
+            if counts[line_index] == win_length and completed is None:
+                completed = line_index
+        return completed
+
+    def remove(self, index: int) -> None:
+        """Entfernt ein Symbol vom Feld"""
+        for player in (0, 1):
+            if (self.bits[player] >> index) & 1:
+                self.bits[player] &= ~(1 << index)
+                counts = self.line_counts[player]
+                for line_index in self.geometry.cell_lines[index]:
+                    counts[line_index] -= 1
+
+    def load_bits(self, bits_x: int, bits_o: int) -> None:
+        """Lädt das Board aus zwei Bitmasken und baut die Linienzähler neu auf"""
+        self.clear()
+        for player, bits in enumerate((bits_x, bits_o)):
+            while bits:
+                low = bits & -bits
+                self.place(low.bit_length() - 1, player)
+                bits ^= low
+
+    def set_symbol(self, index: int, symbol: str) -> None:
+        """Setzt ein Feld anhand seines Symbols ("X", "O" oder "*")"""
+        self.remove(index)
+        if symbol in SYMBOLS:
+            self.place(index, SYMBOLS.index(symbol))
+
+    def symbol_at(self, index: int) -> str:
+        """Gibt das Symbol eines Feldes zurück"""
+        if (self.bits[0] >> index) & 1:
+            return SYMBOLS[0]
+        if (self.bits[1] >> index) & 1:
+            return SYMBOLS[1]
+        return EMPTY
+
+    def empty_indices(self) -> List[int]:
+        """Gibt die Indizes aller freien Felder zurück"""
+        free = ~self.occupied & self.geometry.full_mask
+        indices = []
+        while free:
+            low = free & -free
+            indices.append(low.bit_length() - 1)
+            free ^= low
+        return indices
+
+    def is_full(self) -> bool:
+        """Prüft ob alle Felder belegt sind"""
+        return self.geometry.is_full(self.occupied)
+
+    def find_win(self, player: int) -> Optional[int]:
+        """Gibt den Index der ersten vollständigen Linie des Spielers zurück"""
+        bits = self.bits[player]
+        for line_index, mask in enumerate(self.geometry.masks):
+            if bits & mask == mask:
+                return line_index
+        return None
+
+    def to_rows(self) -> List[List[str]]:
+        """Materialisiert das Board als Liste von Listen"""
+        size = self.geometry.size
+        return [
+            [self.symbol_at(i * size + j) for j in range(size)]
+            for i in range(size)
+        ]
+
+    def load_rows(self, rows: List[List[str]]) -> None:
+        """Lädt das Board aus einer Liste von Listen"""
+        self.clear()
+        for i, row in enumerate(rows):
+            for j, cell in enumerate(row):
+                if cell in SYMBOLS:
+                    self.place(self.index(i, j), SYMBOLS.index(cell))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Build-Schritt für das Tic-Tac-Toe Eröffnungsbuch
+Liest Partie-Logs (siehe game_record.py) und trägt neue Partien inkrementell
+in opening_book.bin ein.
+"""
+
+import argparse
+import os
+
+from game_record import GameLog
+from opening_book import DEFAULT_BOOK_PATH, OpeningBook
+
+
+def update_book(book_path: str, log_path: str, rebuild: bool = False) -> OpeningBook:
+    """Lädt das Buch (falls vorhanden), ergänzt neue Records des Logs und speichert es"""
+    if rebuild or not os.path.exists(book_path):
+        book = OpeningBook()
+    else:
+        book = OpeningBook.load(book_path)
+
+    with GameLog(log_path) as log:
+        new_records = book.index_log(log)
+    if new_records:
+        book.save(book_path)
+    print(f"{new_records} neue Partien indiziert, {len(book)} Stellungen in {book_path}")
+    return book
+
+
+def main():
+    """Aktualisiert das Eröffnungsbuch"""
+    parser = argparse.ArgumentParser(
+        description="Erzeugt das Tic-Tac-Toe Eröffnungsbuch aus einem Partie-Log")
+    parser.add_argument("log", help="Partie-Log (main.py --record)")
+    parser.add_argument("--output", default=DEFAULT_BOOK_PATH, help="Zieldatei")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Buch komplett neu aufbauen statt nur neue Partien zu ergänzen")
+    args = parser.parse_args()
+
+    update_book(args.output, args.log, args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build-Schritt für die Tic-Tac-Toe Lösungstabelle
+Durchläuft alle von reset_game() erreichbaren Stellungen und schreibt
+besten Zug und Spielwert in eine gepackte Binärdatei.
+"""
+
+from typing import Dict, Optional, Tuple
+import argparse
+
+from bitboard import BOARD_SIZE
+from computer_player import MinimaxPlayer
+from game_logic import GameLogic
+from solution_table import (
+    DEFAULT_TABLE_PATH, HEADER, MAGIC, TABLE_SIZE, base3_index, pack_entry
+)
+
+
+def solve_positions() -> Dict[int, Tuple[Optional[int], int]]:
+    """Löst alle erreichbaren Stellungen: Basis-3 Index -> (bester Zug, Wert)"""
+    player = MinimaxPlayer()
+    game = GameLogic()
+    solutions: Dict[int, Tuple[Optional[int], int]] = {}
+
+    def visit() -> None:
+        index = base3_index(game.position_key)
+        if index in solutions:
+            return
+
+        if game.game_over:
+            solutions[index] = (None, player._terminal_score(game))
+            return
+
+        best_move = None
+        best_score = None
+        for row, col in game._get_empty_positions():
+            score = player._score_move(game, row, col)
+            if best_score is None or score > best_score:
+                best_move, best_score = row * BOARD_SIZE + col, score
+        solutions[index] = (best_move, best_score)
+
+        for row, col in game._get_empty_positions():
+            game.make_move(row, col)
+            visit()
+            game.unmake_move()
+
+    visit()
+    return solutions
+
+
+def write_table(path: str, solutions: Dict[int, Tuple[Optional[int], int]]) -> None:
+    """Schreibt die gepackte Tabelle (nicht erreichbare Stellungen bleiben leer)"""
+    empty_entry = pack_entry(None, 0)
+    with open(path, "wb") as table_file:
+        table_file.write(HEADER.pack(MAGIC, TABLE_SIZE))
+        table_file.write(b"".join(
+            pack_entry(*solutions[index]) if index in solutions else empty_entry
+            for index in range(TABLE_SIZE)
+        ))
+
+
+def main():
+    """Erzeugt die Lösungstabelle"""
+    parser = argparse.ArgumentParser(description="Erzeugt die Tic-Tac-Toe Lösungstabelle")
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH, help="Zieldatei")
+    args = parser.parse_args()
+
+    solutions = solve_positions()
+    write_table(args.output, solutions)
+    print(f"{len(solutions)} Stellungen nach {args.output} geschrieben")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Build-Schritt: rendert den Willkommensbildschirm vor
+Schreibt welcome.bin im SSD1306 Page-Format, damit der erste Frame ohne Schriftarten auskommt
+"""
+
+import argparse
+
+from display import WELCOME_BITMAP_PATH, OLEDDisplay
+from framebuffer import rows_to_pages
+from virtual_devices import MemoryDevice
+
+
+def render_welcome() -> bytearray:
+    """Rendert den Willkommensbildschirm mit Pillow ins Page-Format"""
+    display = OLEDDisplay(device=MemoryDevice())
+    with display.compose_welcome() as img:
+        return rows_to_pages(img.tobytes(), display.WIDTH, display.HEIGHT)
+
+
+def main():
+    """Erzeugt die Willkommens-Bitmap"""
+    parser = argparse.ArgumentParser(description="Rendert den Tic-Tac-Toe Willkommensbildschirm vor")
+    parser.add_argument("--output", default=WELCOME_BITMAP_PATH, help="Zieldatei")
+    args = parser.parse_args()
+
+    pages = render_welcome()
+    with open(args.output, "wb") as bitmap_file:
+        bitmap_file.write(pages)
+    print(f"{len(pages)} Bytes nach {args.output} geschrieben")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Computer-Gegner Module für Tic-Tac-Toe
+Zug-Strategien: Zufall, perfektes Spiel (Negamax mit Alpha-Beta), Eröffnungsbuch
+und Monte-Carlo-Baumsuche für große Boards
+"""
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import random
+
+from bitboard import CELL_COUNT
+from game_logic import GameLogic
+from search_defaults import DEFAULT_TIME_BUDGET_MS
+
+# Tabellen, Buch und Suche werden erst beim Erzeugen der Strategie importiert,
+# damit der Programmstart (Willkommensbildschirm) sie nicht bezahlt
+if TYPE_CHECKING:
+    from opening_book import OpeningBook
+
+
+class MovePolicy(Enum):
+    """Verfügbare Zug-Strategien für den Computer"""
+    RANDOM = "random"
+    MINIMAX = "minimax"
+    TABLE = "table"
+    BOOK = "book"
+    MCTS = "mcts"
+
+
+# Einträge der Transpositionstabelle
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class RandomPlayer:
+    """Wählt gleichverteilt einen freien Platz"""
+
+    def make_move(self, game: GameLogic) -> bool:
+        """Führt einen zufälligen Zug aus"""
+        return game.make_random_move()
+
+    def choose_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Wählt einen zufälligen freien Platz, ohne ihn zu setzen"""
+        if game.game_over:
+            return None
+        empty_positions = game._get_empty_positions()
+        return random.choice(empty_positions) if empty_positions else None
+
+
+class BookPlayer:
+    """Spielt den Zug mit der besten Ergebnisquote aus aufgezeichneten Partien
+
+    Stellungen mit weniger als min_games Partien pro Zug gelten als unbekannt;
+    dann wird ein Zufallszug gespielt.
+    """
+
+    def __init__(self, min_games: int = 5, rng: Optional[random.Random] = None,
+                 path: Optional[str] = None, book: Optional["OpeningBook"] = None):
+        self.min_games = min_games
+        self.rng = rng or random.Random()
+        if book is None:
+            from opening_book import DEFAULT_BOOK_PATH, OpeningBook
+            book = OpeningBook.load(path or DEFAULT_BOOK_PATH)
+        self.book = book
+
+    def make_move(self, game: GameLogic) -> bool:
+        """Führt den Buchzug aus, sonst einen Zufallszug"""
+        move = self.choose_move(game)
+        if move is None:
+            return False
+        return game.make_move(*move)
+
+    def choose_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Wählt den Buchzug, sonst einen zufälligen freien Platz"""
+        if game.game_over:
+            return None
+        move = self.book.best_move(game.position_key, self.min_games)
+        if move is None:
+            empty_positions = game._get_empty_positions()
+            return self.rng.choice(empty_positions) if empty_positions else None
+        return move
+
+
+class _PerfectPlayer(ABC):
+    """Basis für perfekte Spieler mit Schwierigkeitsgrad
+
+    Mit ``difficulty`` < 1.0 wird anteilig ein Zufallszug gespielt.
+    """
+
+    def __init__(self, difficulty: float = 1.0, rng: Optional[random.Random] = None):
+        if not 0.0 <= difficulty <= 1.0:
+            raise ValueError("difficulty muss zwischen 0.0 und 1.0 liegen")
+        self.difficulty = difficulty
+        self.rng = rng or random.Random()
+
+    def make_move(self, game: GameLogic) -> bool:
+        """Führt den gewählten Zug für den aktuellen Spieler aus"""
+        move = self.choose_move(game)
+        if move is None:
+            return False
+        return game.make_move(*move)
+
+    def choose_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Wählt einen Zug gemäß Schwierigkeitsgrad"""
+        if game.game_over:
+            return None
+        if self.rng.random() >= self.difficulty:
+            empty_positions = game._get_empty_positions()
+            return self.rng.choice(empty_positions) if empty_positions else None
+        return self.best_move(game)
+
+    @abstractmethod
+    def best_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Gibt einen optimalen Zug zurück"""
+
+
+class TablePlayer(_PerfectPlayer):
+    """Perfekter Spieler über die vorberechnete Lösungstabelle (ein Lookup pro Zug)"""
+
+    def __init__(self, difficulty: float = 1.0, rng: Optional[random.Random] = None,
+                 path: Optional[str] = None):
+        from solution_table import DEFAULT_TABLE_PATH, SolutionTable
+        super().__init__(difficulty, rng)
+        self.table = SolutionTable(path or DEFAULT_TABLE_PATH)
+
+    def best_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Gibt den gespeicherten besten Zug zurück"""
+        if game.game_over:
+            return None
+        return self.table.best_move(game.position_key)
+
+
+class MinimaxPlayer(_PerfectPlayer):
+    """Perfekter Spieler: Negamax mit Alpha-Beta und Transpositionstabelle
+
+    Die Tabelle wird von allen Instanzen geteilt und beim ersten Erstellen
+    einmal vom leeren Board aus gefüllt, damit der erste Zug nicht stockt.
+    Schlüssel ist die unter Drehung/Spiegelung kanonische Stellung.
+    """
+
+    _table: Dict[int, Tuple[int, int]] = {}
+
+    def __init__(self, difficulty: float = 1.0, rng: Optional[random.Random] = None):
+        from symmetry import canonical_key
+        super().__init__(difficulty, rng)
+        self._canonical_key = canonical_key
+        if not MinimaxPlayer._table:
+            self.evaluate(GameLogic())
+
+    def best_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Gibt einen optimalen Zug zurück (bei Gleichstand zufällig)"""
+        if game.game_over:
+            return None
+
+        best_moves: List[Tuple[int, int]] = []
+        best_score = None
+        # Suchzüge laufen auf der echten Partie und dürfen nicht aufgezeichnet werden
+        recorder, game.recorder = game.recorder, None
+        try:
+            for row, col in game._get_empty_positions():
+                score = self._score_move(game, row, col)
+                if best_score is None or score > best_score:
+                    best_score = score
+                    best_moves = [(row, col)]
+                elif score == best_score:
+                    best_moves.append((row, col))
+        finally:
+            game.recorder = recorder
+
+        return self.rng.choice(best_moves) if best_moves else None
+
+    def evaluate(self, game: GameLogic) -> int:
+        """Bewertet die Stellung aus Sicht des Spielers am Zug
+
+        Positiv = Gewinn, 0 = Unentschieden, negativ = Verlust. Schnellere
+        Gewinne (mehr freie Felder) bekommen höhere Werte.
+        """
+        if game.game_over:
+            return self._terminal_score(game)
+        return self._negamax(game, -CELL_COUNT - 1, CELL_COUNT + 1)
+
+    def _score_move(self, game: GameLogic, row: int, col: int) -> int:
+        """Bewertet einen Zug aus Sicht des ziehenden Spielers"""
+        game.make_move(row, col)
+        if game.game_over:
+            score = -self._terminal_score(game)
+        else:
+            score = -self.evaluate(game)
+        game.unmake_move()
+        return score
+
+    def _terminal_score(self, game: GameLogic) -> int:
+        """Wert einer Endstellung aus Sicht des Gegners des letzten Ziehenden"""
+        if game.winner is None:
+            return 0
+        return -(len(game._get_empty_positions()) + 1)
+
+    def _negamax(self, game: GameLogic, alpha: int, beta: int) -> int:
+        """Negamax mit Alpha-Beta-Schnitt und Transpositionstabelle"""
+        key = self._canonical_key(game.position_key)
+        entry = self._table.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == EXACT:
+                return value
+            if flag == LOWER_BOUND:
+                alpha = max(alpha, value)
+            elif flag == UPPER_BOUND:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best = None
+        for row, col in game._get_empty_positions():
+            game.make_move(row, col)
+            if game.game_over:
+                score = -self._terminal_score(game)
+            else:
+                score = -self._negamax(game, -beta, -alpha)
+            game.unmake_move()
+
+            if best is None or score > best:
+                best = score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best <= original_alpha:
+            flag = UPPER_BOUND
+        elif best >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table[key] = (best, flag)
+        return best
+
+
+def create_move_policy(policy: MovePolicy = MovePolicy.RANDOM, difficulty: float = 1.0,
+                       board_size: int = 3, time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
+                       workers: int = 1, win_length: Optional[int] = None):
+    """Factory-Funktion für Zug-Strategien (time_budget_ms und workers nur für MCTS)
+
+    Die Suche samt multiprocessing wird erst hier importiert (siehe oben).
+    Tabelle, Buch und Minimax kennen nur 3×3 mit drei in einer Reihe
+    (win_length None steht wie bei GameLogic für die Brettgröße).
+    """
+    if policy == MovePolicy.MCTS:
+        from mcts import MCTSPlayer
+        return MCTSPlayer(time_budget_ms, workers)
+    if policy != MovePolicy.RANDOM and (board_size, win_length or board_size) != (3, 3):
+        print(f"Strategie {policy.value} unterstützt nur 3×3 mit 3 in einer Reihe, "
+              f"nutze Zufallszüge")
+        return RandomPlayer()
+    if policy == MovePolicy.TABLE:
+        try:
+            return TablePlayer(difficulty)
+        except (OSError, ValueError) as e:
+            print(f"Lösungstabelle nicht verfügbar, nutze Minimax: {e}")
+            return MinimaxPlayer(difficulty)
+    if policy == MovePolicy.BOOK:
+        try:
+            return BookPlayer()
+        except (OSError, ValueError) as e:
+            print(f"Eröffnungsbuch nicht verfügbar, nutze Zufallszüge: {e}")
+            return RandomPlayer()
+    if policy == MovePolicy.MINIMAX:
+        return MinimaxPlayer(difficulty)
+    return RandomPlayer()
@@ -0,0 +1,135 @@
+"""
+Entprellung Module für Tic-Tac-Toe
+Zeitbasierte Zustandsmaschine pro Taste mit Press-, Release- und Repeat-Ereignissen
+"""
+
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import time
+
+
+Key = Tuple[int, int]
+
+
+class KeyEventType(Enum):
+    """Art eines entprellten Tastenereignisses"""
+    PRESS = "press"
+    RELEASE = "release"
+    REPEAT = "repeat"
+
+
+class KeyEvent(NamedTuple):
+    """Entprelltes Tastenereignis
+
+    timestamp ist der Zeitpunkt der Bestätigung, since der Zeitpunkt der ersten
+    Abtastung mit dem neuen Pegel (bei REPEAT gleich timestamp).
+    """
+    type: KeyEventType
+    key: Key
+    timestamp: float
+    since: float
+
+
+class _KeyState:
+    """Zustand einer Taste: bestätigter Pegel, Rohpegel und Zeitpunkt des letzten Pegelwechsels"""
+
+    __slots__ = ("pressed", "raw", "raw_since", "next_repeat")
+
+    def __init__(self, now: float):
+        self.pressed = False
+        self.raw = True
+        self.raw_since = now
+        self.next_repeat: Optional[float] = None
+
+
+class Debouncer:
+    """Entprellt Abtastungen der Keypad-Matrix anhand von Zeitstempeln
+
+    Ein Pegelwechsel einer Taste wird erst bestätigt, wenn der Rohpegel
+    press_time (gedrückt) bzw. release_time (losgelassen) lang stabil war.
+    Kürzere Störimpulse verschwinden ohne Ereignis. Mit repeat_delay erzeugt
+    eine gehaltene Taste nach dieser Zeit alle repeat_interval Sekunden ein
+    REPEAT-Ereignis. Die Zeitquelle (clock) ist austauschbar, damit Tests mit
+    einer simulierten Uhr laufen können.
+    """
+
+    def __init__(self, press_time: float = 0.02, release_time: float = 0.05,
+                 repeat_delay: Optional[float] = None, repeat_interval: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic):
+        if press_time < 0 or release_time < 0 or repeat_interval <= 0:
+            raise ValueError("Ungültige Entprell-Zeiten")
+        if repeat_delay is not None and repeat_delay < 0:
+            raise ValueError("Ungültige Auto-Repeat-Verzögerung")
+
+        self.press_time = press_time
+        self.release_time = release_time
+        self.repeat_delay = repeat_delay
+        self.repeat_interval = repeat_interval
+        self.clock = clock
+        self._states: Dict[Key, _KeyState] = {}
+
+    def reset(self) -> None:
+        """Vergisst alle Tastenzustände"""
+        self._states.clear()
+
+    @property
+    def pressed_keys(self) -> List[Key]:
+        """Alle Tasten, deren Druck bestätigt und noch nicht losgelassen wurde"""
+        return [key for key, state in self._states.items() if state.pressed]
+
+    def is_pressed(self, key: Key) -> bool:
+        """Prüft ob eine Taste (entprellt) gedrückt ist"""
+        state = self._states.get(key)
+        return bool(state and state.pressed)
+
+    def update(self, raw_keys: Iterable[Key], now: Optional[float] = None) -> List[KeyEvent]:
+        """Verarbeitet eine Abtastung (alle aktuell geschlossenen Tasten)
+
+        Gibt die dadurch bestätigten Ereignisse zurück.
+        """
+        now = self.clock() if now is None else now
+        raw_keys = set(raw_keys)
+        for key in sorted(raw_keys - self._states.keys()):
+            self._states[key] = _KeyState(now)
+
+        events = []
+        for key in list(self._states):
+            state = self._states[key]
+            raw = key in raw_keys
+            if raw != state.raw:
+                state.raw = raw
+                state.raw_since = now
+
+            if raw != state.pressed:
+                threshold = self.press_time if raw else self.release_time
+                if now - state.raw_since >= threshold:
+                    state.pressed = raw
+                    if raw:
+                        events.append(KeyEvent(KeyEventType.PRESS, key, now, state.raw_since))
+                        if self.repeat_delay is not None:
+                            state.next_repeat = now + self.repeat_delay
+                    else:
+                        events.append(KeyEvent(KeyEventType.RELEASE, key, now, state.raw_since))
+                        state.next_repeat = None
+            elif state.pressed and state.next_repeat is not None and now >= state.next_repeat:
+                events.append(KeyEvent(KeyEventType.REPEAT, key, now, now))
+                state.next_repeat = now + self.repeat_interval
+
+            if not state.pressed and not state.raw:
+                del self._states[key]
+        return events
+
+    def time_to_settle(self, now: Optional[float] = None) -> Optional[float]:
+        """Zeit bis der nächste offene Pegelwechsel bestätigt werden kann
+
+        None, wenn keine Taste in einem unbestätigten Zustand ist.
+        """
+        now = self.clock() if now is None else now
+        remaining = None
+        for state in self._states.values():
+            if state.raw == state.pressed:
+                continue
+            threshold = self.press_time if state.raw else self.release_time
+            wait = max(0.0, state.raw_since + threshold - now)
+            remaining = wait if remaining is None else min(remaining, wait)
+        return remaining
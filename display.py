@@ -5,14 +5,42 @@ OLED Display Verwaltung
 
 try:
     from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
     from luma.core.interface.serial import i2c
     from luma.oled.device import ssd1306
-    OLED_AVAILABLE = True
+    OLED_AVAILABLE = PIL_AVAILABLE
 except ImportError:
     OLED_AVAILABLE = False
 
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
 from time import sleep
+import os
+import queue
+import threading
+
+from framebuffer import PAGE_HEIGHT, FrameBuffer, push_regions, rows_to_pages
+import latency
+
+
+# Vorgerenderter Willkommensbildschirm im SSD1306 Page-Format (build_welcome_bitmap.py)
+WELCOME_BITMAP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "welcome.bin")
+
+
+def load_welcome_bitmap(path: str = WELCOME_BITMAP_PATH,
+                        width: int = 128, height: int = 64) -> Optional[bytearray]:
+    """Lädt den vorgerenderten Willkommensbildschirm (None, falls nicht vorhanden)"""
+    try:
+        with open(path, "rb") as bitmap_file:
+            pages = bytearray(bitmap_file.read())
+    except OSError:
+        return None
+    return pages if len(pages) == width * height // PAGE_HEIGHT else None
+
 
 class OLEDDisplay:
     """OLED Display Klasse für Tic-Tac-Toe"""
@@ -20,62 +48,144 @@ class OLEDDisplay:
     # Display Konstanten
     WIDTH = 128
     HEIGHT = 64
-    GRID_SIZE = 45
-    CELL_SIZE = 15
+    HEADER_HEIGHT = 17
+    GRID_TOP = 18
+    GRID_SIZE = 45  # Maximale Kantenlänge des Spielfelds in Pixeln
+    MIN_TEXT_CELL_SIZE = 12  # Darunter werden X/O als Linien statt als Text gezeichnet
     ANIMATION_FRAMES = 6
     ANIMATION_DELAY = 0.2
+    HEADER_CACHE_SIZE = 16  # Anzahl gecachter Status-Header (LRU)
     
-    def __init__(self, port: int = 1, address: int = 0x3c):
-        """Initialisiert das OLED Display"""
-        self.serial = i2c(port=port, address=address)
-        self.device = ssd1306(self.serial, width=self.WIDTH, height=self.HEIGHT)
-        self._load_fonts()
+    def __init__(self, port: int = 1, address: int = 0x3c, board_size: int = 3, device=None):
+        """Initialisiert das OLED Display
         
+        Statt des SSD1306 über I2C kann ein anderes Gerät mit der luma-Schnittstelle
+        (display, command, data) übergeben werden, z.B. virtual_devices.MemoryDevice.
+        """
+        if device is None:
+            self.serial = i2c(port=port, address=address)
+            device = ssd1306(self.serial, width=self.WIDTH, height=self.HEIGHT)
+        self.device = device
+        self.framebuffer = FrameBuffer(self.WIDTH, self.HEIGHT)
+        self._header_sprites: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._set_board_size(board_size)
+        
+        # Schriftarten werden erst bei Bedarf oder im Hintergrund (preload) geladen
+        self._fonts: Optional[tuple] = None
+        self._font_lock = threading.Lock()
+    
+    def _set_board_size(self, board_size: int) -> None:
+        """Berechnet Zellen- und Gittergröße für ein N×N Board"""
+        self.board_size = board_size
+        self.cell_size = self.GRID_SIZE // board_size
+        self.grid_size = self.cell_size * board_size
+        self.grid_x = (self.WIDTH - self.grid_size) // 2
+        self.grid_y = self.GRID_TOP
+        
+        # Sprites hängen von der Zellgröße ab
+        self._symbol_sprites: Dict[str, "Image.Image"] = {}
+        self._grid_sprite: Optional["Image.Image"] = None
+        
+    def _push_frame(self, img: "Image.Image") -> None:
+        """Sendet nur die geänderten Pages/Spalten, beim ersten Frame das ganze Bild"""
+        self._push_pages(rows_to_pages(img.tobytes(), self.WIDTH, self.HEIGHT), img)
+    
+    def _push_pages(self, pages: bytearray, img: Optional["Image.Image"] = None) -> None:
+        """Überträgt einen Frame im Page-Format (img nur für die erste Vollübertragung)"""
+        regions = self.framebuffer.diff(pages)
+        if regions is None and img is not None:
+            self.device.display(img)
+        else:
+            if regions is None:
+                regions = [(page, 0, self.WIDTH - 1) for page in range(self.HEIGHT // PAGE_HEIGHT)]
+            push_regions(self.device, self.framebuffer, regions)
+        
+        if latency.tracer is not None:
+            latency.tracer.end("flush")
+    
     def _load_fonts(self) -> None:
-        """Lädt die Schriftarten"""
-        try:
-            self.font_small = ImageFont.truetype("DejaVuSans.ttf", 10)
-            self.font_medium = ImageFont.truetype("DejaVuSans-Bold.ttf", 12)
-            self.font_large = ImageFont.truetype("DejaVuSans-Bold.ttf", 16)
-        except (OSError, IOError):
-            self.font_small = ImageFont.load_default()
-            self.font_medium = ImageFont.load_default()
-            self.font_large = ImageFont.load_default()
+        """Lädt die Schriftarten (einmalig, thread-sicher)"""
+        with self._font_lock:
+            if self._fonts is not None:
+                return
+            try:
+                self._fonts = (
+                    ImageFont.truetype("DejaVuSans.ttf", 10),
+                    ImageFont.truetype("DejaVuSans-Bold.ttf", 12),
+                    ImageFont.truetype("DejaVuSans-Bold.ttf", 16),
+                )
+            except (OSError, IOError):
+                self._fonts = (
+                    ImageFont.load_default(),
+                    ImageFont.load_default(),
+                    ImageFont.load_default(),
+                )
+    
+    @property
+    def font_small(self) -> "ImageFont.ImageFont":
+        self._load_fonts()
+        return self._fonts[0]
+    
+    @property
+    def font_medium(self) -> "ImageFont.ImageFont":
+        self._load_fonts()
+        return self._fonts[1]
+    
+    @property
+    def font_large(self) -> "ImageFont.ImageFont":
+        self._load_fonts()
+        return self._fonts[2]
+    
+    def preload(self) -> threading.Thread:
+        """Lädt Schriftarten und Spielfeld-Sprites in einem Hintergrund-Thread"""
+        def load():
+            self._load_fonts()
+            self._get_grid_sprite()
+            for symbol in ("X", "O"):
+                self._symbol_sprite(symbol)
+        
+        thread = threading.Thread(target=load, name="display-preload", daemon=True)
+        thread.start()
+        return thread
     
     def show_welcome(self) -> None:
-        """Zeigt Willkommensnachricht"""
-        with Image.new('1', (self.WIDTH, self.HEIGHT)) as img:
-            draw = ImageDraw.Draw(img)
-            
-            # Header mit Titel
-            draw.rectangle([(0, 0), (self.WIDTH, 16)], fill=1)
-            self._draw_centered_text(draw, "Tic-Tac-Toe", 2, self.font_small, fill=0)
-            
-            # Anweisungen
-            instructions = [
-                "[1-9]: Feld wählen",
-                "[*]: Neues Spiel", 
-                "[#]: Zufallszug",
-                "[D]: Programm beenden"
-            ]
+        """Zeigt Willkommensnachricht (vorgerendert, ohne Schriftarten zu laden)"""
+        pages = load_welcome_bitmap(width=self.WIDTH, height=self.HEIGHT)
+        if pages is not None:
+            self._push_pages(pages)
+            return
+        
+        with self.compose_welcome() as img:
+            self._push_frame(img)
+    
+    def compose_welcome(self) -> "Image.Image":
+        """Zeichnet den Willkommensbildschirm (Quelle für welcome.bin)"""
+        img = Image.new('1', (self.WIDTH, self.HEIGHT))
+        draw = ImageDraw.Draw(img)
+        
+        # Header mit Titel
+        draw.rectangle([(0, 0), (self.WIDTH, 16)], fill=1)
+        self._draw_centered_text(draw, "Tic-Tac-Toe", 2, self.font_small, fill=0)
+        
+        # Anweisungen
+        instructions = [
+            "[1-9]: Feld wählen",
+            "[*]: Neues Spiel", 
+            "[#]: Zufallszug",
+            "[D]: Programm beenden"
+        ]
+        
+        for i, text in enumerate(instructions):
+            draw.text((5, 20 + i * 10), text, font=self.font_small, fill=1)
             
-            for i, text in enumerate(instructions):
-                draw.text((5, 20 + i * 10), text, font=self.font_small, fill=1)
-                
-            self.device.display(img)
+        return img
     
     def show_game(self, board: List[List[str]], game_status: str) -> None:
         """Zeigt das aktuelle Spiel"""
-        with Image.new('1', (self.WIDTH, self.HEIGHT)) as img:
-            draw = ImageDraw.Draw(img)
-            
-            # Header mit Status
-            self._draw_header(draw, game_status)
-            
-            # Spiel-Grid zeichnen
-            self._draw_game_grid(draw, board)
-            
-            self.device.display(img)
+        with self._compose_frame(board, game_status) as img:
+            if latency.tracer is not None:
+                latency.tracer.mark("compose")
+            self._push_frame(img)
     
     def show_game_with_animation(self, board: List[List[str]], 
                                game_status: str, winning_line: List[Tuple[int, int]]) -> None:
@@ -88,90 +198,105 @@ class OLEDDisplay:
     
     def _animate_winning_line(self, board: List[List[str]], game_status: str, 
                             winning_line: List[Tuple[int, int]]) -> None:
-        """Animiert die Gewinnerlinie"""
+        """Animiert die Gewinnerlinie (blockierend)"""
+        for _ in self.animation_frames(board, game_status, winning_line):
+            sleep(self.ANIMATION_DELAY)
+    
+    def animation_frames(self, board: List[List[str]], game_status: str, 
+                         winning_line: List[Tuple[int, int]]) -> Iterator[int]:
+        """Sendet die Animations-Frames einzeln; der Aufrufer bestimmt die Pausen"""
         for frame in range(self.ANIMATION_FRAMES):
-            with Image.new('1', (self.WIDTH, self.HEIGHT)) as img:
-                draw = ImageDraw.Draw(img)
-                
-                # Header zeichnen
-                self._draw_header(draw, game_status)
-                
-                # Grid mit blinkenden Gewinnersymbolen
-                self._draw_animated_grid(draw, board, winning_line, frame)
-                
+            # Blinken der Gewinn-Symbole: in geraden Frames ausgeblendet
+            hidden_cells = winning_line if frame % 2 == 0 else ()
+            with self._compose_frame(board, game_status, hidden_cells) as img:
                 # Gewinnerlinie zeichnen
-                self._draw_winning_line(draw, winning_line)
+                self._draw_winning_line(ImageDraw.Draw(img), winning_line)
                 
-                self.device.display(img)
-                sleep(self.ANIMATION_DELAY)
+                self._push_frame(img)
+            yield frame
+    
+    def _compose_frame(self, board: List[List[str]], status: str, 
+                       hidden_cells=()) -> "Image.Image":
+        """Setzt einen Frame aus vorgerenderten Sprites zusammen"""
+        img = Image.new('1', (self.WIDTH, self.HEIGHT))
+        img.paste(self._header_sprite(status), (0, 0))
+        
+        grid = self._get_grid_sprite()
+        img.paste(grid, (self.grid_x, self.grid_y), grid)
+        
+        for i, row in enumerate(board):
+            for j, cell in enumerate(row):
+                if cell != '*' and (i, j) not in hidden_cells:
+                    sprite = self._symbol_sprite(cell)
+                    position = (self.grid_x + j * self.cell_size, self.grid_y + i * self.cell_size)
+                    # Sprite als Maske: Gitterlinien am Zellrand bleiben erhalten
+                    img.paste(sprite, position, sprite)
+        return img
+    
+    def _header_sprite(self, status: str) -> "Image.Image":
+        """Gibt den gerenderten Header für einen Status zurück (LRU-Cache)"""
+        sprite = self._header_sprites.get(status)
+        if sprite is not None:
+            self._header_sprites.move_to_end(status)
+            return sprite
+        
+        sprite = Image.new('1', (self.WIDTH, self.HEADER_HEIGHT))
+        self._draw_header(ImageDraw.Draw(sprite), status)
+        self._header_sprites[status] = sprite
+        if len(self._header_sprites) > self.HEADER_CACHE_SIZE:
+            self._header_sprites.popitem(last=False)
+        return sprite
+    
+    def _get_grid_sprite(self) -> "Image.Image":
+        """Gibt das gerenderte leere Gitter zurück"""
+        if self._grid_sprite is None:
+            self._grid_sprite = Image.new('1', (self.grid_size + 1, self.grid_size + 1))
+            self._draw_grid_lines(ImageDraw.Draw(self._grid_sprite), 0, 0)
+        return self._grid_sprite
+    
+    def _symbol_sprite(self, symbol: str) -> "Image.Image":
+        """Gibt das gerenderte Symbol in Zellgröße zurück"""
+        sprite = self._symbol_sprites.get(symbol)
+        if sprite is None:
+            sprite = Image.new('1', (self.cell_size, self.cell_size))
+            self._draw_symbol_at_position(ImageDraw.Draw(sprite), symbol, 0, 0, 0, 0)
+            self._symbol_sprites[symbol] = sprite
+        return sprite
     
-    def _draw_header(self, draw: ImageDraw.Draw, status: str) -> None:
+    def _draw_header(self, draw: "ImageDraw.Draw", status: str) -> None:
         """Zeichnet den Header mit Status"""
-        draw.rectangle([(0, 0), (self.WIDTH, 16)], fill=1)
+        draw.rectangle([(0, 0), (self.WIDTH, self.HEADER_HEIGHT - 1)], fill=1)
         self._draw_centered_text(draw, status, 2, self.font_small, fill=0)
     
-    def _draw_centered_text(self, draw: ImageDraw.Draw, text: str, y: int, 
-                          font: ImageFont.ImageFont, fill: int = 1) -> None:
+    def _draw_centered_text(self, draw: "ImageDraw.Draw", text: str, y: int, 
+                          font: "ImageFont.ImageFont", fill: int = 1) -> None:
         """Zeichnet zentrierten Text"""
         text_bbox = draw.textbbox((0, 0), text, font=font)
         text_width = text_bbox[2] - text_bbox[0]
         x = (self.WIDTH - text_width) // 2
         draw.text((x, y), text, font=font, fill=fill)
     
-    def _draw_game_grid(self, draw: ImageDraw.Draw, board: List[List[str]]) -> None:
-        """Zeichnet das Spielfeld"""
-        start_x = (self.WIDTH - self.GRID_SIZE) // 2
-        start_y = 18
-        
-        # Grid-Linien zeichnen
-        self._draw_grid_lines(draw, start_x, start_y)
-        
-        # X und O zeichnen
-        self._draw_game_symbols(draw, board, start_x, start_y)
-    
-    def _draw_animated_grid(self, draw: ImageDraw.Draw, board: List[List[str]], 
-                          winning_line: List[Tuple[int, int]], frame: int) -> None:
-        """Zeichnet das Spielfeld mit Animation"""
-        start_x = (self.WIDTH - self.GRID_SIZE) // 2
-        start_y = 18
-        
-        # Grid-Linien zeichnen
-        self._draw_grid_lines(draw, start_x, start_y)
-        
-        # Symbole mit Blinken für Gewinner zeichnen
-        for i, row in enumerate(board):
-            for j, cell in enumerate(row):
-                if cell != '*':
-                    # Blinken der Gewinn-Symbole
-                    if (i, j) in winning_line and frame % 2 == 0:
-                        continue  # Symbol nicht zeichnen (blinkt)
-                    
-                    self._draw_symbol_at_position(draw, cell, i, j, start_x, start_y)
-    
-    def _draw_grid_lines(self, draw: ImageDraw.Draw, start_x: int, start_y: int) -> None:
+    def _draw_grid_lines(self, draw: "ImageDraw.Draw", start_x: int, start_y: int) -> None:
         """Zeichnet die Gitterlinien"""
-        for i in range(1, 3):
+        for i in range(1, self.board_size):
             # Vertikale Linien
-            x = start_x + i * self.CELL_SIZE
-            draw.line([(x, start_y), (x, start_y + self.GRID_SIZE)], fill=1)
+            x = start_x + i * self.cell_size
+            draw.line([(x, start_y), (x, start_y + self.grid_size)], fill=1)
             
             # Horizontale Linien
-            y = start_y + i * self.CELL_SIZE
-            draw.line([(start_x, y), (start_x + self.GRID_SIZE, y)], fill=1)
-    
-    def _draw_game_symbols(self, draw: ImageDraw.Draw, board: List[List[str]], 
-                         start_x: int, start_y: int) -> None:
-        """Zeichnet alle Spielsymbole"""
-        for i, row in enumerate(board):
-            for j, cell in enumerate(row):
-                if cell != '*':
-                    self._draw_symbol_at_position(draw, cell, i, j, start_x, start_y)
+            y = start_y + i * self.cell_size
+            draw.line([(start_x, y), (start_x + self.grid_size, y)], fill=1)
     
-    def _draw_symbol_at_position(self, draw: ImageDraw.Draw, symbol: str, 
+    def _draw_symbol_at_position(self, draw: "ImageDraw.Draw", symbol: str, 
                                row: int, col: int, start_x: int, start_y: int) -> None:
         """Zeichnet ein Symbol an der angegebenen Position"""
-        cell_x = start_x + col * self.CELL_SIZE
-        cell_y = start_y + row * self.CELL_SIZE
+        cell_x = start_x + col * self.cell_size
+        cell_y = start_y + row * self.cell_size
+        
+        # Kleine Zellen (große Boards): Symbol als Linien statt Text
+        if self.cell_size < self.MIN_TEXT_CELL_SIZE:
+            self._draw_small_symbol(draw, symbol, cell_x, cell_y)
+            return
         
         # Text-Bounding-Box für Zentrierung berechnen
         text_bbox = draw.textbbox((0, 0), symbol, font=self.font_medium)
@@ -179,37 +304,140 @@ class OLEDDisplay:
         text_height = text_bbox[3] - text_bbox[1] 
         
         # Zentriert in der Zelle platzieren
-        x = cell_x + (self.CELL_SIZE - text_width) // 2
-        y = cell_y + (self.CELL_SIZE - text_height) // 2 - text_bbox[1]
+        x = cell_x + (self.cell_size - text_width) // 2
+        y = cell_y + (self.cell_size - text_height) // 2 - text_bbox[1]
         draw.text((x, y), symbol, font=self.font_medium, fill=1)
     
-    def _draw_winning_line(self, draw: ImageDraw.Draw, winning_line: List[Tuple[int, int]]) -> None:
+    def _draw_small_symbol(self, draw: "ImageDraw.Draw", symbol: str, 
+                           cell_x: int, cell_y: int) -> None:
+        """Zeichnet X als Kreuz und O als Kreis innerhalb einer kleinen Zelle"""
+        left, top = cell_x + 1, cell_y + 1
+        right, bottom = cell_x + self.cell_size - 1, cell_y + self.cell_size - 1
+        if symbol == "X":
+            draw.line([(left, top), (right, bottom)], fill=1)
+            draw.line([(left, bottom), (right, top)], fill=1)
+        else:
+            draw.ellipse([(left, top), (right, bottom)], outline=1)
+    
+    def _draw_winning_line(self, draw: "ImageDraw.Draw", winning_line: List[Tuple[int, int]]) -> None:
         """Zeichnet die Gewinnerlinie"""
         if len(winning_line) < 2:
             return
             
-        start_x = (self.WIDTH - self.GRID_SIZE) // 2
-        start_y = 18
+        start_x = self.grid_x
+        start_y = self.grid_y
+        half_cell = self.cell_size // 2
         
         start_pos = winning_line[0]
         end_pos = winning_line[-1]
         
-        start_pixel_x = start_x + start_pos[1] * self.CELL_SIZE + self.CELL_SIZE // 2
-        start_pixel_y = start_y + start_pos[0] * self.CELL_SIZE + self.CELL_SIZE // 2
-        end_pixel_x = start_x + end_pos[1] * self.CELL_SIZE + self.CELL_SIZE // 2
-        end_pixel_y = start_y + end_pos[0] * self.CELL_SIZE + self.CELL_SIZE // 2
+        start_pixel_x = start_x + start_pos[1] * self.cell_size + half_cell
+        start_pixel_y = start_y + start_pos[0] * self.cell_size + half_cell
+        end_pixel_x = start_x + end_pos[1] * self.cell_size + half_cell
+        end_pixel_y = start_y + end_pos[0] * self.cell_size + half_cell
         
         draw.line([(start_pixel_x, start_pixel_y), (end_pixel_x, end_pixel_y)], 
                  fill=1, width=2)
 
 
-def create_display() -> Optional[OLEDDisplay]:
-    """Factory-Funktion für Display-Erstellung"""
+class DisplayWorker:
+    """Rendert auf einem eigenen Thread, damit die Hauptschleife nie blockiert
+    
+    Aufrufe werden als Befehle in eine Queue gestellt. Jeder Befehl zeichnet
+    den kompletten Frame neu, daher zählt nur der jeweils neueste: wartende
+    Befehle werden übersprungen und eine laufende Animation bricht ab,
+    sobald ein neuer Befehl eintrifft.
+    """
+    
+    def __init__(self, display: OLEDDisplay):
+        """Startet den Render-Thread"""
+        self.display = display
+        self._commands: "queue.Queue[tuple]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="display-worker", daemon=True)
+        self._thread.start()
+    
+    def show_welcome(self) -> None:
+        """Zeigt Willkommensnachricht (asynchron)"""
+        self._commands.put(("welcome",))
+    
+    def show_game(self, board: List[List[str]], game_status: str) -> None:
+        """Zeigt das aktuelle Spiel (asynchron)"""
+        self._commands.put(("game", [list(row) for row in board], game_status))
+    
+    def show_game_with_animation(self, board: List[List[str]], 
+                               game_status: str, winning_line: List[Tuple[int, int]]) -> None:
+        """Zeigt das Spiel mit Gewinner-Animation (asynchron)"""
+        self._commands.put(
+            ("animation", [list(row) for row in board], game_status, list(winning_line))
+        )
+    
+    def preload(self) -> threading.Thread:
+        """Lädt Schriftarten und Sprites des Displays im Hintergrund"""
+        return self.display.preload()
+    
+    def wait_idle(self) -> None:
+        """Wartet bis alle gestellten Befehle abgearbeitet (oder übersprungen) sind"""
+        self._commands.join()
+    
+    def close(self) -> None:
+        """Beendet den Render-Thread"""
+        self._commands.put(("stop",))
+        self._thread.join()
+    
+    def _latest(self, command: tuple) -> tuple:
+        """Überspringt veraltete Befehle in der Queue"""
+        while command[0] != "stop":
+            try:
+                newer = self._commands.get_nowait()
+            except queue.Empty:
+                return command
+            self._commands.task_done()
+            command = newer
+        return command
+    
+    def _run(self) -> None:
+        """Render-Schleife"""
+        command = self._commands.get()
+        while True:
+            command = self._latest(command)
+            if command[0] == "stop":
+                self._commands.task_done()
+                return
+            
+            try:
+                interrupt = self._execute(command)
+            except Exception as e:
+                print(f"Fehler im Display-Thread: {e}")
+                interrupt = None
+            self._commands.task_done()
+            command = interrupt if interrupt is not None else self._commands.get()
+    
+    def _execute(self, command: tuple) -> Optional[tuple]:
+        """Führt einen Befehl aus; gibt einen unterbrechenden Befehl zurück"""
+        kind = command[0]
+        if kind == "welcome":
+            self.display.show_welcome()
+        elif kind == "game":
+            self.display.show_game(command[1], command[2])
+        elif kind == "animation":
+            _, board, game_status, winning_line = command
+            self.display.show_game(board, game_status)
+            for _ in self.display.animation_frames(board, game_status, winning_line):
+                try:
+                    return self._commands.get(timeout=self.display.ANIMATION_DELAY)
+                except queue.Empty:
+                    continue
+        return None
+
+
+def create_display(board_size: int = 3, threaded: bool = False):
+    """Factory-Funktion für Display-Erstellung (threaded: Rendern im DisplayWorker)"""
     if not OLED_AVAILABLE:
         return None
         
     try:
-        return OLEDDisplay()
+        display = OLEDDisplay(board_size=board_size)
+        return DisplayWorker(display) if threaded else display
     except Exception as e:
         print(f"Fehler beim Erstellen des OLED Displays: {e}")
         return None
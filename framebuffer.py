@@ -0,0 +1,97 @@
+"""
+Framebuffer Module für Tic-Tac-Toe
+Gespeichertes SSD1306-Abbild: sendet nur geänderte Pages/Spalten über I2C
+"""
+
+from typing import List, Optional, Tuple
+
+
+# SSD1306 Befehle (horizontaler Adressierungsmodus, von luma bei Init gesetzt)
+SET_COLUMN_ADDRESS = 0x21
+SET_PAGE_ADDRESS = 0x22
+
+PAGE_HEIGHT = 8
+
+# Verteilt die 8 Pixel eines Zeilen-Bytes (MSB = linkes Pixel) auf die
+# niederwertigsten Bits von 8 aufeinanderfolgenden Bytes
+_SPREAD = tuple(
+    sum(((value >> (7 - k)) & 1) << (8 * k) for k in range(8))
+    for value in range(256)
+)
+
+# Ein geänderter Bereich: (Page, erste Spalte, letzte Spalte)
+DirtyRegion = Tuple[int, int, int]
+
+
+def rows_to_pages(row_bytes: bytes, width: int, height: int) -> bytearray:
+    """Wandelt ein zeilenweise gepacktes 1-Bit Bild (PIL Modus '1') ins SSD1306 Page-Format
+
+    Im Page-Format steht pro Spalte und Page ein Byte, Bit n = Pixelzeile page * 8 + n.
+    """
+    stride = width // 8
+    pages = bytearray(width * height // PAGE_HEIGHT)
+    for page in range(height // PAGE_HEIGHT):
+        row_offset = page * PAGE_HEIGHT * stride
+        page_offset = page * width
+        for column_byte in range(stride):
+            value = 0
+            for bit in range(PAGE_HEIGHT):
+                value |= _SPREAD[row_bytes[row_offset + bit * stride + column_byte]] << bit
+            start = page_offset + column_byte * 8
+            pages[start:start + 8] = value.to_bytes(8, "little")
+    return pages
+
+
+class FrameBuffer:
+    """Merkt sich den zuletzt gesendeten Frame und berechnet geänderte Bereiche"""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.pages: Optional[bytearray] = None
+
+    def invalidate(self) -> None:
+        """Erzwingt beim nächsten Frame eine vollständige Übertragung"""
+        self.pages = None
+
+    def diff(self, new_pages: bytearray) -> Optional[List[DirtyRegion]]:
+        """Vergleicht mit dem gespeicherten Frame und übernimmt den neuen
+
+        Gibt None zurück, wenn noch kein Frame gesendet wurde (Vollbild nötig),
+        sonst die Liste der geänderten Spaltenbereiche pro Page.
+        """
+        old_pages = self.pages
+        self.pages = new_pages
+        if old_pages is None:
+            return None
+
+        regions = []
+        for page in range(self.height // PAGE_HEIGHT):
+            start = page * self.width
+            end = start + self.width
+            if old_pages[start:end] == new_pages[start:end]:
+                continue
+
+            first = start
+            while old_pages[first] == new_pages[first]:
+                first += 1
+            last = end - 1
+            while old_pages[last] == new_pages[last]:
+                last -= 1
+            regions.append((page, first - start, last - start))
+        return regions
+
+    def region_data(self, region: DirtyRegion) -> bytearray:
+        """Gibt die Page-Bytes eines Bereichs aus dem aktuellen Frame zurück"""
+        page, first, last = region
+        start = page * self.width
+        return self.pages[start + first:start + last + 1]
+
+
+def push_regions(device, framebuffer: FrameBuffer, regions: List[DirtyRegion]) -> None:
+    """Sendet die geänderten Bereiche als Adressfenster + Daten an das SSD1306"""
+    for region in regions:
+        page, first, last = region
+        device.command(SET_COLUMN_ADDRESS, first, last)
+        device.command(SET_PAGE_ADDRESS, page, page)
+        device.data(list(framebuffer.region_data(region)))
@@ -3,12 +3,15 @@ Spielmodul für Tic-Tac-Toe
 Hauptkoordinator-Klasse für das gesamte Spiel
 """
 
-from typing import Optional
-from time import sleep
+from typing import List, Optional, Tuple
+from time import monotonic
 
 from game_logic import GameLogic
+from computer_player import MovePolicy, create_move_policy
 from display import create_display, OLEDDisplay
 from keypad_input import KeypadInput, InputAction
+from search_defaults import DEFAULT_TIME_BUDGET_MS
+import latency
 
 
 class TicTacToeGame:
@@ -17,12 +20,39 @@ class TicTacToeGame:
     WELCOME_DELAY = 2.0
     MAIN_LOOP_DELAY = 0.1
     
-    def __init__(self):
-        """Initialisiert das Spiel mit allen Komponenten"""
-        self.game_logic = GameLogic()
-        self.display = create_display()
-        self.keypad = KeypadInput()
+    def __init__(self, move_policy: MovePolicy = MovePolicy.RANDOM, difficulty: float = 1.0,
+                 board_size: int = 3, win_length: Optional[int] = None,
+                 edge_triggered_keypad: bool = False, keypad=None, display=None,
+                 recorder=None, time_budget_ms: float = DEFAULT_TIME_BUDGET_MS,
+                 search_workers: int = 1, state_file=None):
+        """Initialisiert das Spiel mit allen Komponenten
+        
+        keypad und display ersetzen die Hardware-Backends, z.B. durch
+        ScriptedKeypad und RecordingDisplay aus virtual_devices.
+        recorder (game_record.GameRecorder) speichert alle gespielten Partien.
+        time_budget_ms und search_workers gelten für die MCTS-Strategie.
+        state_file (state_file.StateFile) sichert den Spielstand regelmäßig;
+        start() setzt die dort gespeicherte Partie fort.
+        
+        Das Display wird zuerst geöffnet und zeigt sofort den vorgerenderten
+        Willkommensbildschirm; Schriftarten laden im Hintergrund, während
+        Keypad und Computer-Gegner initialisiert werden.
+        """
+        self.display = display if display is not None else create_display(board_size, threaded=True)
+        self._welcome_shown_at: Optional[float] = None
+        if self.display:
+            self.display.show_welcome()
+            self._welcome_shown_at = monotonic()
+            if hasattr(self.display, 'preload'):
+                self.display.preload()
+        
+        self.game_logic = GameLogic(board_size, win_length, recorder)
+        self.computer = create_move_policy(move_policy, difficulty, board_size,
+                                           time_budget_ms, search_workers, win_length)
+        self.keypad = keypad if keypad is not None else KeypadInput(edge_triggered=edge_triggered_keypad)
+        self.state_file = state_file
         self.running = False  
+        self._page = 0
     
     
     def _handle_game_move(self, row: int, col: int) -> None:
@@ -31,19 +61,42 @@ class TicTacToeGame:
             return
         
         if self.game_logic.make_move(row, col):
+            if latency.tracer is not None:
+                latency.tracer.mark("move")
             self._update_display()
     
     def _handle_reset_game(self) -> None:
         """Behandelt Spiel-Reset"""
         self.game_logic.reset_game()
+        self._reset_computer()
+        self._page = 0
         self._update_display()
     
+    def _page_origins(self) -> List[Tuple[int, int]]:
+        """Linke obere Ecken der 3×3 Fenster, die das Keypad adressieren kann
+        
+        Die letzte Reihe und Spalte wird an den Rand geschoben, damit jedes
+        Fenster vollständig auf dem Brett liegt (bei 4×4 überlappen sie).
+        """
+        size = self.game_logic.size
+        starts = sorted({min(i, max(size - 3, 0)) for i in range(0, size, 3)})
+        return [(row, col) for row in starts for col in starts]
+    
+    def _handle_next_page(self) -> None:
+        """Schiebt das Keypad-Fenster zum nächsten 3×3 Ausschnitt (nur N > 3)"""
+        pages = len(self._page_origins())
+        if pages > 1:
+            self._page = (self._page + 1) % pages
+            self._update_display()
+    
     def _handle_random_move(self) -> None:
-        """Behandelt zufällige Züge"""
+        """Behandelt Computer-Züge (Strategie je nach move_policy)"""
         if self.game_logic.game_over:
             return
 
-        if self.game_logic.make_random_move():
+        if self.computer.make_move(self.game_logic):
+            if latency.tracer is not None:
+                latency.tracer.mark("move")
             self._update_display()
     
     def _handle_exit_program(self) -> None:
@@ -56,7 +109,7 @@ class TicTacToeGame:
             self._print_console_board()
             return
         
-        status = self.game_logic.get_status_message()
+        status = self._status_message()
         
         if self.game_logic.winner and self.game_logic.winning_line:
             self.display.show_game_with_animation(
@@ -70,38 +123,66 @@ class TicTacToeGame:
                 status
             )
     
+    def _status_message(self) -> str:
+        """Statusnachricht, bei großen Boards mit dem aktiven Keypad-Fenster"""
+        status = self.game_logic.get_status_message()
+        pages = len(self._page_origins())
+        if pages > 1 and not self.game_logic.game_over:
+            status = f"{status} {self._page + 1}/{pages}"
+        return status
+    
     def _print_console_board(self) -> None:
         """Fallback: Ausgabe auf der Konsole"""
         print("\n" + "="*30)
-        print(f"Status: {self.game_logic.get_status_message()}")
+        print(f"Status: {self._status_message()}")
         print("Current board:")
         for row in self.game_logic.board:
             print(" | ".join(cell if cell != "*" else " " for cell in row))
-            print("-" * 9)
+            print("-" * (4 * self.game_logic.size - 3))
         print("="*30)
     
     def _show_welcome_screen(self) -> None:
-        """Zeigt den Willkommensbildschirm"""
+        """Zeigt den Willkommensbildschirm bis WELCOME_DELAY abläuft oder eine Taste kommt"""
+        self._ensure_welcome_shown()
+        
+        deadline = self._welcome_shown_at + self.WELCOME_DELAY
+        while self.running:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            # Die erste Taste schließt nur den Willkommensbildschirm
+            if self.keypad.wait_for_input(min(remaining, self.MAIN_LOOP_DELAY)):
+                break
+        
+        self._update_display()
+    
+    def _ensure_welcome_shown(self) -> None:
+        """Zeigt den Willkommensbildschirm, falls er nicht schon beim Start kam"""
+        if self._welcome_shown_at is not None:
+            return
         if self.display:
             self.display.show_welcome()
         else:
-            print("="*40)
-            print("      Welcome to Tic-Tac-Toe!")
-            print("="*40)
-            print("Spiel-Steuerung:")
-            print("- Reihe 0-2, Spalte 0-2: Spielzug")
-            print("- Reihe 3, Spalte 0: Reset")
-            print("- Reihe 3, Spalte 2: Zufälliger Zug")
-            print("- Reihe 3, Spalte 3: Beenden")
-            print("="*40)
-        
-        sleep(self.WELCOME_DELAY)
-        self._update_display()
+            self._print_welcome()
+        self._welcome_shown_at = monotonic()
+    
+    def _print_welcome(self) -> None:
+        """Gibt den Willkommenstext in der Konsole aus"""
+        print("="*40)
+        print("      Welcome to Tic-Tac-Toe!")
+        print("="*40)
+        print("Spiel-Steuerung:")
+        print("- Reihe 0-2, Spalte 0-2: Spielzug")
+        print("- Reihe 3, Spalte 0: Reset")
+        print("- Reihe 3, Spalte 2: Zufälliger Zug")
+        print("- Reihe 3, Spalte 3: Beenden")
+        print("="*40)
     
     def start(self) -> None:
         """Startet das Hauptspiel"""
         self.running = True
         try:
+            self._resume_state()
             self._show_welcome_screen()
             self._run_main_loop()
         except KeyboardInterrupt:
@@ -111,27 +192,68 @@ class TicTacToeGame:
         finally:
             self.cleanup()
     
+    def _resume_state(self) -> None:
+        """Setzt die zuletzt gespeicherte Partie fort (falls vorhanden und passend)"""
+        if self.state_file is None:
+            return
+        snapshot = self.state_file.load()
+        if snapshot is None:
+            return
+        try:
+            self.game_logic.restore(snapshot)
+        except ValueError as e:
+            print(f"Gespeicherter Spielstand wird ignoriert: {e}")
+            return
+        self._reset_computer()
+        print("Letzte Partie wird fortgesetzt.")
+    
+    def _reset_computer(self) -> None:
+        """Verwirft Suchzustand des Computers, der zur vorherigen Partie gehört"""
+        if hasattr(self.computer, 'reset'):
+            self.computer.reset()
+    
+    def _save_state(self, force: bool = False) -> None:
+        """Sichert den Spielstand (StateFile begrenzt die Schreibzugriffe)"""
+        if self.state_file is not None:
+            self.state_file.save(self.game_logic.snapshot(), force)
+    
+    def _flush_recorder(self) -> None:
+        """Schreibt fällige Records des Partie-Logs auf den Datenträger"""
+        recorder = self.game_logic.recorder
+        if hasattr(recorder, 'flush_if_due'):
+            recorder.flush_if_due()
+    
+    def _handle_key(self, key) -> None:
+        """Mapped eine Taste und ruft den passenden Handler auf"""
+        action, data = self.keypad.map_key_to_action(key)
+        if latency.tracer is not None:
+            latency.tracer.mark("map")
+        self._dispatch_action(action, data)
+    
+    def _dispatch_action(self, action: InputAction, data) -> None:
+        """Ruft den Event-Handler für eine Aktion auf"""
+        if action == InputAction.GAME_MOVE and data:
+            row, col = self._page_origins()[self._page]
+            self._handle_game_move(row + data[0], col + data[1])
+        elif action == InputAction.RESET_GAME:
+            self._handle_reset_game()
+        elif action == InputAction.RANDOM_MOVE:
+            self._handle_random_move()
+        elif action == InputAction.NEXT_PAGE:
+            self._handle_next_page()
+        elif action == InputAction.EXIT_PROGRAM:
+            self._handle_exit_program()
+    
     def _run_main_loop(self) -> None:
         """Hauptspiel-Schleife"""
         while self.running:
             try:
-                # Input verarbeiten
-                key = self.keypad.get_input_with_debounce()
+                # Input verarbeiten (wartet höchstens MAIN_LOOP_DELAY auf eine Taste)
+                key = self.keypad.wait_for_input(self.MAIN_LOOP_DELAY)
                 if key:
-                    action, data = self.keypad.map_key_to_action(key)
-                    
-                    # Event-Handler aufrufen
-                    if action == InputAction.GAME_MOVE and data:
-                        self._handle_game_move(data[0], data[1])
-                    elif action == InputAction.RESET_GAME:
-                        self._handle_reset_game()
-                    elif action == InputAction.RANDOM_MOVE:
-                        self._handle_random_move()
-                    elif action == InputAction.EXIT_PROGRAM:
-                        self._handle_exit_program()
-                
-                # Kurze Pause um CPU zu schonen
-                sleep(self.MAIN_LOOP_DELAY)
+                    self._handle_key(key)
+                self._save_state()
+                self._flush_recorder()
                 
             except Exception as e:
                 print(f"Fehler in der Hauptschleife: {e}")
@@ -141,6 +263,19 @@ class TicTacToeGame:
         """Räumt Ressourcen auf"""
         if hasattr(self, 'keypad'):
             self.keypad.cleanup()
+        if hasattr(getattr(self, 'computer', None), 'close'):
+            self.computer.close()
+        if getattr(self, 'state_file', None) is not None:
+            self._save_state(force=True)
+            self.state_file.close()
+        recorder = getattr(getattr(self, 'game_logic', None), 'recorder', None)
+        if recorder is not None:
+            # Laufende Partie als abgebrochen speichern, danach Log schließen
+            self.game_logic.reset_game()
+            self.game_logic.recorder = None
+            recorder.close()
+        if getattr(self, 'display', None) and hasattr(self.display, 'close'):
+            self.display.close()
         print("Spiel beendet. Auf Wiedersehen!")
 
 
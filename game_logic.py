@@ -3,21 +3,152 @@ Game Logic Module für Tic-Tac-Toe
 Handhabt Spielzustand, Regeln und Gewinnprüfung
 """
 
-from typing import List, Optional, Tuple
+from array import array
+from typing import List, Optional, Sequence, Tuple
 import random
+import struct
+
+from bitboard import BitBoard, BoardGeometry, SYMBOLS, get_geometry
+
+
+# Kein Gewinner: Index für winning_line
+NO_LINE = -1
+
+# Snapshot: [Board-Größe, Gewinnlänge, Spieler am Zug, Status, Index der Gewinnlinie],
+# danach die Bitmasken von X und O mit je (Felder + 7) // 8 Bytes (little-endian)
+SNAPSHOT_HEADER = struct.Struct("<BBBBh")
+
+# Status im Snapshot
+STATUS_RUNNING = 0
+STATUS_WIN_X = 1
+STATUS_WIN_O = 2
+STATUS_DRAW = 3
+
+
+def snapshot_size(size: int) -> int:
+    """Länge eines Snapshots in Bytes für ein N×N Board (10 Bytes bei 3×3)"""
+    return SNAPSHOT_HEADER.size + 2 * ((size * size + 7) // 8)
+
+
+class _BoardRow(list):
+    """Reihe der Kompatibilitäts-Ansicht, schreibt Änderungen ins Bitboard durch"""
+
+    def __init__(self, cells: List[str], bitboard: BitBoard, row: int):
+        super().__init__(cells)
+        self._bitboard = bitboard
+        self._row = row
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return super().__getitem__(col)
+        col = range(len(self))[col]
+        return self._bitboard.symbol_at(self._bitboard.index(self._row, col))
+
+    def __setitem__(self, col, symbol) -> None:
+        if isinstance(col, slice):
+            raise TypeError("Board-Reihen unterstützen keine Slice-Zuweisung")
+        # Wie bei list: negative Spalten zählen vom Ende, sonst IndexError
+        col = range(len(self))[col]
+        super().__setitem__(col, symbol)
+        self._bitboard.set_symbol(self._bitboard.index(self._row, col), symbol)
 
 
 class GameLogic:
-    def __init__(self):
+    """Spielzustand mit festen Slots
+    
+    Pro Instanz bleiben das Bitboard (zwei Integer und Linienzähler als array),
+    die Züge als Feldindizes in einem kompakten array und der Index der
+    Gewinnlinie. Linien und Masken
+    liegen in der geteilten BoardGeometry; winning_line gibt das Tupel aus
+    dieser Tabelle zurück statt pro Partie eine Liste anzulegen.
+    """
+    
+    __slots__ = ("_geometry", "_bitboard", "_board_view", "_move_stack", "_winning_line",
+                 "current_player", "game_over", "winner", "recorder")
+    
+    def __init__(self, size: int = 3, win_length: Optional[int] = None, recorder=None):
+        """Initialisiert ein N×N Spiel mit K-in-einer-Reihe (Standard: 3×3, drei in einer Reihe)
+        
+        Ein recorder (z.B. game_record.GameRecorder) wird bei jedem Zug und
+        jedem Reset benachrichtigt und speichert die Partien.
+        """
+        self._geometry = get_geometry(size, win_length)
+        self._bitboard = BitBoard(self._geometry)
+        self._move_stack = array("H")  # Feldindizes in Zugreihenfolge
+        self.recorder = None
         self.reset_game()
+        self.recorder = recorder
     
     def reset_game(self) -> None:
         """Setzt das Spiel zurück"""
-        self.board = [["*" for _ in range(3)] for _ in range(3)]
+        if self.recorder is not None:
+            self.recorder.on_reset(self)
+        self._bitboard.clear()
+        self._board_view = None
+        del self._move_stack[:]
         self.current_player = 0  # 0 = X, 1 = O
         self.game_over = False
         self.winner = None
-        self.winning_line = []
+        self._winning_line = NO_LINE
+    
+    @property
+    def board(self) -> List[List[str]]:
+        """Board als Liste von Listen (wird bei Bedarf aus dem Bitboard erzeugt)"""
+        if self._board_view is None:
+            self._board_view = [
+                _BoardRow(cells, self._bitboard, i)
+                for i, cells in enumerate(self._bitboard.to_rows())
+            ]
+        return self._board_view
+    
+    @board.setter
+    def board(self, rows: List[List[str]]) -> None:
+        """Lädt das Board aus einer Liste von Listen"""
+        self._bitboard.load_rows(rows)
+        self._board_view = None
+    
+    @property
+    def winning_line(self) -> Tuple[Tuple[int, int], ...]:
+        """Felder der Gewinnlinie (geteiltes Tupel der Geometrie, leer ohne Gewinner)"""
+        if self._winning_line == NO_LINE:
+            return ()
+        return self._geometry.lines[self._winning_line]
+    
+    @winning_line.setter
+    def winning_line(self, line: Sequence[Tuple[int, int]]) -> None:
+        """Setzt die Gewinnlinie (muss eine Linie der Geometrie sein)"""
+        self._winning_line = self._geometry.lines.index(tuple(line)) if line else NO_LINE
+    
+    @property
+    def geometry(self) -> BoardGeometry:
+        """Geteilte Geometrie des Boards (Linien und Masken)"""
+        return self._geometry
+    
+    @property
+    def bits(self) -> Tuple[int, int]:
+        """Bitmasken von X und O"""
+        bits = self._bitboard.bits
+        return bits[0], bits[1]
+    
+    @property
+    def moves(self) -> Tuple[int, ...]:
+        """Feldindizes der bisherigen Züge in Zugreihenfolge"""
+        return tuple(self._move_stack)
+    
+    @property
+    def size(self) -> int:
+        """Kantenlänge des Boards"""
+        return self._geometry.size
+    
+    @property
+    def win_length(self) -> int:
+        """Anzahl Symbole in einer Reihe für einen Gewinn"""
+        return self._geometry.win_length
+    
+    @property
+    def position_key(self) -> int:
+        """Eindeutiger Integer-Schlüssel der aktuellen Stellung"""
+        return self._bitboard.key()
     
     @property
     def current_player_symbol(self) -> str:
@@ -28,32 +159,125 @@ class GameLogic:
         """Prüft ob ein Zug gültig ist"""
         if self.game_over:
             return False
-        if row < 0 or row >= 3 or col < 0 or col >= 3:
+        if row < 0 or row >= self.size or col < 0 or col >= self.size:
             return False
-        return self.board[row][col] == "*"
+        return self._bitboard.is_empty(self._bitboard.index(row, col))
     
     def make_move(self, row: int, col: int) -> bool :
         """Führt einen Zug aus und prüft auf Gewinn"""
         if not self.is_valid_move(row, col):
             return False 
         
-        self.board[row][col] = self.current_player_symbol
+        index = self._bitboard.index(row, col)
+        self._move_stack.append(index)
+        completed_line = self._bitboard.place(index, self.current_player)
+        self._board_view = None
         
-        # Prüfe auf Gewinn
-        self.winner = self._check_winner()
-        if self.winner:
+        # Prüfe auf Gewinn (nur Linien durch das gesetzte Feld)
+        if completed_line is not None:
+            self._winning_line = completed_line
+            self.winner = self.current_player_symbol
             self.game_over = True
-            return True 
-        
         # Prüfe auf Unentschieden
-        if self._is_board_full():
+        elif self._is_board_full():
             self.game_over = True
-            return True 
-        
         # Wechsel Spieler
-        self.current_player = 1 - self.current_player
+        else:
+            self.current_player = 1 - self.current_player
+        
+        if self.recorder is not None:
+            self.recorder.on_move(self)
+        return True
+    
+    def unmake_move(self) -> bool:
+        """Nimmt den letzten Zug zurück (für Suche ohne Board-Kopien)
+        
+        Züge sind nur in laufenden Partien möglich, vorher war die Partie also
+        offen. Nach Gewinn oder Unentschieden wurde nicht gewechselt, sonst ist
+        der Ziehende der Gegner des Spielers am Zug.
+        """
+        if not self._move_stack:
+            return False
+        
+        self._bitboard.remove(self._move_stack.pop())
+        self._board_view = None
+        if not self.game_over:
+            self.current_player = 1 - self.current_player
+        self.game_over = False
+        self.winner = None
+        self._winning_line = NO_LINE
         return True
     
+    def snapshot(self) -> bytes:
+        """Stellung als Byte-String fester Länge (siehe snapshot_size)
+        
+        Enthält Board, Spieler am Zug, Status und Gewinnlinie, aber nicht die
+        Zugreihenfolge: nach restore() gibt es nichts zurückzunehmen.
+        """
+        if self.winner is not None:
+            status = STATUS_WIN_X if self.winner == SYMBOLS[0] else STATUS_WIN_O
+        elif self.game_over:
+            status = STATUS_DRAW
+        else:
+            status = STATUS_RUNNING
+        geometry = self._geometry
+        length = (geometry.cell_count + 7) // 8
+        bits = self._bitboard.bits
+        return (SNAPSHOT_HEADER.pack(geometry.size, geometry.win_length, self.current_player,
+                                     status, self._winning_line)
+                + bits[0].to_bytes(length, "little") + bits[1].to_bytes(length, "little"))
+    
+    def restore(self, data: bytes) -> None:
+        """Lädt eine mit snapshot() gespeicherte Stellung
+        
+        Der Snapshot muss zur Board-Geometrie dieses Spiels passen, sonst
+        ValueError. Ein angebundener recorder speichert die bisherige Partie
+        wie bei einem Reset.
+        """
+        geometry = self._geometry
+        if len(data) != snapshot_size(geometry.size):
+            raise ValueError("Snapshot hat die falsche Länge")
+        size, win_length, player, status, line = SNAPSHOT_HEADER.unpack_from(data)
+        if (size, win_length) != (geometry.size, geometry.win_length):
+            raise ValueError("Snapshot gehört zu einem anderen Board")
+        
+        length = (geometry.cell_count + 7) // 8
+        offset = SNAPSHOT_HEADER.size
+        bits_x = int.from_bytes(data[offset:offset + length], "little")
+        bits_o = int.from_bytes(data[offset + length:], "little")
+        if (player > 1 or status > STATUS_DRAW or bits_x & bits_o
+                or (bits_x | bits_o) & ~geometry.full_mask
+                or not NO_LINE <= line < len(geometry.lines)
+                or (line == NO_LINE) != (status in (STATUS_RUNNING, STATUS_DRAW))):
+            raise ValueError("Ungültiger Snapshot")
+        if line != NO_LINE:
+            winner_bits = bits_x if status == STATUS_WIN_X else bits_o
+            mask = geometry.masks[line]
+            if winner_bits & mask != mask:
+                raise ValueError("Gewinnlinie gehört nicht dem Gewinner")
+        
+        self.reset_game()
+        self._bitboard.load_bits(bits_x, bits_o)
+        self.current_player = player
+        self.game_over = status != STATUS_RUNNING
+        self.winner = SYMBOLS[status - 1] if status in (STATUS_WIN_X, STATUS_WIN_O) else None
+        self._winning_line = line
+    
+    @classmethod
+    def from_snapshot(cls, data: bytes, recorder=None) -> "GameLogic":
+        """Neues Spiel aus einem Snapshot (Geometrie aus dem Snapshot-Header)"""
+        if len(data) < SNAPSHOT_HEADER.size:
+            raise ValueError("Snapshot hat die falsche Länge")
+        size, win_length = SNAPSHOT_HEADER.unpack_from(data)[:2]
+        game = cls(size, win_length, recorder)
+        game.restore(data)
+        return game
+    
+    @property
+    def move_history(self) -> List[Tuple[int, int]]:
+        """Gibt die bisherigen Züge als (Reihe, Spalte) zurück"""
+        return [divmod(index, self.size) for index in self._move_stack]
+    
     def make_random_move(self) -> bool :
         """Macht einen zufälligen Zug für den aktuellen Spieler"""
         if self.game_over:
@@ -66,46 +290,28 @@ class GameLogic:
         row, col = random.choice(empty_positions)
         return self.make_move(row, col)
     
+    @property
+    def empty_positions(self) -> List[Tuple[int, int]]:
+        """Alle leeren Positionen als (Reihe, Spalte)"""
+        return [divmod(index, self.size) for index in self._bitboard.empty_indices()]
+    
     def _get_empty_positions(self) -> List[Tuple[int, int]]:
         """Gibt alle leeren Positionen zurück"""
-        empty_positions = []
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == "*":
-                    empty_positions.append((i, j))
-        return empty_positions
+        return self.empty_positions
     
     def _check_winner(self) -> Optional[str]:
         """Prüft auf Gewinner und setzt winning_line"""
-        # Prüfe Reihen
-        for i in range(3):
-            if self.board[i][0] == self.board[i][1] == self.board[i][2] != "*":
-                self.winning_line = [(i, 0), (i, 1), (i, 2)]
-                return self.board[i][0]
-        
-        # Prüfe Spalten
-        for j in range(3):
-            if self.board[0][j] == self.board[1][j] == self.board[2][j] != "*":
-                self.winning_line = [(0, j), (1, j), (2, j)]
-                return self.board[0][j]
-        
-        # Prüfe Diagonalen
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != "*":
-            self.winning_line = [(0, 0), (1, 1), (2, 2)]
-            return self.board[0][0]
-        
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != "*":
-            self.winning_line = [(0, 2), (1, 1), (2, 0)]
-            return self.board[0][2]
+        for player in (0, 1):
+            line_index = self._bitboard.find_win(player)
+            if line_index is not None:
+                self._winning_line = line_index
+                return SYMBOLS[player]
         
         return None
     
     def _is_board_full(self) -> bool:
         """Prüft ob das Board voll ist"""
-        for row in self.board:
-            if "*" in row:
-                return False
-        return True
+        return self._bitboard.is_full()
     
     def get_status_message(self) -> str:
         """Gibt die aktuelle Statusnachricht zurück"""
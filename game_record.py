@@ -0,0 +1,233 @@
+"""
+Partie-Aufzeichnung für Tic-Tac-Toe
+Append-only Log mit festen, kompakten Binär-Records und Replay über mmap
+"""
+
+from time import monotonic, time
+from typing import Iterator, NamedTuple, Optional, Tuple
+import mmap
+import os
+import struct
+
+from bitboard import get_geometry
+from game_logic import GameLogic
+
+
+# Dateiformat: Header (Magic, Board-Größe, Gewinnlänge), danach Records fester Länge:
+# [Startzeit (Unix-Sekunden), Dauer (Sekunden), Ergebnis, Anzahl Züge] + Züge als
+# 4-Bit Feldindizes (erstes Feld im unteren Nibble)
+MAGIC = b"TTG1"
+HEADER = struct.Struct("<4sBB2x")
+RECORD_HEADER = struct.Struct("<IHBB")
+MAX_CELLS = 16
+MAX_DURATION = 0xFFFF
+
+# Ergebnis eines Records
+RESULT_UNFINISHED = 0
+RESULT_X = 1
+RESULT_O = 2
+RESULT_DRAW = 3
+
+# Vorberechnete Nibble-Paare pro Byte für schnelles Entpacken
+_NIBBLES = tuple((value & 0x0F, value >> 4) for value in range(256))
+
+
+def record_size(size: int) -> int:
+    """Länge eines Records in Bytes für ein N×N Board"""
+    return RECORD_HEADER.size + (size * size + 1) // 2
+
+
+def pack_moves(moves: Tuple[int, ...], cell_count: int) -> bytes:
+    """Packt Feldindizes als 4-Bit Nibbles (aufgefüllt auf alle Felder)"""
+    packed = bytearray((cell_count + 1) // 2)
+    for position, cell in enumerate(moves):
+        packed[position >> 1] |= cell << (4 * (position & 1))
+    return bytes(packed)
+
+
+class GameRecord(NamedTuple):
+    """Eine aufgezeichnete Partie"""
+    started: int                # Unix-Zeit des ersten Zugs
+    duration: int               # Sekunden bis Spielende bzw. Reset
+    result: int                 # RESULT_*
+    moves: Tuple[int, ...]      # Feldindizes in Zugreihenfolge
+
+
+def _check_geometry(size: int, win_length: int) -> None:
+    """Prüft ob Züge eines Boards in 4 Bit passen"""
+    if size * size > MAX_CELLS:
+        raise ValueError("Aufzeichnung unterstützt Boards mit höchstens 16 Feldern")
+    get_geometry(size, win_length)
+
+
+def _read_header(path: str) -> Optional[Tuple[int, int]]:
+    """Liest (Größe, Gewinnlänge) aus dem Header; None bei leerer Datei
+
+    Ein abgerissener Header (Stromausfall beim ersten Schreiben) zählt als
+    leere Datei, solange die vorhandenen Bytes zum Magic passen.
+    """
+    with open(path, "rb") as log_file:
+        data = log_file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        if data[:len(MAGIC)] == MAGIC[:len(data)]:
+            return None
+        raise ValueError(f"Ungültiges Partie-Log: {path}")
+    magic, size, win_length = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError(f"Ungültiges Partie-Log: {path}")
+    return size, win_length
+
+
+class GameRecorder:
+    """Hängt beendete (oder per Reset abgebrochene) Partien an ein Log an
+
+    Wird über GameLogic(recorder=...) angebunden. Aufgezeichnet werden nur
+    Partien, die auf dem leeren Board begonnen haben (nicht z.B. nach
+    GameLogic.restore), damit sich jeder Record nachspielen lässt.
+    Schreibzugriffe sind gepuffert; fsync erfolgt gesammelt nach sync_every
+    Records oder sync_interval Sekunden und beim Schließen. Damit der letzte
+    Record einer Sitzung nicht im Puffer liegen bleibt, ruft die Hauptschleife
+    regelmäßig flush_if_due() auf. Ein nach einem Absturz unvollständiger
+    letzter Record wird beim Öffnen abgeschnitten, ein abgerissener Header neu
+    geschrieben.
+    """
+
+    def __init__(self, path: str, size: int = 3, win_length: Optional[int] = None,
+                 sync_every: int = 32, sync_interval: float = 5.0):
+        win_length = size if win_length is None else win_length
+        _check_geometry(size, win_length)
+
+        self.path = path
+        self.size = size
+        self.cell_count = size * size
+        self.record_size = record_size(size)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        header = _read_header(path) if os.path.exists(path) else None
+        if header is not None and header != (size, win_length):
+            raise ValueError(f"Partie-Log {path} gehört zu einem anderen Board")
+
+        self._file = open(path, "ab", buffering=64 * 1024)
+        if header is None:
+            self._file.truncate(0)
+            self._file.write(HEADER.pack(MAGIC, size, win_length))
+        else:
+            # Unvollständigen Record am Ende (Absturz beim Schreiben) abschneiden
+            body = os.path.getsize(path) - HEADER.size
+            self._file.truncate(HEADER.size + body - body % self.record_size)
+
+        self._unsynced = 0
+        self._last_sync = monotonic()
+        self._started: Optional[float] = None
+
+    def on_move(self, game: GameLogic) -> None:
+        """Hook aus GameLogic.make_move"""
+        if len(game.moves) == 1:
+            # Nur Partien ab dem leeren Board (genau ein besetztes Feld)
+            bits_x, bits_o = game.bits
+            self._started = time() if bin(bits_x | bits_o).count("1") == 1 else None
+        if game.game_over and self._started is not None:
+            self.write(game)
+
+    def on_reset(self, game: GameLogic) -> None:
+        """Hook aus GameLogic.reset_game: laufende Partie als abgebrochen speichern"""
+        if game.moves and not game.game_over and self._started is not None:
+            self.write(game)
+        self._started = None
+
+    def write(self, game: GameLogic) -> None:
+        """Schreibt den aktuellen Stand der Partie als Record"""
+        if game.winner is not None:
+            result = RESULT_X if game.winner == "X" else RESULT_O
+        elif game.game_over:
+            result = RESULT_DRAW
+        else:
+            result = RESULT_UNFINISHED
+
+        now = time()
+        started = self._started if self._started is not None else now
+        moves = game.moves
+        self._file.write(
+            RECORD_HEADER.pack(int(started), min(int(now - started), MAX_DURATION),
+                               result, len(moves))
+            + pack_moves(moves, self.cell_count)
+        )
+
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def flush_if_due(self) -> bool:
+        """Synchronisiert ausstehende Records, sobald sync_interval abgelaufen ist"""
+        if self._unsynced and monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+            return True
+        return False
+
+    def sync(self) -> None:
+        """Schreibt den Puffer und erzwingt die Übernahme auf den Datenträger"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = monotonic()
+
+    def close(self) -> None:
+        """Synchronisiert und schließt das Log"""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+class GameLog:
+    """Lesezugriff auf ein Partie-Log über mmap (Records werden einzeln dekodiert)"""
+
+    def __init__(self, path: str):
+        header = _read_header(path)
+        if header is None:
+            raise ValueError(f"Leeres Partie-Log: {path}")
+        self.path = path
+        self.size, self.win_length = header
+        self.record_size = record_size(self.size)
+
+        with open(path, "rb") as log_file:
+            self._map = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._count = (len(self._map) - HEADER.size) // self.record_size
+
+    def close(self) -> None:
+        """Gibt die Speicherabbildung frei"""
+        self._map.close()
+
+    def __enter__(self) -> "GameLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, number: int) -> GameRecord:
+        if not -self._count <= number < self._count:
+            raise IndexError("Record-Nummer außerhalb des Logs")
+        return self._decode(HEADER.size + (number % self._count) * self.record_size)
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for number in range(self._count):
+            yield self._decode(HEADER.size + number * self.record_size)
+
+    def _decode(self, offset: int) -> GameRecord:
+        """Dekodiert den Record an einem Byte-Offset"""
+        started, duration, result, move_count = RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + RECORD_HEADER.size
+        cells = []
+        for value in self._map[start:start + (move_count + 1) // 2]:
+            cells.extend(_NIBBLES[value])
+        return GameRecord(started, duration, result, tuple(cells[:move_count]))
+
+    def replay(self, record: GameRecord) -> GameLogic:
+        """Spielt eine Partie nach und gibt die GameLogic im Endzustand zurück"""
+        game = GameLogic(self.size, self.win_length)
+        for cell in record.moves:
+            game.make_move(*divmod(cell, self.size))
+        return game
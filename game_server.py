@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Spiel-Server für Tic-Tac-Toe
+Viele gleichzeitige Partien (Kiosks, Bots) über ein Zeilenprotokoll auf asyncio
+"""
+
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+import argparse
+import asyncio
+import random
+
+from bitboard import get_geometry
+from game_logic import GameLogic
+
+
+# Protokoll: eine Anfrage pro Zeile, eine Antwortzeile pro Anfrage
+#   NEW                    neue Partie          -> OK <id> <board> <status>
+#   MOVE <id> <row> <col>  Zug des Spielers     -> OK <id> <board> <status>
+#   RANDOM <id>            Zufallszug           -> OK <id> <board> <status>
+#   STATE <id>             Stand abfragen       -> OK <id> <board> <status>
+#   RESET <id>             Partie neu beginnen  -> OK <id> <board> <status>
+#   CLOSE <id>             Partie beenden       -> OK <id>
+#   STATS                  Serverstatistik      -> OK sessions=<n> moves=<n> evicted=<n>
+# Fehler: ERR <Grund>. board enthält die Felder zeilenweise (X, O, *), status ist
+# X bzw. O (am Zug), WIN_X, WIN_O oder DRAW.
+DEFAULT_PORT = 8765
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_MAX_SESSIONS = 100000
+SWEEP_INTERVAL = 5.0
+
+
+class Session:
+    """Eine Partie des Servers: GameLogic (mit __slots__) und letzte Aktivität
+
+    Regeln, Zugrecht und Ergebnis kommen vollständig aus GameLogic; der Server
+    führt pro Partie nur noch den Zeitpunkt der letzten Anfrage.
+    """
+
+    __slots__ = ("game", "last_active")
+
+    def __init__(self, game: GameLogic, now: float):
+        self.game = game
+        self.last_active = now
+
+    def board_string(self) -> str:
+        """Felder zeilenweise als ein Wort (z.B. "X*O******")"""
+        return "".join(symbol for row in self.game.board for symbol in row)
+
+    def status(self) -> str:
+        """Spieler am Zug oder Ergebnis"""
+        game = self.game
+        if not game.game_over:
+            return game.current_player_symbol
+        if game.winner is not None:
+            return f"WIN_{game.winner}"
+        return "DRAW"
+
+
+class GameServer:
+    """Verwaltet Partien nach Session-ID und beantwortet Protokollzeilen
+
+    sessions ist nach letzter Aktivität geordnet (jeder Zugriff hängt die
+    Partie ans Ende), das Entfernen inaktiver Partien bricht daher an der
+    ersten aktiven ab.
+    """
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 clock: Callable[[], float] = monotonic, rng: Optional[random.Random] = None):
+        self.geometry = get_geometry(size, win_length)
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self.sessions: Dict[int, Session] = {}
+        self.moves = 0
+        self.evicted = 0
+        self._next_id = 1
+        self._evict_task: Optional["asyncio.Task"] = None
+
+        self._commands = {
+            "NEW": self._command_new,
+            "MOVE": self._command_move,
+            "RANDOM": self._command_random,
+            "STATE": self._command_state,
+            "RESET": self._command_reset,
+            "CLOSE": self._command_close,
+            "STATS": self._command_stats,
+        }
+
+    def handle_line(self, line: str) -> str:
+        """Verarbeitet eine Anfragezeile und gibt die Antwortzeile zurück"""
+        parts = line.split()
+        if not parts:
+            return "ERR leere Anfrage"
+        command = self._commands.get(parts[0].upper())
+        if command is None:
+            return f"ERR unbekannter Befehl {parts[0]}"
+        try:
+            return command(parts[1:])
+        except (ValueError, IndexError):
+            return "ERR ungültige Argumente"
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Entfernt Partien, die länger als idle_timeout inaktiv sind"""
+        limit = (self.clock() if now is None else now) - self.idle_timeout
+        expired = []
+        for session_id, session in self.sessions.items():
+            if session.last_active > limit:
+                break
+            expired.append(session_id)
+        for session_id in expired:
+            del self.sessions[session_id]
+        self.evicted += len(expired)
+        return len(expired)
+
+    def _touch(self, session_id: int) -> Optional[Session]:
+        """Sucht eine Partie und markiert sie als aktiv"""
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.last_active = self.clock()
+            self.sessions[session_id] = session
+        return session
+
+    def _reply(self, session_id: int, session: Session) -> str:
+        return f"OK {session_id} {session.board_string()} {session.status()}"
+
+    def _command_new(self, args: List[str]) -> str:
+        if len(self.sessions) >= self.max_sessions and not self.evict_idle():
+            return "ERR zu viele Partien"
+        session_id = self._next_id
+        self._next_id += 1
+        session = Session(GameLogic(self.geometry.size, self.geometry.win_length), self.clock())
+        self.sessions[session_id] = session
+        return self._reply(session_id, session)
+
+    def _command_move(self, args: List[str]) -> str:
+        session_id, row, col = int(args[0]), int(args[1]), int(args[2])
+        session = self._touch(session_id)
+        if session is None:
+            return "ERR unbekannte Partie"
+        if not session.game.make_move(row, col):
+            return "ERR ungültiger Zug"
+        self.moves += 1
+        return self._reply(session_id, session)
+
+    def _command_random(self, args: List[str]) -> str:
+        session_id = int(args[0])
+        session = self._touch(session_id)
+        if session is None:
+            return "ERR unbekannte Partie"
+        if session.game.game_over:
+            return "ERR Partie ist beendet"
+        session.game.make_move(*self.rng.choice(session.game.empty_positions))
+        self.moves += 1
+        return self._reply(session_id, session)
+
+    def _command_state(self, args: List[str]) -> str:
+        session_id = int(args[0])
+        session = self._touch(session_id)
+        if session is None:
+            return "ERR unbekannte Partie"
+        return self._reply(session_id, session)
+
+    def _command_reset(self, args: List[str]) -> str:
+        session_id = int(args[0])
+        session = self._touch(session_id)
+        if session is None:
+            return "ERR unbekannte Partie"
+        session.game.reset_game()
+        return self._reply(session_id, session)
+
+    def _command_close(self, args: List[str]) -> str:
+        session_id = int(args[0])
+        if self.sessions.pop(session_id, None) is None:
+            return "ERR unbekannte Partie"
+        return f"OK {session_id}"
+
+    def _command_stats(self, args: List[str]) -> str:
+        return f"OK sessions={len(self.sessions)} moves={self.moves} evicted={self.evicted}"
+
+    async def handle_client(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        """Beantwortet die Zeilen einer Verbindung bis zum Verbindungsende"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = self.handle_line(line.decode("ascii", "replace"))
+                writer.write((response + "\n").encode("ascii"))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _evict_loop(self, interval: float) -> None:
+        """Entfernt regelmäßig inaktive Partien"""
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                    unix_path: Optional[str] = None,
+                    sweep_interval: float = SWEEP_INTERVAL) -> asyncio.AbstractServer:
+        """Startet den Server (TCP oder Unix-Socket) samt Aufräum-Task"""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        self._evict_task = asyncio.create_task(self._evict_loop(sweep_interval))
+        return server
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    game_server = GameServer(args.size, args.win_length, args.idle_timeout, args.max_sessions)
+    server = await game_server.start(args.host, args.port, args.unix)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"Spiel-Server läuft auf {address} ({args.size}×{args.size})")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Einstiegspunkt für den Spiel-Server"""
+    parser = argparse.ArgumentParser(
+        description="Tic-Tac-Toe Server für viele gleichzeitige Partien"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse (TCP)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port (TCP)")
+    parser.add_argument("--unix", metavar="PFAD", help="Unix-Socket statt TCP")
+    parser.add_argument("--size", type=int, default=3, help="Kantenlänge des Boards (N×N)")
+    parser.add_argument("--win-length", type=int, default=None,
+                        help="Symbole in einer Reihe für einen Gewinn (Standard: N)")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Sekunden ohne Anfrage, nach denen eine Partie entfernt wird")
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS,
+                        help="Höchstzahl gleichzeitiger Partien")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("\nServer beendet.")
+
+
+if __name__ == "__main__":
+    main()
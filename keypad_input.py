@@ -2,10 +2,30 @@
 Keypad Input Module für Tic-Tac-Toe
 """
 
-from typing import Optional, Tuple
-from time import sleep
+from typing import Callable, List, Optional, Tuple
+from time import monotonic, sleep
 from enum import Enum
-from gpiozero import DigitalOutputDevice, Button
+import queue
+import threading
+
+from debounce import Debouncer, KeyEvent, KeyEventType
+import latency
+
+
+# gpiozero wird erst beim ersten KeypadInput importiert (langsamer Import beim Kaltstart)
+DigitalOutputDevice = None
+Button = None
+
+
+def _load_gpiozero() -> bool:
+    """Importiert gpiozero bei Bedarf; gibt zurück, ob es verfügbar ist"""
+    global DigitalOutputDevice, Button
+    if Button is None:
+        try:
+            from gpiozero import DigitalOutputDevice, Button
+        except ImportError:
+            return False
+    return True
 
 
 class InputAction(Enum):
@@ -13,9 +33,37 @@ class InputAction(Enum):
     GAME_MOVE = "game_move"
     RESET_GAME = "reset"
     RANDOM_MOVE = "random"
+    NEXT_PAGE = "page"
     EXIT_PROGRAM = "exit"
 
 
+# Taste für InputAction.EXIT_PROGRAM
+EXIT_KEY = (3, 3)
+
+
+def map_key_to_action(key: Tuple[int, int]) -> Tuple[InputAction, Optional[Tuple[int, int]]]:
+    """Mapped eine Tasteneingabe zu einer Aktion"""
+    row, col = key
+    
+    # Spezielle Tasten in Reihe 3
+    if row == 3:
+        if col == 0:
+            return (InputAction.RESET_GAME, None)
+        elif col == 1:
+            return (InputAction.NEXT_PAGE, None)
+        elif col == 2:
+            return (InputAction.RANDOM_MOVE, None)
+        elif col == 3:
+            return (InputAction.EXIT_PROGRAM, None)
+    
+    # Normale Spielzüge (3x3 Grid)
+    elif 0 <= row < 3 and 0 <= col < 3:
+        return (InputAction.GAME_MOVE, (row, col))
+    
+    # Unbekannte Eingabe
+    return (InputAction.GAME_MOVE, None)
+
+
 class KeypadInput:
     """Keypad-Eingabe-Klasse mit Entprellung und Mapping"""
     
@@ -24,21 +72,94 @@ class KeypadInput:
     DEFAULT_COL_PINS = [6, 13, 19, 26]
     
     # Timing-Konstanten
-    DEBOUNCE_DELAY = 0.1
+    DEBOUNCE_DELAY = 0.1          # bounce_time der Spalten im Interrupt-Betrieb
+    PRESS_STABLE_TIME = 0.02      # so lange muss eine Taste stabil gedrückt sein
+    RELEASE_STABLE_TIME = 0.05    # so lange muss eine Taste stabil losgelassen sein
     SCAN_DELAY = 0.01
+    EDGE_SETTLE_DELAY = 0.001  # Einschwingzeit pro Reihe beim gezielten Scan
     
-    def __init__(self, row_pins: Optional[list] = None, col_pins: Optional[list] = None):
-        """Initialisiert das Keypad mit konfigurierbaren Pins"""
+    def __init__(self, row_pins: Optional[list] = None, col_pins: Optional[list] = None,
+                 edge_triggered: bool = False, debouncer: Optional[Debouncer] = None):
+        """Initialisiert das Keypad mit konfigurierbaren Pins
+        
+        Mit edge_triggered liegen alle Reihen dauerhaft auf High und eine steigende
+        Flanke an einer Spalte löst einen gezielten Scan nur dieser Spalte aus.
+        Tasten landen dann in einer thread-sicheren Queue statt gepollt zu werden.
+        
+        Im Polling-Betrieb entprellt der debouncer die Matrix-Abtastungen
+        (Standard: PRESS_STABLE_TIME / RELEASE_STABLE_TIME, kein Auto-Repeat).
+        """
+        if not _load_gpiozero():
+            raise RuntimeError("gpiozero wird für das Hardware-Keypad benötigt")
+        
         self.row_pins = row_pins or self.DEFAULT_ROW_PINS
         self.col_pins = col_pins or self.DEFAULT_COL_PINS
+        self.edge_triggered = edge_triggered
         
         # Hardware initialisieren
         self.rows = [DigitalOutputDevice(pin) for pin in self.row_pins]
-        self.cols = [Button(pin, pull_up=False) for pin in self.col_pins]
+        if edge_triggered:
+            self.cols = [Button(pin, pull_up=False, bounce_time=self.DEBOUNCE_DELAY)
+                         for pin in self.col_pins]
+        else:
+            self.cols = [Button(pin, pull_up=False) for pin in self.col_pins]
         
-        # Entprellung
-        self.last_key_pressed = None
+        # Entprellung im Polling-Betrieb
+        self.debouncer = debouncer or Debouncer(self.PRESS_STABLE_TIME, self.RELEASE_STABLE_TIME)
         
+        # Interrupt-Betrieb: Tasten gehen an on_key (falls gesetzt) oder in die Queue
+        self.events: "queue.Queue[Tuple[int, int]]" = queue.Queue()
+        self.on_key: Optional[Callable[[Tuple[int, int]], None]] = None
+        self._scan_lock = threading.Lock()
+        if edge_triggered:
+            self._enable_edge_detection()
+    
+    def _enable_edge_detection(self) -> None:
+        """Legt alle Reihen auf High und registriert die Spalten-Callbacks"""
+        for row in self.rows:
+            row.on()
+        for j, col in enumerate(self.cols):
+            col.when_pressed = lambda _device=None, column=j: self._on_column_pressed(column)
+    
+    def _on_column_pressed(self, column: int) -> None:
+        """Callback einer Spalte: ermittelt die Reihe und stellt die Taste in die Queue"""
+        # Der gezielte Scan erzeugt selbst Flanken, die ignoriert werden müssen
+        if not self._scan_lock.acquire(blocking=False):
+            return
+        tracer = latency.tracer
+        try:
+            scan_start = monotonic() if tracer is not None else 0.0
+            key = self._scan_column(column)
+        finally:
+            self._scan_lock.release()
+        
+        if key:
+            if tracer is not None:
+                tracer.begin(scan_start)
+                tracer.record("scan", monotonic() - scan_start)
+            if self.on_key:
+                self.on_key(key)
+            else:
+                self.events.put(key)
+    
+    def _scan_column(self, column: int) -> Optional[Tuple[int, int]]:
+        """Scannt die Reihen für eine einzelne Spalte und stellt danach alle Reihen auf High"""
+        for row in self.rows:
+            row.off()
+        
+        key = None
+        for i, row in enumerate(self.rows):
+            row.on()
+            sleep(self.EDGE_SETTLE_DELAY)
+            pressed = self.cols[column].is_pressed
+            row.off()
+            if pressed:
+                key = (i, column)
+                break
+        
+        for row in self.rows:
+            row.on()
+        return key
     
     def cleanup(self) -> None:
         """Räumt Hardware-Ressourcen auf"""
@@ -62,33 +183,76 @@ class KeypadInput:
         
         return None
     
+    def read_pressed_keys(self) -> List[Tuple[int, int]]:
+        """Scannt die komplette Matrix und gibt alle geschlossenen Tasten zurück"""
+        keys = []
+        for i, row in enumerate(self.rows):
+            row.on()
+            sleep(self.SCAN_DELAY)
+            keys.extend((i, j) for j, col in enumerate(self.cols) if col.is_pressed)
+            row.off()
+        return keys
+    
+    def poll_events(self) -> List[KeyEvent]:
+        """Tastet die Matrix einmal ab und gibt die entprellten Ereignisse zurück"""
+        tracer = latency.tracer
+        if tracer is None:
+            return self.debouncer.update(self.read_pressed_keys())
+        
+        scan_start = monotonic()
+        keys = self.read_pressed_keys()
+        scan_time = monotonic() - scan_start
+        events = self.debouncer.update(keys)
+        for event in events:
+            if event.type == KeyEventType.PRESS:
+                # Gesamtlatenz ab der ersten Abtastung, die die Taste gesehen hat
+                tracer.begin(event.since)
+                tracer.record("scan", scan_time)
+                tracer.record("debounce", event.timestamp - event.since)
+        return events
+    
     def get_input_with_debounce(self) -> Optional[Tuple[int, int]]:
-        """Liest Eingabe mit Entprellung"""
-        current_key = self.read_keypad()
+        """Liest Eingabe mit Entprellung
         
-        if current_key and current_key != self.last_key_pressed:
-            self.last_key_pressed = current_key
-            return current_key
+        Liefert Tasten aus PRESS- und REPEAT-Ereignissen; mehrere gleichzeitig
+        bestätigte Tasten werden in der Queue gepuffert.
+        """
+        if not self.edge_triggered:
+            for event in self.poll_events():
+                if event.type != KeyEventType.RELEASE:
+                    self.events.put(event.key)
         
-        return None
+        try:
+            return self.events.get_nowait()
+        except queue.Empty:
+            return None
     
-    def map_key_to_action(self, key: Tuple[int, int]) -> Tuple[InputAction, Optional[Tuple[int, int]]]:
-        """Mapped eine Tasteneingabe zu einer Aktion"""
-        row, col = key
-        
-        # Spezielle Tasten in Reihe 3
-        if row == 3:
-            if col == 0:
-                return (InputAction.RESET_GAME, None)
-            elif col == 2:
-                return (InputAction.RANDOM_MOVE, None)
-            elif col == 3:
-                return (InputAction.EXIT_PROGRAM, None)
+    def wait_for_input(self, timeout: float) -> Optional[Tuple[int, int]]:
+        """Wartet höchstens timeout Sekunden auf eine Taste
         
-        # Normale Spielzüge (3x3 Grid)
-        elif 0 <= row < 3 and 0 <= col < 3:
-            return (InputAction.GAME_MOVE, (row, col))
+        Im Interrupt-Betrieb blockiert der Aufruf auf der Queue (keine CPU-Last im
+        Leerlauf). Sonst wird gepollt; wartet eine Taste auf ihre Bestätigung,
+        wird zum frühestmöglichen Bestätigungszeitpunkt erneut abgetastet.
+        """
+        if self.edge_triggered:
+            try:
+                return self.events.get(timeout=timeout)
+            except queue.Empty:
+                return None
         
-        # Unbekannte Eingabe
-        return (InputAction.GAME_MOVE, None)
+        deadline = monotonic() + timeout
+        while True:
+            key = self.get_input_with_debounce()
+            remaining = deadline - monotonic()
+            if key is not None or remaining <= 0:
+                return key
+            
+            settle = self.debouncer.time_to_settle()
+            if settle is None:
+                sleep(remaining)
+                return None
+            sleep(min(settle, remaining))
     
+    def map_key_to_action(self, key: Tuple[int, int]) -> Tuple[InputAction, Optional[Tuple[int, int]]]:
+        """Mapped eine Tasteneingabe zu einer Aktion"""
+        return map_key_to_action(key)
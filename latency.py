@@ -0,0 +1,124 @@
+"""
+Latenz-Messung für Tic-Tac-Toe
+Zeitstempel entlang des Pfads Tastendruck -> Pixel und Perzentile pro Stufe
+"""
+
+from collections import deque
+from time import monotonic
+from typing import Callable, Dict, Optional
+import json
+import signal
+import threading
+
+
+# Stufen in Pfad-Reihenfolge; jede Stufe misst die Zeit seit der vorherigen Marke
+STAGES = ("scan", "debounce", "map", "move", "compose", "flush")
+TOTAL = "total"
+PERCENTILES = (50, 95, 99)
+
+# Aktiver Tracer (None = Messung aus; Aufrufstellen prüfen nur auf None)
+tracer: Optional["LatencyTracer"] = None
+
+
+def percentiles(values) -> Dict[str, float]:
+    """Anzahl, Maximum und Nearest-Rank Perzentile (in Millisekunden) aus Sekundenwerten"""
+    values = sorted(values)
+    entry = {"count": len(values), "max_ms": values[-1] * 1000}
+    for percentile in PERCENTILES:
+        rank = max(1, -(-percentile * len(values) // 100))
+        entry[f"p{percentile}_ms"] = values[rank - 1] * 1000
+    return entry
+
+
+class LatencyTracer:
+    """Sammelt Stufen-Latenzen eines Tastendrucks bis zur Übertragung ans Display
+
+    begin() startet eine Messung (beim erkannten Tastendruck), mark() schließt
+    eine Stufe ab und end() die letzte Stufe samt Gesamtlatenz. Ohne laufende
+    Messung werden Marken ignoriert (z.B. Animations-Frames). Pro Stufe werden
+    die letzten max_samples Werte in Sekunden gehalten.
+    """
+
+    def __init__(self, max_samples: int = 10000, clock: Callable[[], float] = monotonic):
+        self.clock = clock
+        self.max_samples = max_samples
+        self.samples: Dict[str, "deque[float]"] = {
+            stage: deque(maxlen=max_samples) for stage in STAGES + (TOTAL,)
+        }
+        self._start: Optional[float] = None
+        self._last: Optional[float] = None
+        self._lock = threading.Lock()
+        self._dump_thread: Optional[threading.Thread] = None
+
+    def begin(self, start: Optional[float] = None) -> None:
+        """Startet eine Messung; start verlegt den Beginn der Gesamtlatenz nach vorn
+
+        Bereits vor begin() gemessene Stufen (Scan, Entprellung) werden mit
+        record() eingetragen, die nächste mark() misst ab jetzt.
+        """
+        now = self.clock()
+        with self._lock:
+            self._start = now if start is None else start
+            self._last = now
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Speichert eine direkt gemessene Stufendauer"""
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    def mark(self, stage: str) -> None:
+        """Schließt eine Stufe der laufenden Messung ab"""
+        now = self.clock()
+        with self._lock:
+            if self._last is None:
+                return
+            self.samples[stage].append(now - self._last)
+            self._last = now
+
+    def end(self, stage: str) -> None:
+        """Schließt die letzte Stufe ab und speichert die Gesamtlatenz"""
+        now = self.clock()
+        with self._lock:
+            if self._last is None:
+                return
+            self.samples[stage].append(now - self._last)
+            self.samples[TOTAL].append(now - self._start)
+            self._start = None
+            self._last = None
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Perzentile (in Millisekunden) und Anzahl pro Stufe"""
+        with self._lock:
+            snapshot = {stage: list(values) for stage, values in self.samples.items()}
+        return {stage: percentiles(values) for stage, values in snapshot.items() if values}
+
+    def dump(self, path: str) -> None:
+        """Schreibt den Bericht als JSON-Datei"""
+        with open(path, "w") as report_file:
+            json.dump(self.report(), report_file, indent=2)
+
+    def install_signal_handler(self, path: str, signum: int = signal.SIGUSR1) -> None:
+        """Schreibt den Bericht bei jedem Eintreffen des Signals (z.B. kill -USR1 <pid>)
+
+        Der Handler läuft im Hauptthread, der dabei gerade _lock halten kann
+        (mark, record, begin); der Bericht entsteht daher in einem eigenen Thread.
+        """
+        def handler(_signum, _frame) -> None:
+            self._dump_thread = threading.Thread(target=self.dump, args=(path,),
+                                                 name="latency-dump", daemon=True)
+            self._dump_thread.start()
+
+        signal.signal(signum, handler)
+
+
+def enable(max_samples: int = 10000) -> LatencyTracer:
+    """Schaltet die Messung ein und gibt den aktiven Tracer zurück"""
+    global tracer
+    tracer = LatencyTracer(max_samples)
+    return tracer
+
+
+def disable() -> None:
+    """Schaltet die Messung aus"""
+    global tracer
+    tracer = None
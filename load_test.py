@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Lasttest für Tic-Tac-Toe
+Treibt die komplette Kette Eingabe -> Logik -> Rendern mit virtuellen Geräten
+"""
+
+from typing import Dict, List, Optional, Tuple
+import argparse
+import random
+import time
+
+from display import DisplayWorker
+from game import TicTacToeGame
+from virtual_devices import RecordingDisplay, ScriptedKeypad
+import latency
+
+
+# Tasten des Lasttests: Spielfeld, Reset und Computer-Zug
+GRID_KEYS = [(row, col) for row in range(3) for col in range(3)]
+RESET_KEY = (3, 0)
+RANDOM_KEY = (3, 2)
+
+
+def random_keys(count: int, seed: int = 0) -> List[Tuple[int, int]]:
+    """Erzeugt eine reproduzierbare Tastenfolge aus Zügen, Computer-Zügen und Resets"""
+    rng = random.Random(seed)
+    keys = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            keys.append(RESET_KEY)
+        elif roll < 0.25:
+            keys.append(RANDOM_KEY)
+        else:
+            keys.append(rng.choice(GRID_KEYS))
+    return keys
+
+
+def run_load_test(events: int, rate: Optional[float] = None, threaded: bool = False,
+                  seed: int = 0) -> Dict:
+    """Spielt events Tasten durch das Spiel und misst Durchsatz und Frames
+
+    Gewinn-Animationen laufen ohne Pausen, damit nur die Verarbeitung gemessen wird.
+    """
+    recorder = RecordingDisplay(max_frames=1)
+    recorder.ANIMATION_DELAY = 0
+    display = DisplayWorker(recorder) if threaded else recorder
+    keypad = ScriptedKeypad(random_keys(events, seed), rate=rate)
+
+    game = TicTacToeGame(keypad=keypad, display=display)
+    game.WELCOME_DELAY = 0
+
+    start = time.perf_counter()
+    game.start()
+    seconds = time.perf_counter() - start
+
+    return {
+        "events": keypad.delivered,
+        "seconds": seconds,
+        "events_per_second": keypad.delivered / seconds if seconds else 0.0,
+        "frames": recorder.frame_count,
+        "bytes_written": recorder.device.bytes_written,
+    }
+
+
+def main():
+    """Einstiegspunkt für den Lasttest"""
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe Lasttest ohne Hardware")
+    parser.add_argument("--events", type=int, default=10000, help="Anzahl Tastenereignisse")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Tasten pro Sekunde (Standard: so schnell wie möglich)")
+    parser.add_argument("--threaded", action="store_true",
+                        help="Rendern im DisplayWorker-Thread")
+    parser.add_argument("--seed", type=int, default=0, help="Seed der Tastenfolge")
+    parser.add_argument("--latency", action="store_true",
+                        help="Latenz pro Stufe messen und Perzentile ausgeben")
+    args = parser.parse_args()
+
+    tracer = latency.enable() if args.latency else None
+    result = run_load_test(args.events, args.rate, args.threaded, args.seed)
+    print(f"Ereignisse:   {result['events']}")
+    print(f"Dauer:        {result['seconds']:.3f} s")
+    print(f"Durchsatz:    {result['events_per_second']:.0f} Ereignisse/s")
+    print(f"Frames:       {result['frames']}")
+    print(f"I2C-Bytes:    {result['bytes_written']}")
+
+    if tracer is not None:
+        print(f"{'Stufe':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Anzahl':>10}")
+        for stage, entry in tracer.report().items():
+            print(f"{stage:<10}{entry['p50_ms']:>10.3f}{entry['p95_ms']:>10.3f}"
+                  f"{entry['p99_ms']:>10.3f}{entry['count']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,68 @@
 Tic-Tac-Toe Main Entry Point
 """
 
+import argparse
+
+from computer_player import MovePolicy
 from game import TicTacToeGame
+from game_record import GameRecorder
+from state_file import DEFAULT_INTERVAL, StateFile
+from search_defaults import DEFAULT_TIME_BUDGET_MS
+import latency
 
 
 def main():
     """Haupteinstiegspunkt für das Tic-Tac-Toe Spiel"""
-    game = TicTacToeGame()
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe für Raspberry Pi")
+    parser.add_argument("--policy", choices=[p.value for p in MovePolicy],
+                        default=MovePolicy.RANDOM.value,
+                        help="Strategie für Computer-Züge ([#]-Taste)")
+    parser.add_argument("--difficulty", type=float, default=1.0,
+                        help="Anteil perfekter Züge (0.0 - 1.0), Rest zufällig")
+    parser.add_argument("--size", type=int, default=3,
+                        help="Kantenlänge des Boards (N×N)")
+    parser.add_argument("--win-length", type=int, default=None,
+                        help="Symbole in einer Reihe für einen Gewinn (Standard: N)")
+    parser.add_argument("--think-ms", type=float, default=DEFAULT_TIME_BUDGET_MS,
+                        help="Bedenkzeit pro Zug in Millisekunden (mcts)")
+    parser.add_argument("--search-workers", type=int, default=1,
+                        help="Prozesse für die parallele Suche (mcts)")
+    parser.add_argument("--edge-keypad", action="store_true",
+                        help="Keypad per Flanken-Interrupt statt Polling abfragen")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Ereignisgesteuerte Hauptschleife auf Basis von asyncio")
+    parser.add_argument("--latency-dump", metavar="DATEI",
+                        help="Latenzen Taste -> Pixel messen; Bericht bei SIGUSR1 und am Ende")
+    parser.add_argument("--record", metavar="DATEI",
+                        help="Alle Partien an ein binäres Partie-Log anhängen")
+    parser.add_argument("--state-file", metavar="DATEI",
+                        help="Spielstand regelmäßig sichern und beim Start fortsetzen")
+    parser.add_argument("--state-interval", type=float, default=DEFAULT_INTERVAL,
+                        help="Mindestabstand zwischen zwei Sicherungen in Sekunden")
+    args = parser.parse_args()
+
+    try:
+        recorder = GameRecorder(args.record, args.size, args.win_length) if args.record else None
+    except ValueError as e:
+        parser.error(f"--record: {e}")
+    state_file = StateFile(args.state_file, args.state_interval) if args.state_file else None
+    if args.latency_dump:
+        latency.enable().install_signal_handler(args.latency_dump)
+
+    if args.use_async:
+        # asyncio nur laden, wenn die ereignisgesteuerte Variante gewählt ist
+        from async_game import AsyncTicTacToeGame
+        game_class = AsyncTicTacToeGame
+    else:
+        game_class = TicTacToeGame
+    game = game_class(MovePolicy(args.policy), args.difficulty, args.size, args.win_length,
+                      args.edge_keypad, recorder=recorder, time_budget_ms=args.think_ms,
+                      search_workers=args.search_workers, state_file=state_file)
     game.start()
 
+    if latency.tracer is not None:
+        latency.tracer.dump(args.latency_dump)
+
 
 if __name__ == "__main__":
     main()
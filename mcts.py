@@ -0,0 +1,278 @@
+"""
+Monte-Carlo-Baumsuche für Tic-Tac-Toe
+UCT-Suche mit Zeitbudget pro Zug, Wiederverwendung des Baums und optionaler
+Root-Parallelisierung über mehrere Prozesse (für große Boards)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from math import log, sqrt
+from typing import Dict, List, Optional, Tuple
+import random
+import time
+
+from bitboard import BoardGeometry, get_geometry
+from game_logic import GameLogic
+from search_defaults import DEFAULT_TIME_BUDGET_MS
+
+
+EXPLORATION = sqrt(2)
+# Anteil des Restbudgets für Worker-Prozesse (Rest deckt Übergabe und Rückweg ab)
+WORKER_SHARE = 0.8
+
+# Ergebnis einer Endstellung: Index des Gewinners (0 = X, 1 = O) oder DRAW
+DRAW = 2
+
+# Statistik der Wurzel-Züge: Feldindex -> (Besuche, Gewinne)
+RootStats = Dict[int, Tuple[int, float]]
+
+
+def _empty_indices(occupied: int, cell_count: int) -> List[int]:
+    """Indizes aller freien Felder"""
+    return [index for index in range(cell_count) if not (occupied >> index) & 1]
+
+
+class _Node:
+    """Knoten des Suchbaums; player hat move gespielt und wins zählt aus seiner Sicht"""
+
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins", "player", "terminal")
+
+    def __init__(self, move: Optional[int], parent: Optional["_Node"], player: int,
+                 untried: List[int], terminal: Optional[int]):
+        self.move = move
+        self.parent = parent
+        self.children: List["_Node"] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.player = player
+        self.terminal = terminal
+
+
+class _Search:
+    """Eine UCT-Suche ab einer Stellung (Bitmasken beider Spieler und Spieler am Zug)"""
+
+    def __init__(self, geometry: BoardGeometry, bits: Tuple[int, int], player: int,
+                 rng: random.Random, root: Optional[_Node] = None):
+        self.geometry = geometry
+        self._completed_line = geometry.completed_line
+        self.bits = bits
+        self.player = player
+        self.rng = rng
+        if root is None:
+            root = _Node(None, None, 1 - player,
+                         _empty_indices(bits[0] | bits[1], geometry.cell_count), None)
+        self.root = root
+
+    def _is_win(self, bits: int, index: int) -> bool:
+        """Prüft nur die Linien durch das zuletzt gesetzte Feld"""
+        return self._completed_line(bits, index) is not None
+
+    def run(self, deadline: float, max_iterations: Optional[int] = None) -> int:
+        """Sucht bis zur Deadline (perf_counter) bzw. max_iterations, gibt die Iterationen zurück"""
+        iterations = 0
+        clock = time.perf_counter
+        while clock() < deadline and (max_iterations is None or iterations < max_iterations):
+            self._iterate()
+            iterations += 1
+        return iterations
+
+    def _iterate(self) -> None:
+        """Auswahl, Expansion, Playout und Rückpropagierung"""
+        rng = self.rng
+        bits = list(self.bits)
+        node = self.root
+
+        # Auswahl: voll expandierte Knoten per UCT durchlaufen
+        while node.terminal is None and not node.untried:
+            log_visits = log(node.visits)
+            best = None
+            best_value = -1.0
+            for child in node.children:
+                value = child.wins / child.visits + EXPLORATION * sqrt(log_visits / child.visits)
+                if value > best_value:
+                    best, best_value = child, value
+            node = best
+            bits[node.player] |= 1 << node.move
+
+        # Expansion: einen noch nicht versuchten Zug als Kind anlegen
+        if node.terminal is None:
+            untried = node.untried
+            position = rng.randrange(len(untried))
+            move = untried[position]
+            untried[position] = untried[-1]
+            untried.pop()
+
+            player = 1 - node.player
+            bits[player] |= 1 << move
+            occupied = bits[0] | bits[1]
+            if self._is_win(bits[player], move):
+                terminal = player
+            elif self.geometry.is_full(occupied):
+                terminal = DRAW
+            else:
+                terminal = None
+            child = _Node(move, node, player,
+                          [] if terminal is not None else
+                          _empty_indices(occupied, self.geometry.cell_count), terminal)
+            node.children.append(child)
+            node = child
+
+        result = node.terminal if node.terminal is not None else self._playout(bits, 1 - node.player)
+
+        # Rückpropagierung
+        while node is not None:
+            node.visits += 1
+            if result == DRAW:
+                node.wins += 0.5
+            elif result == node.player:
+                node.wins += 1.0
+            node = node.parent
+
+    def _playout(self, bits: List[int], player: int) -> int:
+        """Zufallspartie bis zum Ende; freie Felder in zufälliger Reihenfolge belegen"""
+        empty = _empty_indices(bits[0] | bits[1], self.geometry.cell_count)
+        self.rng.shuffle(empty)
+        for move in empty:
+            bits[player] |= 1 << move
+            if self._is_win(bits[player], move):
+                return player
+            player = 1 - player
+        return DRAW
+
+    def root_stats(self) -> RootStats:
+        """Besuche und Gewinne aller Züge der Wurzel"""
+        return {child.move: (child.visits, child.wins) for child in self.root.children}
+
+
+def search_root(size: int, win_length: int, bits: Tuple[int, int], player: int,
+                deadline_seconds: float, seed: int) -> RootStats:
+    """Unabhängige Suche für die Root-Parallelisierung (läuft im Worker-Prozess)"""
+    search = _Search(get_geometry(size, win_length), bits, player, random.Random(seed))
+    search.run(time.perf_counter() + deadline_seconds)
+    return search.root_stats()
+
+
+class MCTSPlayer:
+    """Monte-Carlo-Baumsuche mit UCT für beliebige Board-Größen
+
+    Pro Zug wird bis time_budget_ms gesucht; geprüft wird vor jeder Iteration,
+    die Überschreitung ist also höchstens ein Playout. Der Teilbaum des
+    gespielten Zugs wird beim nächsten Aufruf weiterverwendet, solange die
+    Partie dazu passt (gleiche Züge und gleiche Bitmasken; eine per
+    GameLogic.restore geladene Stellung hat keine Zugliste). Mit workers > 1
+    suchen zusätzlich workers - 1 Prozesse unabhängige Bäume, deren
+    Wurzel-Statistiken addiert werden. Ergebnisse, die nicht bis zur Deadline
+    vorliegen, werden verworfen.
+    """
+
+    def __init__(self, time_budget_ms: float = DEFAULT_TIME_BUDGET_MS, workers: int = 1,
+                 rng: Optional[random.Random] = None, max_iterations: Optional[int] = None):
+        if time_budget_ms <= 0 or workers < 1:
+            raise ValueError("Zeitbudget und Anzahl Worker müssen positiv sein")
+
+        self.time_budget_ms = time_budget_ms
+        self.workers = workers
+        self.rng = rng or random.Random()
+        self.max_iterations = max_iterations
+        self.last_iterations = 0
+
+        self._root: Optional[_Node] = None
+        self._root_moves: List[int] = []
+        self._root_bits: Tuple[int, int] = (0, 0)
+        self._root_geometry: Optional[BoardGeometry] = None
+        self._pool = ProcessPoolExecutor(max_workers=workers - 1) if workers > 1 else None
+
+    def close(self) -> None:
+        """Beendet die Worker-Prozesse"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def reset(self) -> None:
+        """Verwirft den gespeicherten Suchbaum (neue oder geladene Partie)"""
+        self._root = None
+        self._root_moves = []
+        self._root_bits = (0, 0)
+        self._root_geometry = None
+
+    def make_move(self, game: GameLogic) -> bool:
+        """Führt den gefundenen Zug aus"""
+        move = self.choose_move(game)
+        if move is None:
+            return False
+        return game.make_move(*move)
+
+    def choose_move(self, game: GameLogic) -> Optional[Tuple[int, int]]:
+        """Sucht bis zur Deadline und gibt den meistbesuchten Zug zurück"""
+        if game.game_over:
+            return None
+        start = time.perf_counter()
+        deadline = start + self.time_budget_ms / 1000
+
+        geometry = game.geometry
+        bits = game.bits
+        moves = list(game.moves)
+        search = _Search(geometry, bits, game.current_player, self.rng,
+                         self._reused_root(geometry, moves, bits))
+
+        futures = []
+        if self._pool is not None:
+            futures = [
+                self._pool.submit(search_root, geometry.size, geometry.win_length, bits,
+                                  game.current_player,
+                                  WORKER_SHARE * (deadline - time.perf_counter()),
+                                  self.rng.randrange(2 ** 32))
+                for _ in range(self.workers - 1)
+            ]
+
+        self.last_iterations = search.run(deadline, self.max_iterations)
+        stats = {move: list(values) for move, values in search.root_stats().items()}
+
+        if futures:
+            done, _ = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+            for future in done:
+                for move, (visits, wins) in future.result().items():
+                    entry = stats.setdefault(move, [0, 0.0])
+                    entry[0] += visits
+                    entry[1] += wins
+
+        if not stats:
+            # Keine Iteration geschafft: irgendein freier Zug statt einer Überschreitung
+            move = self.rng.choice(search.root.untried)
+        else:
+            move = max(stats, key=lambda cell: (stats[cell][0], stats[cell][1]))
+
+        # Teilbaum des gewählten Zugs für den nächsten Aufruf behalten
+        self._root = next((child for child in search.root.children if child.move == move), None)
+        if self._root is not None:
+            self._root.parent = None
+        self._root_moves = moves + [move]
+        root_bits = list(bits)
+        root_bits[game.current_player] |= 1 << move
+        self._root_bits = tuple(root_bits)
+        self._root_geometry = geometry
+        return divmod(move, geometry.size)
+
+    def _reused_root(self, geometry: BoardGeometry, moves: List[int],
+                     bits: Tuple[int, ...]) -> Optional[_Node]:
+        """Steigt im alten Baum die seitdem gespielten Züge hinab (None ohne passenden Teilbaum)
+
+        Der Teilbaum passt nur, wenn die Bitmasken danach der aktuellen Stellung
+        entsprechen; die Zugliste allein reicht nach einem restore() nicht.
+        """
+        root = self._root
+        known = len(self._root_moves)
+        if (root is None or geometry is not self._root_geometry
+                or moves[:known] != self._root_moves):
+            return None
+
+        walked = list(self._root_bits)
+        for move in moves[known:]:
+            root = next((child for child in root.children if child.move == move), None)
+            if root is None:
+                return None
+            walked[root.player] |= 1 << move
+        if tuple(walked) != bits:
+            return None
+        root.parent = None
+        return root
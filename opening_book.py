@@ -0,0 +1,191 @@
+"""
+Eröffnungsbuch Module für Tic-Tac-Toe
+Zughäufigkeiten und Ergebnisquoten pro kanonischer Stellung, aufgebaut aus Partie-Logs
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import os
+import struct
+
+from bitboard import BOARD_SIZE, CELL_COUNT
+from game_record import GameLog, GameRecord, RESULT_DRAW, RESULT_UNFINISHED, RESULT_X
+from symmetry import PERMUTATIONS, canonicalize, from_canonical_move, to_canonical_move, transform_key
+
+
+# Dateiformat: Header (Magic, Anzahl Logs, Anzahl Einträge), danach pro Log
+# [indizierte Records, Länge des Pfads] + Pfad (UTF-8) und pro (kanonische Stellung,
+# kanonischer Zug) ein Eintrag [Positionsschlüssel, Feldindex, Partien, Siege, Remis]
+# aus Sicht des Ziehenden
+MAGIC = b"TTB2"
+HEADER = struct.Struct("<4sII")
+LOG_ENTRY = struct.Struct("<IH")
+ENTRY = struct.Struct("<IBIII")
+
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+# Statistik eines Zugs: [Partien, Siege, Remis]
+GAMES = 0
+WINS = 1
+DRAWS = 2
+
+
+@lru_cache(maxsize=None)
+def _stabilizer(key: int) -> Tuple[int, ...]:
+    """Transformationen, die eine kanonische Stellung auf sich selbst abbilden"""
+    return tuple(transform for transform in range(len(PERMUTATIONS))
+                 if transform_key(key, transform) == key)
+
+
+def canonical_move(key: int, cell: int) -> int:
+    """Vertreter eines Zugs in einer kanonischen Stellung
+
+    In symmetrischen Stellungen sind mehrere Züge gleichwertig (z.B. alle Ecken
+    auf dem leeren Board); sie werden auf den kleinsten Feldindex abgebildet.
+    """
+    return min(PERMUTATIONS[transform][cell] for transform in _stabilizer(key))
+
+
+class BookMove(NamedTuple):
+    """Ein Buchzug in Koordinaten der abgefragten Stellung"""
+    row: int
+    col: int
+    games: int
+    wins: int
+    draws: int
+
+    @property
+    def score(self) -> float:
+        """Ergebnisquote für den Ziehenden (Sieg = 1, Remis = 0.5)"""
+        return (self.wins + 0.5 * self.draws) / self.games
+
+
+class OpeningBook:
+    """Tabelle kanonische Stellung -> Zugstatistiken aus gespielten Partien
+
+    Stellungen werden unter Drehung/Spiegelung zusammengefasst, eine Abfrage
+    kostet eine Kanonisierung und einen Dictionary-Lookup. Abgebrochene
+    Partien (ohne Ergebnis) werden nicht gezählt. indexed merkt sich pro Log
+    (aufgelöster Pfad), wie viele seiner Records schon eingeflossen sind, damit
+    neue Partien inkrementell nachgetragen werden können.
+    """
+
+    def __init__(self):
+        self._positions: Dict[int, Dict[int, List[int]]] = {}
+        self.indexed: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def indexed_records(self, log_path: str) -> int:
+        """Anzahl bereits eingeflossener Records eines Logs (0 für unbekannte Logs)"""
+        return self.indexed.get(os.path.realpath(log_path), 0)
+
+    def add_game(self, moves: Iterable[int], result: int) -> None:
+        """Zählt eine beendete Partie (Feldindizes in Zugreihenfolge)"""
+        if result == RESULT_UNFINISHED:
+            return
+
+        position_key = 0
+        for number, cell in enumerate(moves):
+            player = number & 1
+            key, transform = canonicalize(position_key)
+            stats = self._positions.setdefault(key, {}).setdefault(
+                canonical_move(key, to_canonical_move(cell, transform)), [0, 0, 0]
+            )
+            stats[GAMES] += 1
+            if result == RESULT_DRAW:
+                stats[DRAWS] += 1
+            elif (result == RESULT_X) == (player == 0):
+                stats[WINS] += 1
+            position_key |= 1 << (cell + player * CELL_COUNT)
+
+    def add_records(self, records: Iterable[GameRecord]) -> None:
+        """Zählt mehrere Records"""
+        for record in records:
+            self.add_game(record.moves, record.result)
+
+    def index_log(self, log: GameLog) -> int:
+        """Trägt alle noch nicht indizierten Records eines Logs nach
+
+        Gibt die Anzahl neuer Records zurück.
+        """
+        if (log.size, log.win_length) != (BOARD_SIZE, BOARD_SIZE):
+            raise ValueError("Eröffnungsbuch unterstützt nur 3×3 Partie-Logs")
+        indexed = self.indexed_records(log.path)
+        if len(log) < indexed:
+            raise ValueError("Partie-Log ist kürzer als der Index, Buch neu aufbauen")
+
+        self.add_records(log[number] for number in range(indexed, len(log)))
+        self.indexed[os.path.realpath(log.path)] = len(log)
+        return len(log) - indexed
+
+    def lookup(self, position_key: int) -> List[BookMove]:
+        """Alle bekannten Züge einer Stellung (häufigste zuerst)"""
+        key, transform = canonicalize(position_key)
+        moves = [
+            BookMove(*divmod(from_canonical_move(cell, transform), BOARD_SIZE), *stats)
+            for cell, stats in self._positions.get(key, {}).items()
+        ]
+        moves.sort(key=lambda move: move.games, reverse=True)
+        return moves
+
+    def best_move(self, position_key: int, min_games: int = 1) -> Optional[Tuple[int, int]]:
+        """Zug mit der besten Ergebnisquote unter allen Zügen mit mindestens min_games Partien"""
+        key, transform = canonicalize(position_key)
+        best_cell = None
+        best_score = -1.0
+        for cell, (games, wins, draws) in self._positions.get(key, {}).items():
+            if games < min_games:
+                continue
+            score = (wins + 0.5 * draws) / games
+            if score > best_score:
+                best_cell, best_score = cell, score
+        if best_cell is None:
+            return None
+        return divmod(from_canonical_move(best_cell, transform), BOARD_SIZE)
+
+    def save(self, path: str) -> None:
+        """Schreibt das Buch atomar (temporäre Datei, danach umbenennen)"""
+        entries = [
+            ENTRY.pack(key, cell, *stats)
+            for key, moves in sorted(self._positions.items())
+            for cell, stats in sorted(moves.items())
+        ]
+        logs = []
+        for log_path, indexed in sorted(self.indexed.items()):
+            encoded = log_path.encode("utf-8")
+            logs.append(LOG_ENTRY.pack(indexed, len(encoded)) + encoded)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as book_file:
+            book_file.write(HEADER.pack(MAGIC, len(logs), len(entries)))
+            book_file.write(b"".join(logs))
+            book_file.write(b"".join(entries))
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_BOOK_PATH) -> "OpeningBook":
+        """Liest ein gespeichertes Buch"""
+        with open(path, "rb") as book_file:
+            data = book_file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"Ungültiges Eröffnungsbuch: {path}")
+        magic, log_count, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Ungültiges Eröffnungsbuch: {path}")
+
+        book = cls()
+        offset = HEADER.size
+        for _ in range(log_count):
+            if offset + LOG_ENTRY.size > len(data):
+                raise ValueError(f"Ungültiges Eröffnungsbuch: {path}")
+            indexed, length = LOG_ENTRY.unpack_from(data, offset)
+            offset += LOG_ENTRY.size
+            book.indexed[data[offset:offset + length].decode("utf-8")] = indexed
+            offset += length
+        if len(data) != offset + count * ENTRY.size:
+            raise ValueError(f"Ungültiges Eröffnungsbuch: {path}")
+
+        for key, cell, games, wins, draws in ENTRY.iter_unpack(data[offset:]):
+            book._positions.setdefault(key, {})[cell] = [games, wins, draws]
+        return book
@@ -0,0 +1,7 @@
+"""
+Standardwerte der Computer-Suche für Tic-Tac-Toe
+Ohne schwere Importe, damit Einstiegspunkte sie vor dem ersten Frame lesen können
+"""
+
+# Bedenkzeit pro Zug der Monte-Carlo-Baumsuche in Millisekunden
+DEFAULT_TIME_BUDGET_MS = 250
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Lastgenerator für den Tic-Tac-Toe Spiel-Server
+Viele Verbindungen spielen gleichzeitig Partien und messen Durchsatz und Latenz
+"""
+
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import random
+
+from bitboard import EMPTY
+from game_server import DEFAULT_PORT
+import latency
+
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                   line: str, samples: List[float]) -> List[str]:
+    """Sendet eine Anfrage, wartet auf die Antwort und misst die Umlaufzeit"""
+    start = perf_counter()
+    writer.write((line + "\n").encode("ascii"))
+    await writer.drain()
+    response = (await reader.readline()).decode("ascii").split()
+    samples.append(perf_counter() - start)
+    if not response or response[0] != "OK":
+        raise RuntimeError(f"Server-Fehler auf '{line}': {' '.join(response)}")
+    return response
+
+
+async def _play(host: str, port: int, unix_path: Optional[str], size: int, deadline: float,
+                rng: random.Random, samples: List[float]) -> Tuple[int, int]:
+    """Eine Verbindung: Partien nacheinander, abwechselnd eigener Zug und Server-Zufallszug
+
+    Gibt (Züge, Partien) zurück.
+    """
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    moves = games = 0
+    try:
+        while perf_counter() < deadline:
+            _, session_id, board, status = await _request(reader, writer, "NEW", samples)
+            while status in ("X", "O") and perf_counter() < deadline:
+                if status == "X":
+                    cell = rng.choice([index for index, symbol in enumerate(board) if symbol == EMPTY])
+                    line = f"MOVE {session_id} {cell // size} {cell % size}"
+                else:
+                    line = f"RANDOM {session_id}"
+                _, _, board, status = await _request(reader, writer, line, samples)
+                moves += 1
+            await _request(reader, writer, f"CLOSE {session_id}", samples)
+            games += 1
+    finally:
+        writer.close()
+    return moves, games
+
+
+async def run_load(connections: int = 50, duration: float = 5.0, host: str = "127.0.0.1",
+                   port: int = DEFAULT_PORT, unix_path: Optional[str] = None,
+                   size: int = 3, seed: int = 0) -> Dict:
+    """Lässt connections Verbindungen duration Sekunden lang spielen"""
+    samples: List[float] = []
+    start = perf_counter()
+    results = await asyncio.gather(*(
+        _play(host, port, unix_path, size, start + duration, random.Random(seed + number), samples)
+        for number in range(connections)
+    ))
+    seconds = perf_counter() - start
+
+    moves = sum(result[0] for result in results)
+    return {
+        "connections": connections,
+        "seconds": seconds,
+        "moves": moves,
+        "games": sum(result[1] for result in results),
+        "moves_per_second": moves / seconds if seconds else 0.0,
+        "requests_per_second": len(samples) / seconds if seconds else 0.0,
+        "latency": latency.percentiles(samples) if samples else {},
+    }
+
+
+def main():
+    """Einstiegspunkt für den Lastgenerator"""
+    parser = argparse.ArgumentParser(description="Lastgenerator für den Tic-Tac-Toe Spiel-Server")
+    parser.add_argument("--host", default="127.0.0.1", help="Server-Adresse (TCP)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Server-Port (TCP)")
+    parser.add_argument("--unix", metavar="PFAD", help="Unix-Socket statt TCP")
+    parser.add_argument("--size", type=int, default=3, help="Board-Größe des Servers")
+    parser.add_argument("--connections", type=int, default=50, help="Gleichzeitige Verbindungen")
+    parser.add_argument("--duration", type=float, default=5.0, help="Dauer in Sekunden")
+    parser.add_argument("--seed", type=int, default=0, help="Seed der Zugwahl")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.connections, args.duration, args.host, args.port,
+                                  args.unix, args.size, args.seed))
+    print(f"Verbindungen: {result['connections']}")
+    print(f"Dauer:        {result['seconds']:.2f} s")
+    print(f"Partien:      {result['games']}")
+    print(f"Züge:         {result['moves']} ({result['moves_per_second']:.0f}/s)")
+    print(f"Anfragen:     {result['requests_per_second']:.0f}/s")
+    entry = result["latency"]
+    if entry:
+        print(f"Latenz:       p50 {entry['p50_ms']:.3f} ms, p95 {entry['p95_ms']:.3f} ms, "
+              f"p99 {entry['p99_ms']:.3f} ms, max {entry['max_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
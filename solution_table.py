@@ -0,0 +1,68 @@
+"""
+Lösungstabelle Module für Tic-Tac-Toe
+Vorberechneter bester Zug und Spielwert für jede Stellung (Basis-3 indiziert)
+"""
+
+from typing import Optional, Tuple
+import mmap
+import os
+import struct
+
+from bitboard import CELL_COUNT, BOARD_SIZE
+
+
+# Dateiformat: Header (Magic, Anzahl Einträge), danach pro Stellung 2 Bytes
+# [bester Zug als Feldindex oder NO_MOVE, Spielwert als int8]
+MAGIC = b"TTT1"
+HEADER = struct.Struct("<4sI")
+ENTRY_SIZE = 2
+TABLE_SIZE = 3 ** CELL_COUNT
+NO_MOVE = 0xFF
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solution_table.bin")
+
+# Basis-3 Anteil jeder 9-Bit Maske, damit die Kodierung ohne Schleife auskommt
+_BASE3 = tuple(
+    sum(3 ** index for index in range(CELL_COUNT) if (mask >> index) & 1)
+    for mask in range(1 << CELL_COUNT)
+)
+
+
+def base3_index(position_key: int) -> int:
+    """Kodiert eine Stellung zur Basis 3 (0 = leer, 1 = X, 2 = O pro Feld)"""
+    return _BASE3[position_key & ((1 << CELL_COUNT) - 1)] + 2 * _BASE3[position_key >> CELL_COUNT]
+
+
+def pack_entry(move: Optional[int], value: int) -> bytes:
+    """Packt einen Tabelleneintrag"""
+    return struct.pack("<Bb", NO_MOVE if move is None else move, value)
+
+
+class SolutionTable:
+    """Speicher-gemappte Lösungstabelle, Abfrage mit einem Lookup"""
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        """Öffnet und mappt die Tabellendatei"""
+        with open(path, "rb") as table_file:
+            self._map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, entries = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or entries != TABLE_SIZE:
+            self._map.close()
+            raise ValueError(f"Ungültige Lösungstabelle: {path}")
+
+    def close(self) -> None:
+        """Gibt die Speicherabbildung frei"""
+        self._map.close()
+
+    def best_move(self, position_key: int) -> Optional[Tuple[int, int]]:
+        """Gibt den besten Zug als (Reihe, Spalte) zurück"""
+        move = self._map[HEADER.size + base3_index(position_key) * ENTRY_SIZE]
+        if move == NO_MOVE:
+            return None
+        return divmod(move, BOARD_SIZE)
+
+    def value(self, position_key: int) -> int:
+        """Gibt den Spielwert aus Sicht des Spielers am Zug zurück"""
+        value = self._map[HEADER.size + base3_index(position_key) * ENTRY_SIZE + 1]
+        return value - 256 if value > 127 else value
@@ -0,0 +1,98 @@
+"""
+Spielstand-Datei für Tic-Tac-Toe
+Crash-sichere, SD-Karten-schonende Ablage des letzten GameLogic-Snapshots
+"""
+
+from time import monotonic
+from typing import Callable, Optional, Tuple
+import os
+import struct
+import zlib
+
+
+# Dateiformat: zwei Slots fester Länge, die abwechselnd überschrieben werden.
+# Slot: [Magic, Sequenznummer, CRC32 des Snapshots, Länge des Snapshots] + Snapshot,
+# aufgefüllt auf SLOT_SIZE. Gültig ist der intakte Slot mit der höchsten Sequenznummer.
+MAGIC = b"TTS1"
+SLOT_HEADER = struct.Struct("<4sIIH")
+SLOT_SIZE = 512
+SLOT_COUNT = 2
+MAX_SNAPSHOT = SLOT_SIZE - SLOT_HEADER.size
+
+DEFAULT_INTERVAL = 5.0
+
+# fdatasync überspringt reine Metadaten (mtime); nicht auf allen Plattformen vorhanden
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+class StateFile:
+    """Speichert den letzten Snapshot einer Partie
+
+    Jeder Schreibvorgang überschreibt den älteren von zwei Sektor-großen Slots
+    an Ort und Stelle (pwrite + fdatasync): keine neuen Dateien, kein Umbenennen,
+    keine Änderung der Dateigröße und damit kaum Metadaten-Schreibzugriffe.
+    Reißt ein Schreibvorgang ab, bleibt der andere Slot gültig. save()
+    schreibt nur geänderte Stände und höchstens alle interval Sekunden;
+    ein zurückgehaltener Stand folgt beim nächsten Aufruf nach Ablauf.
+    """
+
+    def __init__(self, path: str, interval: float = DEFAULT_INTERVAL,
+                 clock: Callable[[], float] = monotonic):
+        self.path = path
+        self.interval = interval
+        self.clock = clock
+        self.writes = 0
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._sequence, self._stored = self._scan()
+        self._last_write: Optional[float] = None
+
+    def _scan(self) -> Tuple[int, Optional[bytes]]:
+        """Sucht den neuesten gültigen Slot: (Sequenznummer, Snapshot oder None)"""
+        best_sequence, best = 0, None
+        for slot in range(SLOT_COUNT):
+            data = os.pread(self._fd, SLOT_SIZE, slot * SLOT_SIZE)
+            if len(data) < SLOT_HEADER.size:
+                continue
+            magic, sequence, checksum, length = SLOT_HEADER.unpack_from(data)
+            snapshot = data[SLOT_HEADER.size:SLOT_HEADER.size + length]
+            if (magic != MAGIC or length > MAX_SNAPSHOT or len(snapshot) != length
+                    or zlib.crc32(snapshot) != checksum):
+                continue
+            if best is None or sequence > best_sequence:
+                best_sequence, best = sequence, snapshot
+        return best_sequence, best
+
+    def load(self) -> Optional[bytes]:
+        """Zuletzt gespeicherter Snapshot (None bei leerer oder unlesbarer Datei)"""
+        return self._stored
+
+    def save(self, snapshot: bytes, force: bool = False) -> bool:
+        """Speichert einen Snapshot, falls er sich geändert hat
+
+        Ohne force wird höchstens alle interval Sekunden geschrieben. Gibt
+        zurück, ob geschrieben wurde.
+        """
+        if snapshot == self._stored:
+            return False
+        if len(snapshot) > MAX_SNAPSHOT:
+            raise ValueError(f"Snapshot ist größer als {MAX_SNAPSHOT} Bytes")
+        now = self.clock()
+        if not force and self._last_write is not None and now - self._last_write < self.interval:
+            return False
+
+        self._sequence += 1
+        data = SLOT_HEADER.pack(MAGIC, self._sequence, zlib.crc32(snapshot), len(snapshot)) + snapshot
+        os.pwrite(self._fd, data.ljust(SLOT_SIZE, b"\0"), (self._sequence % SLOT_COUNT) * SLOT_SIZE)
+        _datasync(self._fd)
+
+        self._stored = snapshot
+        self._last_write = now
+        self.writes += 1
+        return True
+
+    def close(self) -> None:
+        """Schließt die Datei"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
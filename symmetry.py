@@ -0,0 +1,104 @@
+"""
+Symmetrie Module für Tic-Tac-Toe
+Kanonisierung von Stellungen unter der Diedergruppe D4 (Drehungen und Spiegelungen)
+"""
+
+from typing import List, Tuple
+
+from bitboard import BitBoard, BOARD_SIZE, CELL_COUNT, cell_index
+
+
+def _rotate(row: int, col: int) -> Tuple[int, int]:
+    """Dreht ein Feld um 90 Grad im Uhrzeigersinn"""
+    return col, BOARD_SIZE - 1 - row
+
+
+def _mirror(row: int, col: int) -> Tuple[int, int]:
+    """Spiegelt ein Feld an der vertikalen Mittelachse"""
+    return row, BOARD_SIZE - 1 - col
+
+
+def _build_permutations() -> Tuple[Tuple[int, ...], ...]:
+    """Erzeugt die 8 Permutationen: Transformation t bildet Feld i auf PERMUTATIONS[t][i] ab"""
+    permutations = []
+    for mirrored in (False, True):
+        for rotations in range(4):
+            permutation = []
+            for index in range(CELL_COUNT):
+                row, col = divmod(index, BOARD_SIZE)
+                if mirrored:
+                    row, col = _mirror(row, col)
+                for _ in range(rotations):
+                    row, col = _rotate(row, col)
+                permutation.append(cell_index(row, col))
+            permutations.append(tuple(permutation))
+    return tuple(permutations)
+
+
+# Transformation 0 ist die Identität
+PERMUTATIONS = _build_permutations()
+INVERSE_PERMUTATIONS = tuple(
+    tuple(permutation.index(index) for index in range(CELL_COUNT))
+    for permutation in PERMUTATIONS
+)
+
+# Vorberechnete Abbildung jeder 9-Bit Maske unter jeder Transformation
+_MASK_TABLES = tuple(
+    tuple(
+        sum(1 << permutation[index] for index in range(CELL_COUNT) if (mask >> index) & 1)
+        for mask in range(1 << CELL_COUNT)
+    )
+    for permutation in PERMUTATIONS
+)
+_CELL_MASK = (1 << CELL_COUNT) - 1
+
+
+def transform_key(position_key: int, transform: int) -> int:
+    """Wendet eine Transformation auf einen Positionsschlüssel an"""
+    table = _MASK_TABLES[transform]
+    return table[position_key & _CELL_MASK] | (table[position_key >> CELL_COUNT] << CELL_COUNT)
+
+
+def canonicalize(position_key: int) -> Tuple[int, int]:
+    """Gibt den kanonischen Vertreter (kleinster Schlüssel) und die Transformation zurück"""
+    x_bits = position_key & _CELL_MASK
+    o_bits = position_key >> CELL_COUNT
+    best_key = position_key
+    best_transform = 0
+    for transform in range(1, len(_MASK_TABLES)):
+        table = _MASK_TABLES[transform]
+        key = table[x_bits] | (table[o_bits] << CELL_COUNT)
+        if key < best_key:
+            best_key = key
+            best_transform = transform
+    return best_key, best_transform
+
+
+def canonical_key(position_key: int) -> int:
+    """Gibt nur den kanonischen Schlüssel zurück (z.B. für Caches)"""
+    return canonicalize(position_key)[0]
+
+
+def to_canonical_move(index: int, transform: int) -> int:
+    """Bildet einen Feldindex der Originalstellung in die kanonische Stellung ab"""
+    return PERMUTATIONS[transform][index]
+
+
+def from_canonical_move(index: int, transform: int) -> int:
+    """Bildet einen Feldindex der kanonischen Stellung zurück in die Originalstellung ab"""
+    return INVERSE_PERMUTATIONS[transform][index]
+
+
+def canonical_board(board: List[List[str]]) -> Tuple[List[List[str]], int]:
+    """Kanonisiert ein Board als Liste von Listen"""
+    bitboard = BitBoard()
+    bitboard.load_rows(board)
+    key, transform = canonicalize(bitboard.key())
+
+    canonical = BitBoard()
+    for player in (0, 1):
+        bits = (key >> (player * CELL_COUNT)) & _CELL_MASK
+        for index in range(CELL_COUNT):
+            if (bits >> index) & 1:
+                canonical.place(index, player)
+    return canonical.to_rows(), transform
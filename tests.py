@@ -8,11 +8,25 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import io
+import time
 from typing import List, Optional
 
 # Module importieren
-from game_logic import GameLogic
+from game_logic import GameLogic, STATUS_WIN_O
+from bitboard import BitBoard, WIN_MASKS, cell_index
+from computer_player import (
+    BookPlayer, MinimaxPlayer, RandomPlayer, TablePlayer, MovePolicy, create_move_policy
+)
+from solution_table import SolutionTable, base3_index
+from build_solution_table import solve_positions
+from batch_simulator import BatchSimulator, NUMPY_AVAILABLE
+from tournament import build_tasks, play_shard, run_tournament, latency_bucket
+from symmetry import (
+    PERMUTATIONS, canonicalize, canonical_board, transform_key,
+    to_canonical_move, from_canonical_move
+)
 from keypad_input import KeypadInput, InputAction
+from debounce import Debouncer, KeyEventType
 
 # Mock für Hardware-abhängige Module
 sys.modules['gpiozero'] = Mock()
@@ -20,8 +34,24 @@ sys.modules['PIL'] = Mock()
 sys.modules['luma.core.interface.serial'] = Mock()
 sys.modules['luma.oled.device'] = Mock()
 
-from display import create_display, OLEDDisplay
+from display import create_display, OLEDDisplay, DisplayWorker, load_welcome_bitmap
+from framebuffer import FrameBuffer, rows_to_pages, SET_COLUMN_ADDRESS, SET_PAGE_ADDRESS
 from game import TicTacToeGame
+from async_game import AsyncTicTacToeGame
+from virtual_devices import MemoryDevice, RecordingDisplay, ScriptedKeypad
+import latency
+from benchmarks import MEMORY_BENCHMARKS, compare as compare_benchmarks, measure_memory, run_benchmarks
+from game_record import (
+    GameLog, GameRecorder, RESULT_DRAW, RESULT_O, RESULT_UNFINISHED, RESULT_X, record_size
+)
+from opening_book import OpeningBook
+from mcts import MCTSPlayer
+from game_server import GameServer
+from server_load_test import run_load
+from build_opening_book import update_book
+from state_file import SLOT_HEADER, SLOT_SIZE, StateFile
+import asyncio
+import threading
 
 
 class TestGameLogic(unittest.TestCase):
@@ -44,7 +74,7 @@ class TestGameLogic(unittest.TestCase):
         # Spiel sollte nicht beendet sein
         self.assertFalse(self.game.game_over)
         self.assertIsNone(self.game.winner)
-        self.assertEqual(self.game.winning_line, [])
+        self.assertEqual(self.game.winning_line, ())
     
     def test_valid_moves(self):
         """Test für gültige Züge"""
@@ -93,7 +123,7 @@ class TestGameLogic(unittest.TestCase):
         
         self.assertTrue(self.game.game_over)
         self.assertEqual(self.game.winner, "X")
-        self.assertEqual(self.game.winning_line, [(0, 0), (0, 1), (0, 2)])
+        self.assertEqual(self.game.winning_line, ((0, 0), (0, 1), (0, 2)))
     
     def test_win_conditions_columns(self):
         """Test für Gewinn in Spalten"""
@@ -107,7 +137,7 @@ class TestGameLogic(unittest.TestCase):
         
         self.assertTrue(self.game.game_over)
         self.assertEqual(self.game.winner, "O")
-        self.assertEqual(self.game.winning_line, [(0, 0), (1, 0), (2, 0)])
+        self.assertEqual(self.game.winning_line, ((0, 0), (1, 0), (2, 0)))
     
     def test_win_conditions_diagonal_main(self):
         """Test für Gewinn in Hauptdiagonale"""
@@ -120,7 +150,7 @@ class TestGameLogic(unittest.TestCase):
         
         self.assertTrue(self.game.game_over)
         self.assertEqual(self.game.winner, "X")
-        self.assertEqual(self.game.winning_line, [(0, 0), (1, 1), (2, 2)])
+        self.assertEqual(self.game.winning_line, ((0, 0), (1, 1), (2, 2)))
     
     def test_win_conditions_diagonal_anti(self):
         """Test für Gewinn in Anti-Diagonale"""
@@ -134,7 +164,7 @@ class TestGameLogic(unittest.TestCase):
         
         self.assertTrue(self.game.game_over)
         self.assertEqual(self.game.winner, "O")
-        self.assertEqual(self.game.winning_line, [(0, 2), (1, 1), (2, 0)])
+        self.assertEqual(self.game.winning_line, ((0, 2), (1, 1), (2, 0)))
     
     def test_draw_game(self):
         """Test für Unentschieden"""
@@ -199,7 +229,57 @@ class TestGameLogic(unittest.TestCase):
         self.assertEqual(self.game.current_player, 0)
         self.assertFalse(self.game.game_over)
         self.assertIsNone(self.game.winner)
-        self.assertEqual(self.game.winning_line, [])
+        self.assertEqual(self.game.winning_line, ())
+    
+    def test_compact_state(self):
+        """Slots statt __dict__, Gewinnlinie aus der geteilten Tabelle"""
+        self.assertFalse(hasattr(self.game, "__dict__"))
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            self.game.make_move(row, col)
+        
+        other = GameLogic()
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            other.make_move(row, col)
+        self.assertIs(self.game.winning_line, other.winning_line)
+        
+        self.game.winning_line = [(0, 0), (1, 1), (2, 2)]
+        self.assertEqual(self.game.winning_line, ((0, 0), (1, 1), (2, 2)))
+        with self.assertRaises(ValueError):
+            self.game.winning_line = [(0, 0), (2, 2)]
+    
+    def test_public_accessors(self):
+        """Geometrie, Bitmasken und Zugliste sind ohne private Attribute lesbar"""
+        self.game.make_move(1, 1)
+        self.game.make_move(0, 2)
+        self.assertEqual(self.game.moves, (4, 2))
+        self.assertEqual(self.game.bits, (1 << 4, 1 << 2))
+        self.assertEqual(self.game.geometry.win_length, 3)
+    
+    def test_unmake_move(self):
+        """Test für das Zurücknehmen von Zügen"""
+        # Ohne Zug gibt es nichts zurückzunehmen
+        self.assertFalse(self.game.unmake_move())
+        
+        # X gewinnt in oberer Reihe
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            self.game.make_move(row, col)
+        self.assertEqual(self.game.winner, "X")
+        
+        # Gewinnzug zurücknehmen stellt den vorherigen Zustand her
+        self.assertTrue(self.game.unmake_move())
+        self.assertFalse(self.game.game_over)
+        self.assertIsNone(self.game.winner)
+        self.assertEqual(self.game.winning_line, ())
+        self.assertEqual(self.game.current_player_symbol, "X")
+        self.assertEqual(self.game.board[0], ["X", "X", "*"])
+        self.assertEqual(self.game.move_history, [(0, 0), (1, 0), (0, 1), (1, 1)])
+        
+        # Alle Züge zurücknehmen ergibt das leere Board
+        while self.game.unmake_move():
+            pass
+        expected_board = [["*" for _ in range(3)] for _ in range(3)]
+        self.assertEqual(self.game.board, expected_board)
+        self.assertEqual(self.game.current_player, 0)
     
     def test_status_messages(self):
         """Test für Statusnachrichten"""
@@ -217,6 +297,977 @@ class TestGameLogic(unittest.TestCase):
         self.assertEqual(self.game.get_status_message(), "Spieler X gewinnt!")
 
 
+class TestLargeBoards(unittest.TestCase):
+    """Tests für N×N Boards mit K-in-einer-Reihe"""
+    
+    def test_four_by_four(self):
+        """4×4 Board braucht vier in einer Reihe"""
+        game = GameLogic(size=4)
+        self.assertTrue(game.is_valid_move(3, 3))
+        self.assertFalse(game.is_valid_move(4, 0))
+        self.assertEqual(len(game.board), 4)
+        
+        for col in range(3):
+            game.make_move(0, col)  # X
+            game.make_move(1, col)  # O
+        self.assertFalse(game.game_over)
+        
+        game.make_move(0, 3)  # X
+        self.assertEqual(game.winner, "X")
+        self.assertEqual(game.winning_line, ((0, 0), (0, 1), (0, 2), (0, 3)))
+    
+    def test_gomoku_diagonal(self):
+        """15×15 mit fünf in einer Reihe auf der Anti-Diagonale"""
+        game = GameLogic(size=15, win_length=5)
+        for step in range(5):
+            game.make_move(2 + step, 12 - step)  # X
+            if step < 4:
+                game.make_move(14, step)  # O
+        
+        self.assertEqual(game.winner, "X")
+        self.assertEqual(game.winning_line, tuple((2 + step, 12 - step) for step in range(5)))
+        self.assertEqual(len(game.winning_line), game.win_length)
+    
+    def test_large_board_draw_and_undo(self):
+        """Zufallspartie auf 5×5 lässt sich vollständig zurücknehmen"""
+        game = GameLogic(size=5, win_length=4)
+        while game.make_random_move():
+            pass
+        self.assertTrue(game.game_over)
+        
+        while game.unmake_move():
+            pass
+        self.assertEqual(len(game._get_empty_positions()), 25)
+    
+    def test_invalid_geometry(self):
+        """Gewinnlänge größer als das Board ist ungültig"""
+        with self.assertRaises(ValueError):
+            GameLogic(size=3, win_length=4)
+    
+    def test_policy_fallback(self):
+        """Perfekte Strategien fallen auf großen Boards auf Zufall zurück"""
+        with patch('sys.stdout', new_callable=io.StringIO):
+            player = create_move_policy(MovePolicy.MINIMAX, board_size=5)
+        self.assertIsInstance(player, RandomPlayer)
+    
+    def test_policy_fallback_win_length(self):
+        """Auch 3×3 mit kürzerer Gewinnlänge nutzt keine 3×3 Lösungen"""
+        with patch('sys.stdout', new_callable=io.StringIO):
+            for policy in (MovePolicy.MINIMAX, MovePolicy.TABLE, MovePolicy.BOOK):
+                player = create_move_policy(policy, board_size=3, win_length=2)
+                self.assertIsInstance(player, RandomPlayer)
+
+
+class TestBitBoard(unittest.TestCase):
+    """Tests für die Bitboard-Darstellung"""
+    
+    def setUp(self):
+        """Setup vor jedem Test"""
+        self.bitboard = BitBoard()
+    
+    def test_win_masks(self):
+        """Test der 8 Gewinnmasken"""
+        self.assertEqual(len(WIN_MASKS), 8)
+        for mask in WIN_MASKS:
+            self.assertEqual(bin(mask).count("1"), 3)
+    
+    def test_place_and_empty_indices(self):
+        """Test für Setzen und freie Felder"""
+        self.bitboard.place(cell_index(1, 1), 0)
+        self.bitboard.place(cell_index(0, 2), 1)
+        
+        self.assertFalse(self.bitboard.is_empty(4))
+        self.assertEqual(self.bitboard.symbol_at(2), "O")
+        self.assertEqual(self.bitboard.empty_indices(), [0, 1, 3, 5, 6, 7, 8])
+        self.assertFalse(self.bitboard.is_full())
+    
+    def test_find_win(self):
+        """Test der Gewinnerkennung über Masken"""
+        for col in range(3):
+            self.bitboard.place(cell_index(2, col), 1)
+        
+        self.assertEqual(self.bitboard.find_win(1), 2)
+        self.assertIsNone(self.bitboard.find_win(0))
+    
+    def test_completed_line(self):
+        """place() meldet nur die durch den Zug vervollständigte Linie"""
+        self.assertIsNone(self.bitboard.place(cell_index(0, 0), 0))
+        self.assertIsNone(self.bitboard.place(cell_index(1, 1), 0))
+        self.assertEqual(self.bitboard.line_counts[0][6], 2)
+        self.assertIsNone(self.bitboard.place(cell_index(2, 2), 1))
+        self.bitboard.remove(cell_index(2, 2))
+        
+        # Dritter Stein auf der Hauptdiagonale vervollständigt Linie 6
+        self.assertEqual(self.bitboard.place(cell_index(2, 2), 0), 6)
+        
+        self.bitboard.remove(cell_index(1, 1))
+        self.assertEqual(self.bitboard.line_counts[0][6], 2)
+        self.assertEqual(self.bitboard.line_counts[0][4], 0)
+        self.assertEqual(self.bitboard.line_counts[1][6], 0)
+        self.assertIsNone(self.bitboard.find_win(0))
+        self.assertEqual(self.bitboard.bits, [1 << cell_index(0, 0) | 1 << cell_index(2, 2), 0])
+    
+    def test_geometry_completed_line_matches_counters(self):
+        """BoardGeometry.completed_line meldet dieselben Gewinne wie die Linienzähler"""
+        import random
+        from bitboard import get_geometry
+        rng = random.Random(5)
+        for size, win_length in ((3, 3), (5, 4)):
+            geometry = get_geometry(size, win_length)
+            for _ in range(50):
+                board = BitBoard(geometry)
+                cells = list(range(geometry.cell_count))
+                rng.shuffle(cells)
+                for number, index in enumerate(cells):
+                    player = number & 1
+                    completed = board.place(index, player)
+                    self.assertEqual(geometry.completed_line(board.bits[player], index), completed)
+                    if completed is not None:
+                        break
+                else:
+                    self.assertTrue(geometry.is_full(board.occupied))
+    
+    def test_load_bits_rebuilds_counters(self):
+        """load_bits() setzt die Linienzähler passend zu den Bitmasken"""
+        self.bitboard.place(cell_index(2, 0), 1)
+        self.bitboard.load_bits(1 << cell_index(0, 0) | 1 << cell_index(0, 1), 1 << cell_index(1, 1))
+        self.assertEqual(self.bitboard.line_counts[0][0], 2)
+        self.assertEqual(self.bitboard.line_counts[1][4], 1)
+        self.assertEqual(self.bitboard.line_counts[1][3], 0)
+        self.assertEqual(self.bitboard.place(cell_index(0, 2), 0), 0)
+    
+    def test_board_view_writes_through(self):
+        """Test der Kompatibilitäts-Ansicht von GameLogic.board"""
+        game = GameLogic()
+        game.board[0][0] = "O"
+        
+        self.assertFalse(game.is_valid_move(0, 0))
+        self.assertEqual(game.board[0][0], "O")
+        
+        game.board = [["X", "*", "*"], ["*", "O", "*"], ["*", "*", "*"]]
+        self.assertEqual(game._get_empty_positions(), [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)])
+    
+    def test_board_view_indexes_like_list(self):
+        """Negative Spalten zählen vom Ende, ungültige Zugriffe scheitern wie bei list"""
+        game = GameLogic()
+        game.board[1][-1] = "X"
+        game.board[0][-3] = "O"
+        
+        self.assertEqual(game.board[1][2], "X")
+        self.assertEqual(game.board[1][-1], "X")
+        self.assertFalse(game.is_valid_move(1, 2))
+        self.assertFalse(game.is_valid_move(0, 0))
+        self.assertTrue(game.is_valid_move(0, 2))
+        self.assertEqual(game.board[0][:2], ["O", "*"])
+        
+        with self.assertRaises(IndexError):
+            game.board[0][3] = "X"
+        with self.assertRaises(IndexError):
+            game.board[0][-4]
+        with self.assertRaises(TypeError):
+            game.board[0][0:2] = ["X", "X"]
+
+
+class TestComputerPlayer(unittest.TestCase):
+    """Tests für die Computer-Gegner"""
+    
+    def setUp(self):
+        """Setup vor jedem Test"""
+        self.game = GameLogic()
+        self.player = MinimaxPlayer()
+    
+    def test_empty_board_is_draw(self):
+        """Perfektes Spiel vom leeren Board endet unentschieden"""
+        self.assertEqual(self.player.evaluate(self.game), 0)
+        
+        while not self.game.game_over:
+            self.player.make_move(self.game)
+        self.assertIsNone(self.game.winner)
+    
+    def test_takes_immediate_win(self):
+        """Ein sofortiger Gewinn wird gespielt"""
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            self.game.make_move(row, col)
+        
+        self.assertEqual(self.player.best_move(self.game), (0, 2))
+    
+    def test_blocks_opponent(self):
+        """Ein drohender Gewinn des Gegners wird verhindert"""
+        for row, col in [(0, 0), (1, 1), (0, 1)]:
+            self.game.make_move(row, col)
+        
+        self.assertEqual(self.player.best_move(self.game), (0, 2))
+    
+    def test_search_leaves_game_untouched(self):
+        """Die Suche stellt den Spielzustand wieder her"""
+        self.game.make_move(1, 1)
+        board_before = [row[:] for row in self.game.board]
+        
+        self.player.best_move(self.game)
+        
+        self.assertEqual(self.game.board, board_before)
+        self.assertEqual(self.game.current_player_symbol, "O")
+    
+    def test_difficulty_zero_plays_random(self):
+        """Schwierigkeit 0 spielt ausschließlich Zufallszüge"""
+        player = MinimaxPlayer(difficulty=0.0)
+        player.rng = Mock()
+        player.rng.random.return_value = 0.5
+        player.rng.choice.side_effect = lambda moves: moves[-1]
+        
+        self.assertEqual(player.choose_move(self.game), (2, 2))
+    
+    def test_invalid_difficulty(self):
+        """Ungültige Schwierigkeit wird abgelehnt"""
+        with self.assertRaises(ValueError):
+            MinimaxPlayer(difficulty=1.5)
+    
+    def test_policy_factory(self):
+        """Test der Factory-Funktion"""
+        self.assertIsInstance(create_move_policy(), RandomPlayer)
+        self.assertIsInstance(create_move_policy(MovePolicy.MINIMAX), MinimaxPlayer)
+        self.assertIsInstance(create_move_policy(MovePolicy.TABLE), TablePlayer)
+        self.assertIsInstance(create_move_policy(MovePolicy.MCTS, board_size=7), MCTSPlayer)
+
+
+class TestMCTS(unittest.TestCase):
+    """Tests für die Monte-Carlo-Baumsuche"""
+    
+    def _game(self, moves, size=3, win_length=None):
+        game = GameLogic(size, win_length)
+        for row, col in moves:
+            game.make_move(row, col)
+        return game
+    
+    def test_takes_win_and_blocks(self):
+        """Findet den Gewinnzug und blockt eine Drohung"""
+        import random
+        player = MCTSPlayer(time_budget_ms=1000, rng=random.Random(1), max_iterations=3000)
+        self.assertEqual(player.choose_move(self._game([(0, 0), (1, 0), (0, 1), (1, 1)])), (0, 2))
+        
+        player = MCTSPlayer(time_budget_ms=1000, rng=random.Random(1), max_iterations=3000)
+        self.assertEqual(player.choose_move(self._game([(0, 0), (1, 1), (0, 1)])), (0, 2))
+    
+    def test_deadline_on_large_board(self):
+        """Das Zeitbudget wird auch auf großen Boards eingehalten"""
+        game = self._game([], size=15, win_length=5)
+        player = MCTSPlayer(time_budget_ms=50)
+        
+        start = time.perf_counter()
+        self.assertTrue(player.make_move(game))
+        self.assertLess(time.perf_counter() - start, 0.05 + 0.04)
+        self.assertGreater(player.last_iterations, 0)
+    
+    def test_tree_reuse(self):
+        """Nach Zug und Antwort wird der passende Teilbaum weiterverwendet"""
+        import random
+        game = self._game([])
+        player = MCTSPlayer(time_budget_ms=1000, rng=random.Random(2), max_iterations=2000)
+        game.make_move(*player.choose_move(game))
+        game.make_random_move()
+        
+        bits = tuple(game._bitboard.bits)
+        reused = player._reused_root(game._geometry, list(game._move_stack), bits)
+        self.assertIsNotNone(reused)
+        self.assertGreater(reused.visits, 0)
+        self.assertIsNone(reused.parent)
+        
+        # Eine andere Partie passt nicht zum gespeicherten Baum
+        self.assertIsNone(player._reused_root(game._geometry, [8, 7], bits))
+    
+    def test_no_reuse_after_restore(self):
+        """Eine geladene Stellung ohne Zugliste verwendet den alten Baum nicht weiter"""
+        import random
+        saved = self._game([(0, 0), (2, 2), (0, 1), (2, 4)], size=5, win_length=4)
+        game = GameLogic(5, 4)
+        game.restore(saved.snapshot())
+        player = MCTSPlayer(time_budget_ms=1000, rng=random.Random(3), max_iterations=500)
+        first = player.choose_move(game)
+        
+        game.reset_game()
+        game.make_move(*first)
+        bits = tuple(game._bitboard.bits)
+        self.assertIsNone(player._reused_root(game._geometry, list(game._move_stack), bits))
+        
+        player.reset()
+        self.assertIsNone(player._root)
+    
+    def test_root_parallel(self):
+        """Worker-Prozesse liefern zusätzliche Wurzel-Statistiken"""
+        game = self._game([(0, 0), (1, 0), (0, 1), (1, 1)])
+        player = MCTSPlayer(time_budget_ms=300, workers=2)
+        try:
+            self.assertEqual(player.choose_move(game), (0, 2))
+        finally:
+            player.close()
+    
+    def test_game_over(self):
+        """Beendete Partien liefern keinen Zug"""
+        game = self._game([(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        self.assertIsNone(MCTSPlayer(time_budget_ms=10).choose_move(game))
+        with self.assertRaises(ValueError):
+            MCTSPlayer(time_budget_ms=0)
+
+
+class TestSolutionTable(unittest.TestCase):
+    """Tests für die vorberechnete Lösungstabelle"""
+    
+    def setUp(self):
+        """Setup vor jedem Test"""
+        self.table = SolutionTable()
+        self.game = GameLogic()
+    
+    def tearDown(self):
+        """Mapping freigeben"""
+        self.table.close()
+    
+    def test_base3_index(self):
+        """Test der Basis-3 Kodierung"""
+        self.assertEqual(base3_index(self.game.position_key), 0)
+        
+        self.game.make_move(0, 0)  # X -> 1 * 3^0
+        self.game.make_move(0, 1)  # O -> 2 * 3^1
+        self.assertEqual(base3_index(self.game.position_key), 7)
+    
+    def test_reachable_positions(self):
+        """Es gibt genau 5478 erreichbare Stellungen"""
+        self.assertEqual(len(solve_positions()), 5478)
+    
+    def test_lookup(self):
+        """Test von bestem Zug und Spielwert"""
+        self.assertEqual(self.table.value(self.game.position_key), 0)
+        
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            self.game.make_move(row, col)
+        self.assertEqual(self.table.best_move(self.game.position_key), (0, 2))
+        self.assertGreater(self.table.value(self.game.position_key), 0)
+    
+    def test_table_player_never_loses(self):
+        """Tabellen-Spieler verliert nicht gegen Zufallszüge"""
+        player = TablePlayer()
+        opponent = RandomPlayer()
+        
+        for game_number in range(50):
+            self.game.reset_game()
+            table_side = game_number % 2
+            while not self.game.game_over:
+                mover = player if self.game.current_player == table_side else opponent
+                mover.make_move(self.game)
+            self.assertIn(self.game.winner, (None, "XO"[table_side]))
+    
+    def test_invalid_file(self):
+        """Eine ungültige Datei wird abgelehnt"""
+        import tempfile
+        with tempfile.NamedTemporaryFile(suffix=".bin") as table_file:
+            table_file.write(b"XXXX" + bytes(100))
+            table_file.flush()
+            with self.assertRaises(ValueError):
+                SolutionTable(table_file.name)
+
+
+class TestSymmetry(unittest.TestCase):
+    """Tests für die D4-Kanonisierung"""
+    
+    def test_permutations(self):
+        """Es gibt 8 verschiedene Transformationen, die erste ist die Identität"""
+        self.assertEqual(len(set(PERMUTATIONS)), 8)
+        self.assertEqual(PERMUTATIONS[0], tuple(range(9)))
+    
+    def test_corner_openings_are_equivalent(self):
+        """Alle vier Eck-Eröffnungen haben denselben kanonischen Vertreter"""
+        keys = set()
+        for row, col in [(0, 0), (0, 2), (2, 0), (2, 2)]:
+            game = GameLogic()
+            game.make_move(row, col)
+            keys.add(canonicalize(game.position_key)[0])
+        self.assertEqual(len(keys), 1)
+    
+    def test_move_round_trip(self):
+        """Züge lassen sich über die inverse Transformation zurückrechnen"""
+        game = GameLogic()
+        game.make_move(0, 2)
+        game.make_move(1, 1)
+        key, transform = canonicalize(game.position_key)
+        
+        self.assertEqual(transform_key(game.position_key, transform), key)
+        for index in range(9):
+            self.assertEqual(from_canonical_move(to_canonical_move(index, transform), transform), index)
+    
+    def test_canonical_board(self):
+        """Test der Kanonisierung auf Listen-Ebene"""
+        board, transform = canonical_board([["*", "*", "X"], ["*", "*", "*"], ["*", "*", "*"]])
+        self.assertEqual(board, [["X", "*", "*"], ["*", "*", "*"], ["*", "*", "*"]])
+        self.assertEqual(PERMUTATIONS[transform][2], 0)
+    
+    def test_reachable_canonical_positions(self):
+        """Die 5478 Stellungen reduzieren sich auf 765 kanonische"""
+        game = GameLogic()
+        canonical_keys = set()
+        visited = set()
+        
+        def visit():
+            if game.position_key in visited:
+                return
+            visited.add(game.position_key)
+            canonical_keys.add(canonicalize(game.position_key)[0])
+            if game.game_over:
+                return
+            for row, col in game._get_empty_positions():
+                game.make_move(row, col)
+                visit()
+                game.unmake_move()
+        
+        visit()
+        self.assertEqual(len(canonical_keys), 765)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy nicht installiert")
+class TestBatchSimulator(unittest.TestCase):
+    """Tests für den NumPy Batch-Simulator"""
+    
+    def test_random_games_are_consistent(self):
+        """Gewinner und Gewinnlinien passen zu den Boards"""
+        simulator = BatchSimulator(500, seed=7)
+        simulator.play()
+        
+        boards = simulator.boards
+        for game, (winner, line) in enumerate(zip(simulator.results(), simulator.winning_lines())):
+            cells = boards[game].tolist()
+            if winner is None:
+                self.assertNotIn(0, cells)
+                self.assertEqual(line, ())
+            else:
+                expected = 1 if winner == "X" else 2
+                for row, col in line:
+                    self.assertEqual(cells[row * 3 + col], expected)
+        
+        x_wins, o_wins, draws = simulator.summary()
+        self.assertEqual(x_wins + o_wins + draws, 500)
+    
+    def test_policy_matches_game_logic(self):
+        """Eine Policy-Partie liefert dasselbe Ergebnis wie GameLogic"""
+        def first_free(boards, player, active):
+            return (boards != 0).argmin(axis=1)
+        
+        simulator = BatchSimulator(3)
+        simulator.play(first_free)
+        
+        game = GameLogic()
+        while not game.game_over:
+            game.make_move(*game._get_empty_positions()[0])
+        
+        self.assertEqual(simulator.results(), [game.winner] * 3)
+        self.assertEqual(simulator.winning_lines(), [game.winning_line] * 3)
+    
+    def test_policy_on_occupied_cell(self):
+        """Eine Policy darf kein belegtes Feld wählen"""
+        simulator = BatchSimulator(2)
+        simulator.step(lambda boards, player, active: [4, 4])
+        with self.assertRaises(ValueError):
+            simulator.step(lambda boards, player, active: [4, 4])
+
+
+class TestTournament(unittest.TestCase):
+    """Tests für den Turnier-Runner"""
+    
+    def test_build_tasks(self):
+        """Partien werden vollständig auf Shards verteilt"""
+        tasks = build_tasks(["random", "minimax", "table"], games=10, shards=4, seed=1)
+        
+        self.assertEqual(len(tasks), 3 * 4)
+        per_pairing = {}
+        for name_a, name_b, games, seed in tasks:
+            per_pairing[(name_a, name_b)] = per_pairing.get((name_a, name_b), 0) + games
+        self.assertEqual(set(per_pairing.values()), {10})
+        self.assertEqual(len({task[3] for task in tasks}), len(tasks))
+    
+    def test_shard_is_deterministic(self):
+        """Gleicher Seed ergibt gleiche Ergebnisse"""
+        first = play_shard(("random", "random", 20, 42))
+        second = play_shard(("random", "random", 20, 42))
+        
+        for field in ("wins_a", "wins_b", "draws"):
+            self.assertEqual(first[field], second[field])
+        self.assertEqual(first["wins_a"] + first["wins_b"] + first["draws"], 20)
+    
+    def test_latency_bucket(self):
+        """Test der Histogramm-Buckets"""
+        self.assertEqual(latency_bucket(0.0000005), 0)
+        self.assertEqual(latency_bucket(0.000003), 2)
+        self.assertEqual(latency_bucket(0.001), 10)
+    
+    def test_run_tournament(self):
+        """Perfekte Spieler verlieren nie"""
+        report = run_tournament(["random", "table"], games=20, workers=2, seed=3)
+        
+        entry = report["table"]["random vs table"]
+        self.assertEqual(entry["wins_a"], 0)
+        self.assertEqual(entry["wins_b"] + entry["draws"], 20)
+        self.assertIn("table", report["latency"])
+
+
+class TestGameRecord(unittest.TestCase):
+    """Tests für das binäre Partie-Log"""
+    
+    def setUp(self):
+        import os
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.ttg")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def _play(self, game, moves):
+        for row, col in moves:
+            game.make_move(row, col)
+    
+    def test_record_and_replay(self):
+        """Beendete Partien werden gespeichert und lassen sich nachspielen"""
+        recorder = GameRecorder(self.path)
+        game = GameLogic(recorder=recorder)
+        self._play(game, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        game.reset_game()
+        self._play(game, [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)])
+        recorder.close()
+        
+        with GameLog(self.path) as log:
+            self.assertEqual(len(log), 2)
+            first, second = list(log)
+            self.assertEqual(first.result, RESULT_X)
+            self.assertEqual(first.moves, (0, 3, 1, 4, 2))
+            self.assertEqual(second.result, RESULT_DRAW)
+            self.assertEqual(len(second.moves), 9)
+            
+            replayed = log.replay(log[0])
+            self.assertEqual(replayed.winner, "X")
+            self.assertEqual(replayed.winning_line, ((0, 0), (0, 1), (0, 2)))
+    
+    def test_reset_records_unfinished_game(self):
+        """Ein Reset mitten in der Partie speichert sie als abgebrochen"""
+        recorder = GameRecorder(self.path)
+        game = GameLogic(recorder=recorder)
+        self._play(game, [(1, 1), (0, 0)])
+        game.reset_game()
+        game.reset_game()
+        recorder.close()
+        
+        with GameLog(self.path) as log:
+            self.assertEqual(len(log), 1)
+            self.assertEqual(log[-1].result, RESULT_UNFINISHED)
+            self.assertEqual(log[-1].moves, (4, 0))
+    
+    def test_search_is_not_recorded(self):
+        """Suchzüge des Minimax-Spielers landen nicht im Log"""
+        recorder = GameRecorder(self.path)
+        game = GameLogic(recorder=recorder)
+        game.make_move(1, 1)
+        MinimaxPlayer().choose_move(game)
+        self.assertIs(game.recorder, recorder)
+        recorder.close()
+        
+        with GameLog(self.path) as log:
+            self.assertEqual(len(log), 0)
+    
+    def test_truncated_record_is_dropped(self):
+        """Ein halb geschriebener Record wird beim erneuten Öffnen abgeschnitten"""
+        import os
+        recorder = GameRecorder(self.path)
+        game = GameLogic(recorder=recorder)
+        self._play(game, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        recorder.close()
+        with open(self.path, "ab") as log_file:
+            log_file.write(b"\x01\x02\x03")
+        
+        recorder = GameRecorder(self.path)
+        game.recorder = recorder
+        game.reset_game()
+        self._play(game, [(2, 2), (0, 0), (2, 1), (0, 1), (2, 0)])
+        recorder.close()
+        
+        self.assertEqual((os.path.getsize(self.path) - 8) % record_size(3), 0)
+        with GameLog(self.path) as log:
+            self.assertEqual([record.moves[0] for record in log], [0, 8])
+    
+    def test_torn_header_is_rewritten(self):
+        """Ein beim ersten Schreiben abgerissener Header verhindert den nächsten Start nicht"""
+        with open(self.path, "wb") as log_file:
+            log_file.write(b"TTG")
+        recorder = GameRecorder(self.path)
+        game = GameLogic(recorder=recorder)
+        self._play(game, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        recorder.close()
+        with GameLog(self.path) as log:
+            self.assertEqual(len(log), 1)
+        
+        # Fremde Dateien werden weiterhin nicht überschrieben
+        with open(self.path, "wb") as log_file:
+            log_file.write(b"abc")
+        with self.assertRaises(ValueError):
+            GameRecorder(self.path)
+    
+    def test_flush_if_due(self):
+        """Gepufferte Records gehen nach sync_interval auch ohne weiteren Record auf die Platte"""
+        import os
+        recorder = GameRecorder(self.path, sync_interval=3600)
+        game = GameLogic(recorder=recorder)
+        self._play(game, [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        self.assertFalse(recorder.flush_if_due())
+        self.assertEqual(os.path.getsize(self.path), 0)
+        
+        recorder.sync_interval = 0
+        self.assertTrue(recorder.flush_if_due())
+        self.assertEqual(os.path.getsize(self.path), 8 + record_size(3))
+        self.assertFalse(recorder.flush_if_due())
+        recorder.close()
+    
+    def test_board_mismatch(self):
+        """Ein Log gehört zu genau einer Board-Geometrie"""
+        GameRecorder(self.path).close()
+        with self.assertRaises(ValueError):
+            GameRecorder(self.path, size=4)
+        with self.assertRaises(ValueError):
+            GameRecorder(self.path + "5", size=5)
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Tests für das Eröffnungsbuch aus aufgezeichneten Partien"""
+    
+    # X gewinnt über die obere Reihe, nachdem O in der Mitte beginnt zu antworten
+    X_WINS = (0, 4, 1, 7, 2)
+    # O gewinnt, nachdem X in die Ecke und O in die Kante antwortet
+    O_WINS = (0, 1, 3, 4, 8, 7)
+    
+    def test_statistics_are_symmetric(self):
+        """Gespiegelte Partien landen in derselben Stellung"""
+        book = OpeningBook()
+        book.add_game(self.X_WINS, RESULT_X)
+        # Dieselbe Partie an der vertikalen Achse gespiegelt
+        book.add_game((2, 4, 1, 7, 0), RESULT_X)
+        book.add_game((4, 0), RESULT_UNFINISHED)
+        
+        # Beide Eck-Eröffnungen sind ein Eintrag, die abgebrochene Partie zählt nicht
+        moves = book.lookup(0)
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0].games, 2)
+        self.assertEqual(moves[0].score, 1.0)
+        
+        # Nach X oben rechts wird die gespiegelte Antwort in Originalkoordinaten geliefert
+        game = GameLogic()
+        game.make_move(0, 2)
+        self.assertEqual([(move.row, move.col) for move in book.lookup(game.position_key)], [(1, 1)])
+    
+    def test_best_move_exploits_statistics(self):
+        """Der Zug mit der besten Quote für den Ziehenden wird gewählt"""
+        book = OpeningBook()
+        for _ in range(3):
+            book.add_game(self.O_WINS, RESULT_O)
+        book.add_game(self.X_WINS, RESULT_X)
+        
+        game = GameLogic()
+        game.make_move(0, 0)
+        # O antwortet auf die Ecke mit dem Zug, der bisher gewonnen hat
+        self.assertEqual(book.best_move(game.position_key), (0, 1))
+        self.assertIsNone(book.best_move(game.position_key, min_games=4))
+        self.assertIsNone(book.best_move(GameLogic().position_key, min_games=5))
+    
+    def test_player_falls_back_to_random(self):
+        """Unbekannte Stellungen werden zufällig gespielt"""
+        book = OpeningBook()
+        for _ in range(5):
+            book.add_game(self.X_WINS, RESULT_X)
+        player = BookPlayer(min_games=5, book=book)
+        
+        game = GameLogic()
+        self.assertIn(player.choose_move(game), [(0, 0), (0, 2), (2, 0), (2, 2)])
+        game.make_move(1, 0)
+        self.assertTrue(player.make_move(game))
+        self.assertEqual(len(game.move_history), 2)
+    
+    def test_seeded_fallback_is_reproducible(self):
+        """Zufallszüge außerhalb des Buchs kommen aus rng, nicht aus dem globalen random"""
+        import random
+        histories = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            player = BookPlayer(book=OpeningBook(), rng=random.Random(7))
+            game = GameLogic()
+            while player.make_move(game):
+                pass
+            histories.append(game.move_history)
+        self.assertEqual(histories[0], histories[1])
+    
+    def test_incremental_build(self):
+        """Neue Records eines Logs werden nachgetragen, gespeichert und geladen"""
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "games.ttg")
+            book_path = os.path.join(directory, "book.bin")
+            
+            recorder = GameRecorder(log_path)
+            game = GameLogic(recorder=recorder)
+            for cell in self.X_WINS:
+                game.make_move(*divmod(cell, 3))
+            recorder.sync()
+            self.assertEqual(update_book(book_path, log_path).indexed_records(log_path), 1)
+            
+            game.reset_game()
+            for cell in self.O_WINS:
+                game.make_move(*divmod(cell, 3))
+            recorder.close()
+            
+            book = update_book(book_path, log_path)
+            self.assertEqual(book.indexed_records(log_path), 2)
+            loaded = OpeningBook.load(book_path)
+            self.assertEqual(loaded.indexed_records(log_path), 2)
+            self.assertEqual(loaded.lookup(0), book.lookup(0))
+            self.assertEqual(loaded.lookup(0)[0].games, 2)
+    
+    def test_progress_per_log(self):
+        """Ein zweites Log wird von vorn indiziert, auch wenn es kürzer ist"""
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            book_path = os.path.join(directory, "book.bin")
+            paths = []
+            for name, games in (("kiosk1.ttg", 3), ("kiosk2.ttg", 1)):
+                paths.append(os.path.join(directory, name))
+                recorder = GameRecorder(paths[-1])
+                game = GameLogic(recorder=recorder)
+                for _ in range(games):
+                    game.reset_game()
+                    for cell in self.X_WINS:
+                        game.make_move(*divmod(cell, 3))
+                recorder.close()
+            
+            update_book(book_path, paths[0])
+            book = update_book(book_path, paths[1])
+            self.assertEqual(book.indexed_records(paths[0]), 3)
+            self.assertEqual(book.indexed_records(paths[1]), 1)
+            self.assertEqual(book.lookup(0)[0].games, 4)
+            self.assertEqual(OpeningBook.load(book_path).indexed, book.indexed)
+
+
+class TestGameServer(unittest.TestCase):
+    """Tests für den Multi-Session Spiel-Server"""
+    
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.server = GameServer(idle_timeout=10.0, max_sessions=3, clock=self.clock)
+    
+    def test_protocol(self):
+        """Partie über Protokollzeilen bis zum Gewinn"""
+        self.assertEqual(self.server.handle_line("NEW"), "OK 1 ********* X")
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            self.server.handle_line(f"MOVE 1 {row} {col}")
+        self.assertEqual(self.server.handle_line("move 1 0 2"), "OK 1 XXXOO**** WIN_X")
+        self.assertEqual(self.server.handle_line("MOVE 1 2 2"), "ERR ungültiger Zug")
+        self.assertEqual(self.server.handle_line("RESET 1"), "OK 1 ********* X")
+        self.assertTrue(self.server.handle_line("RANDOM 1").endswith(" O"))
+        self.assertEqual(self.server.handle_line("STATS"), "OK sessions=1 moves=6 evicted=0")
+        self.assertEqual(self.server.handle_line("CLOSE 1"), "OK 1")
+        
+        self.assertEqual(self.server.handle_line("STATE 1"), "ERR unbekannte Partie")
+        self.assertEqual(self.server.handle_line("MOVE x"), "ERR ungültige Argumente")
+        self.assertTrue(self.server.handle_line("JUMP").startswith("ERR"))
+    
+    def test_draw(self):
+        """Volles Board ohne Linie endet unentschieden"""
+        self.server.handle_line("NEW")
+        moves = [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)]
+        for row, col in moves:
+            response = self.server.handle_line(f"MOVE 1 {row} {col}")
+        self.assertTrue(response.endswith(" DRAW"))
+    
+    def test_idle_eviction(self):
+        """Inaktive Partien werden entfernt, aktive bleiben"""
+        for _ in range(3):
+            self.server.handle_line("NEW")
+        self.clock.now = 8.0
+        self.server.handle_line("STATE 1")
+        self.clock.now = 12.0
+        
+        self.assertEqual(self.server.evict_idle(), 2)
+        self.assertEqual(list(self.server.sessions), [1])
+        self.assertEqual(self.server.evicted, 2)
+    
+    def test_session_limit(self):
+        """Volle Server entfernen zuerst inaktive Partien"""
+        for _ in range(3):
+            self.server.handle_line("NEW")
+        self.assertEqual(self.server.handle_line("NEW"), "ERR zu viele Partien")
+        self.clock.now = 20.0
+        self.assertTrue(self.server.handle_line("NEW").startswith("OK 4 "))
+    
+    def test_load_over_socket(self):
+        """Lastgenerator spielt über TCP gegen den Server"""
+        async def scenario():
+            game_server = GameServer()
+            server = await game_server.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await run_load(connections=3, duration=0.3, port=port), game_server
+        
+        result, game_server = asyncio.run(scenario())
+        self.assertGreater(result["games"], 0)
+        self.assertEqual(result["moves"], game_server.moves)
+        self.assertEqual(len(game_server.sessions), 0)
+        self.assertIn("p99_ms", result["latency"])
+
+
+class TestStateFile(unittest.TestCase):
+    """Tests für Snapshots und die Spielstand-Datei"""
+    
+    def setUp(self):
+        import os
+        import tempfile
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "state.bin")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_snapshot_roundtrip(self):
+        """Laufende, gewonnene und unentschiedene Partien überstehen snapshot/restore"""
+        games = [
+            [(1, 1), (0, 0)],
+            [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)],
+            [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1), (2, 0), (2, 2)],
+        ]
+        for moves in games:
+            game = GameLogic()
+            for row, col in moves:
+                game.make_move(row, col)
+            data = game.snapshot()
+            self.assertEqual(len(data), 10)
+            
+            restored = GameLogic()
+            restored.restore(data)
+            self.assertEqual(restored.board, game.board)
+            self.assertEqual(restored.current_player, game.current_player)
+            self.assertEqual(restored.game_over, game.game_over)
+            self.assertEqual(restored.winner, game.winner)
+            self.assertEqual(restored.winning_line, game.winning_line)
+            self.assertEqual(restored.snapshot(), data)
+            self.assertFalse(restored.unmake_move())
+    
+    def test_from_snapshot_and_validation(self):
+        """Die Geometrie kommt aus dem Snapshot, fremde oder kaputte Daten werden abgelehnt"""
+        game = GameLogic(4, 3)
+        game.make_move(3, 3)
+        restored = GameLogic.from_snapshot(game.snapshot())
+        self.assertEqual((restored.size, restored.win_length), (4, 3))
+        self.assertEqual(restored.board[3][3], "X")
+        self.assertEqual(restored.current_player_symbol, "O")
+        
+        with self.assertRaises(ValueError):
+            GameLogic().restore(game.snapshot())
+        corrupt = bytearray(GameLogic().snapshot())
+        corrupt[-1] = corrupt[-3] = 1
+        with self.assertRaises(ValueError):
+            GameLogic().restore(bytes(corrupt))
+        with self.assertRaises(ValueError):
+            GameLogic.from_snapshot(b"")
+    
+    def test_restore_checks_winning_line(self):
+        """Die Gewinnlinie muss vollständig mit Steinen des Gewinners belegt sein"""
+        game = GameLogic()
+        for row, col in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            game.make_move(row, col)
+        data = bytearray(game.snapshot())
+        
+        wrong_winner = bytearray(data)
+        wrong_winner[3] = STATUS_WIN_O
+        wrong_line = bytearray(data)
+        wrong_line[4] = (data[4] + 1) % len(game.geometry.lines)
+        for corrupt in (wrong_winner, wrong_line):
+            with self.assertRaises(ValueError):
+                GameLogic().restore(bytes(corrupt))
+    
+    def test_restored_game_is_not_recorded(self):
+        """Eine fortgesetzte Partie landet nicht im Partie-Log (nicht nachspielbar)"""
+        import os
+        saved = GameLogic()
+        saved.make_move(1, 1)
+        log_path = os.path.join(self.directory.name, "games.ttg")
+        recorder = GameRecorder(log_path)
+        game = GameLogic(recorder=recorder)
+        game.restore(saved.snapshot())
+        for row, col in [(0, 0), (2, 2), (0, 1), (2, 0), (0, 2)]:
+            game.make_move(row, col)
+        self.assertEqual(game.winner, "O")
+        recorder.close()
+        with GameLog(log_path) as log:
+            self.assertEqual(len(log), 0)
+    
+    def test_save_and_reload(self):
+        """Nur geänderte Stände werden geschrieben, der neueste gewinnt"""
+        game = GameLogic()
+        state = StateFile(self.path)
+        self.assertIsNone(state.load())
+        for row, col in [(0, 0), (1, 1), (2, 2)]:
+            game.make_move(row, col)
+            self.assertTrue(state.save(game.snapshot(), force=True))
+        self.assertFalse(state.save(game.snapshot(), force=True))
+        self.assertEqual(state.writes, 3)
+        state.close()
+        
+        import os
+        self.assertEqual(os.path.getsize(self.path), 2 * SLOT_SIZE)
+        state = StateFile(self.path)
+        self.assertEqual(state.load(), game.snapshot())
+        state.close()
+    
+    def test_interval_limits_writes(self):
+        """Ohne force wird höchstens einmal pro Intervall geschrieben"""
+        clock = Mock(return_value=0.0)
+        state = StateFile(self.path, interval=5.0, clock=clock)
+        game = GameLogic()
+        game.make_move(0, 0)
+        self.assertTrue(state.save(game.snapshot()))
+        game.make_move(1, 1)
+        clock.return_value = 1.0
+        self.assertFalse(state.save(game.snapshot()))
+        clock.return_value = 5.0
+        self.assertTrue(state.save(game.snapshot()))
+        state.close()
+    
+    def test_torn_write_falls_back(self):
+        """Ein beschädigter neuester Slot fällt auf den vorherigen Stand zurück"""
+        game = GameLogic()
+        state = StateFile(self.path)
+        game.make_move(0, 0)
+        state.save(game.snapshot(), force=True)
+        older = game.snapshot()
+        game.make_move(1, 1)
+        state.save(game.snapshot(), force=True)
+        state.close()
+        
+        # Zweiter Schreibvorgang landete in Slot 0: Snapshot darin beschädigen
+        with open(self.path, "r+b") as state_file:
+            state_file.seek(SLOT_HEADER.size)
+            state_file.write(b"\xff")
+        state = StateFile(self.path)
+        self.assertEqual(state.load(), older)
+        state.close()
+    
+    def test_game_resumes_on_start(self):
+        """TicTacToeGame setzt nach einem Neustart die gespeicherte Partie fort"""
+        # Erste Taste schließt nur den Willkommensbildschirm
+        keys = [(3, 1), (0, 0), (1, 1), (0, 1)]
+        first = TicTacToeGame(display=Mock(), keypad=ScriptedKeypad(keys),
+                              state_file=StateFile(self.path))
+        first.start()
+        
+        second = TicTacToeGame(display=Mock(), keypad=ScriptedKeypad([(3, 1)]),
+                               state_file=StateFile(self.path))
+        second.start()
+        self.assertEqual(second.game_logic.board[0][:2], ["X", "X"])
+        self.assertEqual(second.game_logic.board[1][1], "O")
+        self.assertEqual(second.game_logic.current_player_symbol, "O")
+
+
 class TestKeypadInput(unittest.TestCase):
     """Tests für KeypadInput Klasse"""
     
@@ -248,6 +1299,11 @@ class TestKeypadInput(unittest.TestCase):
         self.assertEqual(action, InputAction.RESET_GAME)
         self.assertIsNone(data)
         
+        # Keypad-Fenster weiterschalten
+        action, data = self.keypad.map_key_to_action((3, 1))
+        self.assertEqual(action, InputAction.NEXT_PAGE)
+        self.assertIsNone(data)
+        
         # Zufälliger Zug
         action, data = self.keypad.map_key_to_action((3, 2))
         self.assertEqual(action, InputAction.RANDOM_MOVE)
@@ -270,6 +1326,196 @@ class TestKeypadInput(unittest.TestCase):
             mock_col.close.assert_called_once()
 
 
+class _FakeMatrix:
+    """Simuliert die Keypad-Matrix: eine gedrückte Taste verbindet Reihe und Spalte"""
+    
+    def __init__(self):
+        self.pressed_key = None
+        self.rows = [_FakeRow() for _ in range(4)]
+        self.cols = [_FakeColumn(self, j) for j in range(4)]
+
+
+class _FakeRow:
+    def __init__(self):
+        self.value = False
+    
+    def on(self):
+        self.value = True
+    
+    def off(self):
+        self.value = False
+    
+    def close(self):
+        pass
+
+
+class _FakeColumn:
+    def __init__(self, matrix: _FakeMatrix, column: int):
+        self.matrix = matrix
+        self.column = column
+        self.when_pressed = None
+    
+    @property
+    def is_pressed(self) -> bool:
+        key = self.matrix.pressed_key
+        return key is not None and key[1] == self.column and self.matrix.rows[key[0]].value
+    
+    def close(self):
+        pass
+
+
+class TestEdgeTriggeredKeypad(unittest.TestCase):
+    """Tests für den Interrupt-Betrieb des Keypads"""
+    
+    def setUp(self):
+        """Keypad mit simulierter Matrix"""
+        self.matrix = _FakeMatrix()
+        with patch('keypad_input.DigitalOutputDevice', side_effect=self.matrix.rows), \
+                patch('keypad_input.Button', side_effect=self.matrix.cols):
+            self.keypad = KeypadInput(edge_triggered=True)
+        self.keypad.EDGE_SETTLE_DELAY = 0
+    
+    def press(self, key):
+        """Simuliert einen Tastendruck inklusive Flanken-Callback"""
+        self.matrix.pressed_key = key
+        self.matrix.cols[key[1]].when_pressed()
+    
+    def test_rows_idle_high(self):
+        """Im Leerlauf liegen alle Reihen auf High"""
+        self.assertTrue(all(row.value for row in self.matrix.rows))
+        self.assertTrue(all(col.when_pressed for col in self.matrix.cols))
+    
+    def test_press_is_queued(self):
+        """Eine Flanke ermittelt die Reihe und stellt die Taste in die Queue"""
+        self.press((2, 1))
+        
+        self.assertEqual(self.keypad.wait_for_input(0.01), (2, 1))
+        self.assertIsNone(self.keypad.wait_for_input(0.01))
+        self.assertTrue(all(row.value for row in self.matrix.rows))
+    
+    def test_same_key_twice(self):
+        """Jeder Druck erzeugt ein eigenes Ereignis"""
+        self.press((3, 0))
+        self.press((3, 0))
+        
+        self.assertEqual(self.keypad.get_input_with_debounce(), (3, 0))
+        self.assertEqual(self.keypad.get_input_with_debounce(), (3, 0))
+    
+    def test_edges_during_scan_are_ignored(self):
+        """Flanken, die der Scan selbst erzeugt, lösen keinen zweiten Scan aus"""
+        self.keypad._scan_lock.acquire()
+        try:
+            self.press((0, 0))
+        finally:
+            self.keypad._scan_lock.release()
+        
+        self.assertIsNone(self.keypad.get_input_with_debounce())
+
+
+class _FakeClock:
+    """Simulierte Uhr für zeitbasierte Tests"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDebouncer(unittest.TestCase):
+    """Tests für die zeitbasierte Entprellung"""
+    
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.debouncer = Debouncer(press_time=0.02, release_time=0.05, clock=self.clock)
+    
+    def sample(self, at, *keys):
+        """Tastet zum Zeitpunkt at mit den gegebenen geschlossenen Tasten ab"""
+        self.clock.now = at
+        return [(event.type, event.key) for event in self.debouncer.update(keys)]
+    
+    def test_press_and_release_after_stable_time(self):
+        """Pegelwechsel werden erst nach der Stabilzeit bestätigt"""
+        self.assertEqual(self.sample(0.000, (1, 1)), [])
+        self.assertEqual(self.sample(0.010, (1, 1)), [])
+        self.assertEqual(self.sample(0.020, (1, 1)), [(KeyEventType.PRESS, (1, 1))])
+        self.assertTrue(self.debouncer.is_pressed((1, 1)))
+        
+        self.assertEqual(self.sample(0.030), [])
+        self.assertEqual(self.sample(0.079), [])
+        self.assertEqual(self.sample(0.080), [(KeyEventType.RELEASE, (1, 1))])
+        self.assertEqual(self.debouncer.pressed_keys, [])
+    
+    def test_bounces_are_filtered(self):
+        """Kurze Störimpulse erzeugen keine Ereignisse"""
+        self.assertEqual(self.sample(0.000, (0, 0)), [])
+        self.assertEqual(self.sample(0.005), [])
+        self.assertEqual(self.sample(0.010, (0, 2)), [])
+        self.assertEqual(self.sample(0.015), [])
+        self.assertEqual(self.sample(0.100), [])
+        
+        # Prellen während gehaltener Taste löst keinen zweiten Druck aus
+        self.sample(0.200, (2, 2))
+        self.assertEqual(self.sample(0.225, (2, 2)), [(KeyEventType.PRESS, (2, 2))])
+        self.assertEqual(self.sample(0.230), [])
+        self.assertEqual(self.sample(0.240, (2, 2)), [])
+        self.assertEqual(self.sample(0.300, (2, 2)), [])
+    
+    def test_same_key_twice(self):
+        """Dieselbe Taste kann nach dem Loslassen erneut gedrückt werden"""
+        presses = []
+        for start in (0.0, 1.0):
+            presses += self.sample(start, (3, 0)) + self.sample(start + 0.03, (3, 0))
+            self.sample(start + 0.1)
+            self.sample(start + 0.2)
+        self.assertEqual(presses, [(KeyEventType.PRESS, (3, 0))] * 2)
+    
+    def test_auto_repeat(self):
+        """Gehaltene Tasten wiederholen nach der Verzögerung im festen Takt"""
+        debouncer = Debouncer(press_time=0, repeat_delay=0.5, repeat_interval=0.1, clock=self.clock)
+        types = []
+        for step in range(8):
+            self.clock.now = step * 0.1
+            types += [event.type for event in debouncer.update([(0, 1)])]
+        self.assertEqual(types, [KeyEventType.PRESS, KeyEventType.REPEAT, KeyEventType.REPEAT,
+                                 KeyEventType.REPEAT])
+    
+    def test_time_to_settle(self):
+        """Zeit bis zur nächsten möglichen Bestätigung"""
+        self.assertIsNone(self.debouncer.time_to_settle())
+        self.sample(1.0, (0, 0))
+        self.clock.now = 1.005
+        self.assertAlmostEqual(self.debouncer.time_to_settle(), 0.015)
+    
+    def test_invalid_times(self):
+        """Negative Zeiten werden abgelehnt"""
+        with self.assertRaises(ValueError):
+            Debouncer(press_time=-1)
+        with self.assertRaises(ValueError):
+            Debouncer(repeat_delay=-0.1)
+    
+    def test_polling_keypad_reports_repeated_presses(self):
+        """Im Polling-Betrieb wird dieselbe Taste zweimal hintereinander erkannt"""
+        matrix = _FakeMatrix()
+        with patch('keypad_input.DigitalOutputDevice', side_effect=matrix.rows), \
+                patch('keypad_input.Button', side_effect=matrix.cols):
+            keypad = KeypadInput(debouncer=Debouncer(0.02, 0.05, clock=self.clock))
+        keypad.SCAN_DELAY = 0
+        
+        keys = []
+        for start in (0.0, 1.0):
+            matrix.pressed_key = (3, 0)
+            for offset in (0.0, 0.03):
+                self.clock.now = start + offset
+                keys.append(keypad.get_input_with_debounce())
+            matrix.pressed_key = None
+            for offset in (0.1, 0.2):
+                self.clock.now = start + offset
+                keys.append(keypad.get_input_with_debounce())
+        
+        self.assertEqual(keys, [None, (3, 0), None, None] * 2)
+
+
 class TestDisplay(unittest.TestCase):
     """Tests für Display-Funktionalität"""
     
@@ -279,6 +1525,24 @@ class TestDisplay(unittest.TestCase):
             display = create_display()
             self.assertIsNone(display)
     
+    @patch('display.OLED_AVAILABLE', True)
+    @patch('display.i2c')
+    @patch('display.ssd1306')
+    @patch('display.ImageFont')
+    def test_display_layout_for_board_size(self, mock_font, mock_ssd1306, mock_i2c):
+        """Zellgröße passt sich der Board-Größe an"""
+        display = create_display(board_size=3)
+        self.assertEqual((display.cell_size, display.grid_size), (15, 45))
+        
+        display = create_display(board_size=15)
+        self.assertEqual((display.cell_size, display.grid_size), (3, 45))
+        
+        # Kleine Zellen zeichnen Linien statt Text
+        draw = Mock()
+        display._draw_symbol_at_position(draw, "X", 0, 0, 0, 0)
+        self.assertEqual(draw.line.call_count, 2)
+        draw.textbbox.assert_not_called()
+    
     @patch('display.OLED_AVAILABLE', True)
     @patch('display.i2c')
     @patch('display.ssd1306')
@@ -291,10 +1555,189 @@ class TestDisplay(unittest.TestCase):
         display = create_display()
         self.assertIsNotNone(display)
         
+        # Schriftarten werden erst bei Bedarf geladen
+        mock_font.truetype.assert_not_called()
+        self.assertIs(display.font_small, mock_font.load_default.return_value)
+        
         # Font fallback sollte funktioniert haben
         self.assertEqual(mock_font.load_default.call_count, 3)
 
 
+class _FakeImage:
+    """1-Bit Bild mit zeilenweise gepackten Pixeln wie PIL Modus '1'"""
+    
+    def __init__(self, width: int = 128, height: int = 64):
+        self.width = width
+        self.rows = bytearray(width * height // 8)
+    
+    def set_pixel(self, x: int, y: int) -> None:
+        self.rows[y * self.width // 8 + x // 8] |= 0x80 >> (x % 8)
+    
+    def tobytes(self) -> bytes:
+        return bytes(self.rows)
+
+
+class TestFrameBuffer(unittest.TestCase):
+    """Tests für die Dirty-Region Übertragung"""
+    
+    def test_rows_to_pages(self):
+        """Pixel landen im richtigen Page-Byte und Bit"""
+        image = _FakeImage()
+        image.set_pixel(0, 0)
+        image.set_pixel(9, 11)
+        
+        pages = rows_to_pages(image.tobytes(), 128, 64)
+        self.assertEqual(pages[0], 0x01)
+        self.assertEqual(pages[128 + 9], 0x08)
+        self.assertEqual(sum(1 for value in pages if value), 2)
+    
+    def test_diff(self):
+        """Nur geänderte Spaltenbereiche pro Page werden gemeldet"""
+        framebuffer = FrameBuffer(128, 64)
+        image = _FakeImage()
+        self.assertIsNone(framebuffer.diff(rows_to_pages(image.tobytes(), 128, 64)))
+        
+        image.set_pixel(40, 20)
+        image.set_pixel(44, 22)
+        image.set_pixel(5, 63)
+        regions = framebuffer.diff(rows_to_pages(image.tobytes(), 128, 64))
+        self.assertEqual(regions, [(2, 40, 44), (7, 5, 5)])
+        self.assertEqual(list(framebuffer.region_data(regions[1])), [0x80])
+        
+        # Unveränderter Frame erzeugt keine Übertragung
+        self.assertEqual(framebuffer.diff(rows_to_pages(image.tobytes(), 128, 64)), [])
+    
+    @patch('display.OLED_AVAILABLE', True)
+    @patch('display.i2c')
+    @patch('display.ssd1306')
+    @patch('display.ImageFont')
+    def test_push_frame(self, mock_font, mock_ssd1306, mock_i2c):
+        """Erster Frame komplett, danach nur geänderte Bereiche"""
+        display = create_display()
+        image = _FakeImage()
+        
+        display._push_frame(image)
+        display.device.display.assert_called_once_with(image)
+        
+        image.set_pixel(127, 0)
+        display._push_frame(image)
+        self.assertEqual(display.device.display.call_count, 1)
+        display.device.command.assert_any_call(SET_COLUMN_ADDRESS, 127, 127)
+        display.device.command.assert_any_call(SET_PAGE_ADDRESS, 0, 0)
+        display.device.data.assert_called_once_with([0x01])
+
+
+class TestSpriteCache(unittest.TestCase):
+    """Tests für die vorgerenderten Sprites im OLEDDisplay"""
+    
+    @patch('display.OLED_AVAILABLE', True)
+    @patch('display.i2c')
+    @patch('display.ssd1306')
+    @patch('display.ImageFont')
+    def setUp(self, mock_font, mock_ssd1306, mock_i2c):
+        """Display mit gemockter Hardware"""
+        self.display = create_display()
+    
+    @patch('display.ImageDraw')
+    @patch('display.Image')
+    def test_symbol_and_grid_sprites_rendered_once(self, mock_image, mock_draw):
+        """Symbole und Gitter werden nur beim ersten Frame gerendert"""
+        board = [["X", "O", "*"], ["*", "X", "*"], ["*", "*", "*"]]
+        self.display._compose_frame(board, "Spieler O ist dran")
+        first_count = mock_image.new.call_count
+        
+        self.display._compose_frame(board, "Spieler O ist dran")
+        
+        # Nur noch der leere Frame wird neu angelegt
+        self.assertEqual(mock_image.new.call_count, first_count + 1)
+        self.assertEqual(set(self.display._symbol_sprites), {"X", "O"})
+    
+    @patch('display.ImageDraw')
+    @patch('display.Image')
+    def test_header_cache_is_bounded(self, mock_image, mock_draw):
+        """Status-Header werden per LRU begrenzt"""
+        limit = self.display.HEADER_CACHE_SIZE
+        for number in range(limit + 5):
+            self.display._header_sprite(f"Status {number}")
+        
+        self.assertEqual(len(self.display._header_sprites), limit)
+        self.assertNotIn("Status 0", self.display._header_sprites)
+        
+        # Zuletzt benutzte Einträge bleiben erhalten
+        self.display._header_sprite("Status 5")
+        self.display._header_sprite("Neu")
+        self.assertIn("Status 5", self.display._header_sprites)
+        self.assertNotIn("Status 6", self.display._header_sprites)
+    
+    @patch('display.ImageDraw')
+    @patch('display.Image')
+    def test_hidden_cells_are_skipped(self, mock_image, mock_draw):
+        """Ausgeblendete Gewinnfelder werden nicht eingefügt"""
+        frame = mock_image.new.return_value
+        board = [["X", "X", "X"], ["O", "O", "*"], ["*", "*", "*"]]
+        
+        self.display._compose_frame(board, "Spieler X gewinnt!", [(0, 0), (0, 1), (0, 2)])
+        
+        # Header + Gitter + zwei O-Symbole
+        self.assertEqual(frame.paste.call_count, 4)
+
+
+class TestDisplayWorker(unittest.TestCase):
+    """Tests für das Rendern im eigenen Thread"""
+    
+    def setUp(self):
+        """Worker mit gemocktem Display"""
+        self.display = Mock()
+        self.display.ANIMATION_DELAY = 0.05
+        self.frames = []
+        
+        def animation_frames(board, status, winning_line):
+            for frame in range(6):
+                self.frames.append(frame)
+                yield frame
+        
+        self.display.animation_frames.side_effect = animation_frames
+        self.worker = DisplayWorker(self.display)
+    
+    def tearDown(self):
+        """Thread beenden"""
+        self.worker.close()
+    
+    def test_show_game_is_rendered(self):
+        """Aufrufe werden im Worker ausgeführt"""
+        board = [["X", "*", "*"], ["*", "*", "*"], ["*", "*", "*"]]
+        self.worker.show_game(board, "Spieler O ist dran")
+        board[0][0] = "O"  # Spätere Änderungen dürfen den Frame nicht beeinflussen
+        self.worker.wait_idle()
+        
+        self.display.show_game.assert_called_once_with(
+            [["X", "*", "*"], ["*", "*", "*"], ["*", "*", "*"]], "Spieler O ist dran"
+        )
+    
+    def test_animation_does_not_block(self):
+        """show_game_with_animation kehrt sofort zurück"""
+        board = [["X", "X", "X"], ["O", "O", "*"], ["*", "*", "*"]]
+        start = time.monotonic()
+        self.worker.show_game_with_animation(board, "Spieler X gewinnt!", [(0, 0), (0, 1), (0, 2)])
+        self.assertLess(time.monotonic() - start, self.display.ANIMATION_DELAY)
+        
+        self.worker.wait_idle()
+        self.assertEqual(self.frames, list(range(6)))
+    
+    def test_new_frame_supersedes_animation(self):
+        """Ein neuer Frame bricht die laufende Animation ab"""
+        board = [["X", "X", "X"], ["O", "O", "*"], ["*", "*", "*"]]
+        self.worker.show_game_with_animation(board, "Spieler X gewinnt!", [(0, 0), (0, 1), (0, 2)])
+        time.sleep(self.display.ANIMATION_DELAY / 2)
+        
+        empty_board = [["*"] * 3 for _ in range(3)]
+        self.worker.show_game(empty_board, "Spieler X ist dran")
+        self.worker.wait_idle()
+        
+        self.assertLess(len(self.frames), 6)
+        self.display.show_game.assert_called_with(empty_board, "Spieler X ist dran")
+
+
 class TestTicTacToeGame(unittest.TestCase):
     """Tests für die Hauptspiel-Klasse"""
     
@@ -365,10 +1808,404 @@ class TestTicTacToeGame(unittest.TestCase):
         self.assertIn("Status:", output)
         self.assertIn("Current board:", output)
     
+    def test_main_loop_waits_for_input(self):
+        """Die Hauptschleife wartet auf Tasten statt fest zu schlafen"""
+        self.mock_keypad.wait_for_input.side_effect = [None, (0, 0), (3, 3)]
+        self.mock_keypad.map_key_to_action.side_effect = [
+            (InputAction.GAME_MOVE, (0, 0)),
+            (InputAction.EXIT_PROGRAM, None),
+        ]
+        
+        self.game.running = True
+        self.game._run_main_loop()
+        
+        self.assertFalse(self.game.running)
+        self.assertEqual(self.game.game_logic.board[0][0], "X")
+        self.mock_keypad.wait_for_input.assert_called_with(self.game.MAIN_LOOP_DELAY)
+    
     def test_cleanup(self):
         """Test für Ressourcen-Aufräumung"""
         self.game.cleanup()
         self.mock_keypad.cleanup.assert_called_once()
+    
+    def test_keypad_pages_reach_large_board(self):
+        """Mit [0] erreicht das 3×3 Keypad jedes Feld eines großen Boards"""
+        game = TicTacToeGame(board_size=4, keypad=Mock(), display=Mock())
+        self.assertEqual(game._page_origins(), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        
+        for _ in range(3):
+            game._dispatch_action(InputAction.NEXT_PAGE, None)
+        self.assertEqual(game._status_message(), "Spieler X ist dran 4/4")
+        game._dispatch_action(InputAction.GAME_MOVE, (2, 2))
+        self.assertEqual(game.game_logic.board[3][3], "X")
+        
+        game._dispatch_action(InputAction.NEXT_PAGE, None)
+        game._dispatch_action(InputAction.GAME_MOVE, (0, 0))
+        self.assertEqual(game.game_logic.board[0][0], "O")
+    
+    def test_keypad_pages_on_3x3(self):
+        """Auf 3×3 bleibt das Fenster fest und der Status unverändert"""
+        self.game._dispatch_action(InputAction.NEXT_PAGE, None)
+        self.assertEqual(self.game._page, 0)
+        self.assertEqual(self.game._status_message(), "Spieler X ist dran")
+
+
+class TestAsyncGame(unittest.TestCase):
+    """Tests für den asyncio-basierten Spielablauf"""
+    
+    @patch('game.create_display')
+    @patch('game.KeypadInput')
+    def setUp(self, mock_keypad_class, mock_create_display):
+        """Setup mit gemocktem Display und Interrupt-Keypad"""
+        self.mock_display = Mock()
+        self.mock_keypad = Mock()
+        self.mock_keypad.edge_triggered = True
+        self.mock_keypad.on_key = None
+        self.mock_keypad.map_key_to_action.side_effect = (
+            lambda key: KeypadInput.map_key_to_action(None, key)
+        )
+        mock_create_display.return_value = self.mock_display
+        mock_keypad_class.return_value = self.mock_keypad
+        
+        self.game = AsyncTicTacToeGame()
+        self.game.WELCOME_DELAY = 0
+    
+    def _run_with_keys(self, keys):
+        """Startet die Event-Loop und drückt die Tasten aus einem Fremd-Thread"""
+        async def scenario():
+            self.game.running = True
+            runner = asyncio.create_task(self.game._run_async())
+            while self.mock_keypad.on_key is None:
+                await asyncio.sleep(0)
+            presser = threading.Thread(
+                target=lambda: [self.mock_keypad.on_key(key) for key in keys]
+            )
+            presser.start()
+            await asyncio.wait_for(runner, timeout=5)
+            presser.join()
+        
+        asyncio.run(scenario())
+    
+    def test_key_events_dispatch_to_handlers(self):
+        """Tasten aus dem GPIO-Thread landen bei den Handlern"""
+        self._run_with_keys([(0, 0), (1, 1), (3, 3)])
+        
+        self.assertFalse(self.game.running)
+        self.assertEqual(self.game.game_logic.board[0][0], "X")
+        self.assertEqual(self.game.game_logic.board[1][1], "O")
+        self.mock_display.show_welcome.assert_called_once()
+        self.assertIsNone(self.mock_keypad.on_key)
+    
+    def test_computer_move_runs_in_executor(self):
+        """Computer-Züge werden außerhalb der Event-Loop berechnet"""
+        loop_thread = threading.get_ident()
+        worker_threads = []
+        computer = RandomPlayer()
+        
+        def choose_move(game):
+            worker_threads.append(threading.get_ident())
+            return computer.choose_move(game)
+        
+        self.game.computer = Mock(choose_move=choose_move)
+        self._run_with_keys([(3, 2), (3, 3)])
+        
+        self.assertEqual(len(worker_threads), 1)
+        self.assertNotEqual(worker_threads[0], loop_thread)
+        self.assertEqual(len(self.game.game_logic.move_history), 1)
+    
+    def test_no_state_saved_during_search(self):
+        """Ausprobierte Suchzüge landen nicht in der Spielstand-Datei"""
+        self.game.state_file = Mock(interval=60.0)
+        self.game.state_file.load.return_value = None
+        computer = RandomPlayer()
+        
+        def choose_move(game):
+            game.make_move(2, 2)
+            self.game._save_state_if_idle()
+            game.unmake_move()
+            return computer.choose_move(game)
+        
+        self.game.computer = Mock(choose_move=choose_move)
+        self._run_with_keys([(3, 2), (3, 3)])
+        
+        trial = GameLogic()
+        trial.make_move(2, 2)
+        saved = [call.args[0] for call in self.game.state_file.save.call_args_list]
+        self.assertNotIn(trial.snapshot(), saved)
+        self.assertEqual(len(self.game.game_logic.move_history), 1)
+    
+    def test_polling_fallback(self):
+        """Ohne Interrupt-Keypad pollt ein Executor-Thread"""
+        self.mock_keypad.edge_triggered = False
+        keys = iter([None, (0, 2), (3, 3)])
+        self.mock_keypad.wait_for_input.side_effect = lambda timeout: next(keys, None)
+        
+        self.game.running = True
+        asyncio.run(asyncio.wait_for(self.game._run_async(), timeout=5))
+        
+        self.assertEqual(self.game.game_logic.board[0][2], "X")
+        self.assertFalse(self.game.running)
+
+
+class TestVirtualDevices(unittest.TestCase):
+    """Tests für Keypad und Display ohne Hardware"""
+    
+    def test_scripted_keypad_replays_keys(self):
+        """Die Folge wird abgespielt und mit der Beenden-Taste abgeschlossen"""
+        keypad = ScriptedKeypad([(0, 0), (3, 0)])
+        keys = [keypad.wait_for_input(0) for _ in range(4)]
+        
+        self.assertEqual(keys, [(0, 0), (3, 0), (3, 3), None])
+        self.assertTrue(keypad.finished)
+        self.assertEqual(keypad.map_key_to_action((3, 3)), (InputAction.EXIT_PROGRAM, None))
+    
+    def test_scripted_keypad_rate(self):
+        """Mit Taktvorgabe werden Tasten erst zum fälligen Zeitpunkt geliefert"""
+        clock = _FakeClock()
+        keypad = ScriptedKeypad([(0, 0), (0, 1), (0, 2)], rate=10, exit_when_done=False,
+                                clock=clock)
+        
+        self.assertEqual(keypad.get_input_with_debounce(), (0, 0))
+        clock.now = 0.05
+        self.assertIsNone(keypad.get_input_with_debounce())
+        clock.now = 0.1
+        self.assertEqual(keypad.get_input_with_debounce(), (0, 1))
+        clock.now = 1.0
+        self.assertEqual(keypad.get_input_with_debounce(), (0, 2))
+        self.assertIsNone(keypad.get_input_with_debounce())
+    
+    def test_memory_device_matches_framebuffer(self):
+        """Dirty-Region Übertragungen ergeben im Gerät denselben Frame"""
+        display = RecordingDisplay(max_frames=2)
+        image = _FakeImage()
+        image.set_pixel(3, 3)
+        display._push_frame(image)
+        
+        for x, y in [(0, 0), (127, 63), (60, 20), (61, 30)]:
+            image.set_pixel(x, y)
+            display._push_frame(image)
+        
+        self.assertEqual(display.device.pages, display.framebuffer.pages)
+        self.assertEqual(display.frames[-1], bytes(rows_to_pages(image.tobytes(), 128, 64)))
+        self.assertEqual((display.frame_count, len(display.frames)), (5, 2))
+        self.assertLess(display.device.bytes_written, 2 * 1024)
+    
+    def test_memory_device_window_wraps(self):
+        """Daten laufen im Adressfenster zeilenweise weiter"""
+        device = MemoryDevice()
+        device.command(SET_COLUMN_ADDRESS, 10, 11)
+        device.command(SET_PAGE_ADDRESS, 2, 3)
+        device.data([1, 2, 3, 4])
+        
+        self.assertEqual(device.pages[2 * 128 + 10:2 * 128 + 12], bytearray([1, 2]))
+        self.assertEqual(device.pages[3 * 128 + 10:3 * 128 + 12], bytearray([3, 4]))
+    
+    def test_game_with_injected_backends(self):
+        """Das Spiel läuft mit eingesetzten Backends ohne GPIO und I2C"""
+        display = Mock()
+        keypad = ScriptedKeypad([(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+        game = TicTacToeGame(keypad=keypad, display=display)
+        game.WELCOME_DELAY = 0
+        
+        with patch('sys.stdout', new_callable=io.StringIO):
+            game.start()
+        
+        self.assertEqual(game.game_logic.winner, "X")
+        display.show_welcome.assert_called_once()
+        display.show_game_with_animation.assert_called_once()
+        self.assertEqual(keypad.delivered, 6)
+
+
+class TestLatency(unittest.TestCase):
+    """Tests für die Latenz-Messung Taste -> Pixel"""
+    
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.tracer = latency.LatencyTracer(clock=self.clock)
+    
+    def tearDown(self):
+        latency.disable()
+    
+    def test_stages_and_total(self):
+        """Jede Marke misst die Zeit seit der vorherigen, end() die Gesamtlatenz"""
+        self.clock.now = 1.0
+        self.tracer.begin(start=0.9)
+        for stage, now in [("map", 1.001), ("move", 1.003), ("compose", 1.006)]:
+            self.clock.now = now
+            self.tracer.mark(stage)
+        self.clock.now = 1.010
+        self.tracer.end("flush")
+        
+        # Ohne laufende Messung (z.B. Animations-Frames) wird nichts gespeichert
+        self.tracer.end("flush")
+        
+        samples = {stage: list(values) for stage, values in self.tracer.samples.items() if values}
+        self.assertEqual(set(samples), {"map", "move", "compose", "flush", "total"})
+        self.assertAlmostEqual(samples["compose"][0], 0.003)
+        self.assertAlmostEqual(samples["flush"][0], 0.004)
+        self.assertAlmostEqual(samples["total"][0], 0.110)
+    
+    def test_percentiles(self):
+        """Nearest-Rank Perzentile in Millisekunden"""
+        for value in range(1, 101):
+            self.tracer.record("move", value / 1000)
+        
+        entry = self.tracer.report()["move"]
+        self.assertEqual(entry["count"], 100)
+        self.assertAlmostEqual(entry["p50_ms"], 50)
+        self.assertAlmostEqual(entry["p95_ms"], 95)
+        self.assertAlmostEqual(entry["p99_ms"], 99)
+        self.assertAlmostEqual(entry["max_ms"], 100)
+    
+    def test_dump_on_signal(self):
+        """Der Bericht wird bei SIGUSR1 in die Datei geschrieben"""
+        import json
+        import os
+        import signal
+        import tempfile
+        
+        self.tracer.record("flush", 0.002)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "latency.json")
+            previous = signal.getsignal(signal.SIGUSR1)
+            try:
+                self.tracer.install_signal_handler(path)
+                # Signal, während der Hauptthread den Lock hält (z.B. in mark())
+                with self.tracer._lock:
+                    os.kill(os.getpid(), signal.SIGUSR1)
+                self.tracer._dump_thread.join(timeout=5)
+            finally:
+                signal.signal(signal.SIGUSR1, previous)
+            
+            with open(path) as report_file:
+                report = json.load(report_file)
+        self.assertAlmostEqual(report["flush"]["p50_ms"], 2)
+    
+    def test_keypad_scan_and_debounce(self):
+        """Polling-Keypad trägt Scan- und Entprellzeit des bestätigten Drucks ein"""
+        tracer = latency.enable()
+        matrix = _FakeMatrix()
+        with patch('keypad_input.DigitalOutputDevice', side_effect=matrix.rows), \
+                patch('keypad_input.Button', side_effect=matrix.cols):
+            keypad = KeypadInput(debouncer=Debouncer(0.02, 0.05, clock=self.clock))
+        keypad.SCAN_DELAY = 0
+        
+        matrix.pressed_key = (1, 2)
+        keypad.poll_events()
+        self.clock.now = 0.03
+        keypad.poll_events()
+        
+        self.assertEqual(len(tracer.samples["scan"]), 1)
+        self.assertAlmostEqual(tracer.samples["debounce"][0], 0.03)
+    
+    def test_game_marks_map_and_move(self):
+        """Das Spiel markiert Mapping und Zug; ohne Tracer entstehen keine Daten"""
+        tracer = latency.enable()
+        game = TicTacToeGame(keypad=ScriptedKeypad([(0, 0), (0, 0), (3, 2)]), display=Mock())
+        game.WELCOME_DELAY = 0
+        with patch('sys.stdout', new_callable=io.StringIO):
+            game.start()
+        
+        self.assertEqual(len(tracer.samples["map"]), 4)
+        self.assertEqual(len(tracer.samples["move"]), 2)
+        
+        latency.disable()
+        self.assertIsNone(latency.tracer)
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Tests für die Microbenchmark-Suite"""
+    
+    def test_run_benchmarks(self):
+        """Logik-Benchmarks liefern Zeiten im Baseline-Format"""
+        report = run_benchmarks(["make_move", "check_winner", "random_game", "map_key"],
+                                repeat=1, min_time=0.001)
+        
+        self.assertEqual(set(report["results"]),
+                         {"make_move", "check_winner", "random_game", "map_key"})
+        for entry in report["results"].values():
+            self.assertGreater(entry["ns_per_op"], 0)
+            self.assertAlmostEqual(entry["ops_per_second"] * entry["ns_per_op"] / 1e9, 1.0)
+    
+    def test_compare_flags_regressions(self):
+        """Nur Verlangsamungen über der Schwelle gelten als Regression"""
+        baseline = {"results": {"a": {"ns_per_op": 100.0}, "b": {"ns_per_op": 100.0}}}
+        report = {"results": {
+            "a": {"ns_per_op": 109.0},
+            "b": {"ns_per_op": 125.0},
+            "c": {"ns_per_op": 1.0},
+        }}
+        
+        self.assertEqual(compare_benchmarks(report, baseline, 0.10), [("b", 100.0, 125.0, 1.25)])
+    
+    def test_memory_per_instance(self):
+        """Ein Spielverlauf legt pro Instanz kaum zusätzlichen Speicher an"""
+        new = measure_memory(MEMORY_BENCHMARKS["game_new"], count=1000)
+        won = measure_memory(MEMORY_BENCHMARKS["game_won"], count=1000)
+        
+        self.assertGreater(new, 0)
+        self.assertLess(won - new, 64)
+
+
+class TestColdStart(unittest.TestCase):
+    """Tests für den schnellen Start mit vorgerendertem Willkommensbildschirm"""
+    
+    def test_welcome_bitmap_without_fonts(self):
+        """Der erste Frame kommt aus welcome.bin, ohne Schriftarten zu laden"""
+        display = RecordingDisplay()
+        display.show_welcome()
+        
+        self.assertIsNone(display._fonts)
+        self.assertEqual(display.device.pages, load_welcome_bitmap())
+        self.assertEqual(display.frame_count, 1)
+    
+    def test_invalid_welcome_bitmap(self):
+        """Fehlende oder unpassende Dateien werden ignoriert"""
+        import os
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "welcome.bin")
+            self.assertIsNone(load_welcome_bitmap(path))
+            with open(path, "wb") as bitmap_file:
+                bitmap_file.write(b"\x00" * 10)
+            self.assertIsNone(load_welcome_bitmap(path))
+    
+    def test_splash_before_keypad_setup(self):
+        """Der Willkommensbildschirm erscheint vor der GPIO-Initialisierung"""
+        display = Mock()
+        
+        def create_keypad(edge_triggered):
+            display.show_welcome.assert_called_once()
+            return Mock()
+        
+        with patch('game.KeypadInput', side_effect=create_keypad):
+            TicTacToeGame(display=display)
+        display.preload.assert_called_once()
+    
+    def test_first_key_dismisses_welcome(self):
+        """Die erste Taste schließt den Willkommensbildschirm, ohne einen Zug auszulösen"""
+        keypad = ScriptedKeypad([(1, 1), (0, 0)])
+        game = TicTacToeGame(keypad=keypad, display=Mock())
+        game.WELCOME_DELAY = 30
+        
+        start = time.monotonic()
+        with patch('sys.stdout', new_callable=io.StringIO):
+            game.start()
+        
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(game.game_logic.board[1][1], "*")
+        self.assertEqual(game.game_logic.board[0][0], "X")
+    
+    def test_search_engines_load_lazily(self):
+        """Der Spielstart lädt die Suchmodule erst, wenn eine Strategie sie braucht"""
+        import subprocess
+        code = ("import sys, main; "
+                "print(sorted(m for m in ('mcts', 'multiprocessing', 'opening_book', "
+                "'solution_table', 'symmetry', 'asyncio') if m in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True, cwd=sys.path[0] or ".").stdout
+        self.assertEqual(output.strip(), "[]")
 
 
 class TestIntegration(unittest.TestCase):
@@ -439,9 +2276,31 @@ def run_tests():
     # Test-Suite zusammenstellen
     test_classes = [
         TestGameLogic,
+        TestLargeBoards,
+        TestBitBoard,
+        TestComputerPlayer,
+        TestMCTS,
+        TestSolutionTable,
+        TestSymmetry,
+        TestBatchSimulator,
+        TestTournament,
+        TestGameRecord,
+        TestOpeningBook,
+        TestGameServer,
+        TestStateFile,
         TestKeypadInput,
+        TestEdgeTriggeredKeypad,
+        TestDebouncer,
         TestDisplay,
+        TestFrameBuffer,
+        TestSpriteCache,
+        TestDisplayWorker,
         TestTicTacToeGame,
+        TestAsyncGame,
+        TestVirtualDevices,
+        TestLatency,
+        TestBenchmarks,
+        TestColdStart,
         TestIntegration
     ]
     
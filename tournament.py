@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Turnier-Runner für Tic-Tac-Toe
+Lässt Zug-Strategien in mehreren Prozessen gegeneinander spielen
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Dict, List, Tuple
+import argparse
+import importlib
+import json
+import os
+import random
+import time
+
+from computer_player import MovePolicy, create_move_policy
+from game_logic import GameLogic
+
+
+# Eine Aufgabe: (Strategie A, Strategie B, Anzahl Partien, Seed)
+ShardTask = Tuple[str, str, int, int]
+
+
+def create_player(name: str, seed: int):
+    """Erzeugt eine Strategie aus ihrem Namen
+
+    Erlaubt sind "random", "minimax", "table", "book", "mcts" oder "modul:factory".
+    """
+    if name in [policy.value for policy in MovePolicy]:
+        player = create_move_policy(MovePolicy(name))
+    else:
+        module_name, _, factory_name = name.partition(":")
+        player = getattr(importlib.import_module(module_name), factory_name)()
+
+    if hasattr(player, "rng"):
+        player.rng = random.Random(seed)
+    return player
+
+
+def latency_bucket(seconds: float) -> int:
+    """Histogramm-Bucket: Bitlänge der Latenz in Mikrosekunden (Bucket b = [2^(b-1), 2^b) µs)"""
+    return int(seconds * 1_000_000).bit_length()
+
+
+def play_shard(task: ShardTask) -> Dict:
+    """Spielt einen Teil der Partien einer Paarung (läuft im Worker-Prozess)"""
+    name_a, name_b, games, seed = task
+    random.seed(seed)
+    players = {name_a: create_player(name_a, seed), name_b: create_player(name_b, seed + 1)}
+
+    result = {
+        "pairing": [name_a, name_b],
+        "wins_a": 0, "wins_b": 0, "draws": 0,
+        "latency": {name_a: {}, name_b: {}},
+    }
+    game = GameLogic()
+
+    for game_number in range(games):
+        game.reset_game()
+        # Abwechselnd beginnt A oder B
+        order = (name_a, name_b) if game_number % 2 == 0 else (name_b, name_a)
+
+        while not game.game_over:
+            name = order[game.current_player]
+            start = time.perf_counter()
+            players[name].make_move(game)
+            bucket = str(latency_bucket(time.perf_counter() - start))
+            histogram = result["latency"][name]
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+        if game.winner is None:
+            result["draws"] += 1
+        elif order[0 if game.winner == "X" else 1] == name_a:
+            result["wins_a"] += 1
+        else:
+            result["wins_b"] += 1
+
+    return result
+
+
+def build_tasks(policies: List[str], games: int, shards: int, seed: int) -> List[ShardTask]:
+    """Teilt jede Paarung in Shards mit deterministischen Seeds auf"""
+    tasks = []
+    for pairing_index, (name_a, name_b) in enumerate(combinations(policies, 2)):
+        for shard in range(shards):
+            shard_games = games // shards + (1 if shard < games % shards else 0)
+            if shard_games:
+                task_seed = seed + pairing_index * 1_000_003 + shard * 2
+                tasks.append((name_a, name_b, shard_games, task_seed))
+    return tasks
+
+
+def merge_results(results: List[Dict]) -> Dict:
+    """Fasst Shard-Ergebnisse zu Tabellen pro Paarung und Histogrammen pro Strategie zusammen"""
+    table: Dict[str, Dict[str, int]] = {}
+    latency: Dict[str, Dict[str, int]] = {}
+
+    for result in results:
+        key = " vs ".join(result["pairing"])
+        entry = table.setdefault(key, {"wins_a": 0, "wins_b": 0, "draws": 0})
+        for field in entry:
+            entry[field] += result[field]
+
+        for name, histogram in result["latency"].items():
+            merged = latency.setdefault(name, {})
+            for bucket, count in histogram.items():
+                merged[bucket] = merged.get(bucket, 0) + count
+
+    return {"table": table, "latency": latency}
+
+
+def run_tournament(policies: List[str], games: int, workers: int, seed: int = 0,
+                   shards: int = 0) -> Dict:
+    """Führt ein Rundenturnier aller Strategien aus"""
+    shards = shards or workers * 4
+    tasks = build_tasks(policies, games, shards, seed)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(play_shard, tasks))
+    return merge_results(results)
+
+
+def print_report(report: Dict) -> None:
+    """Gibt Ergebnistabelle und Latenz-Histogramme aus"""
+    print("=" * 60)
+    print(f"{'Paarung':<30}{'Sieg A':>10}{'Sieg B':>10}{'Remis':>10}")
+    print("-" * 60)
+    for pairing, entry in report["table"].items():
+        print(f"{pairing:<30}{entry['wins_a']:>10}{entry['wins_b']:>10}{entry['draws']:>10}")
+
+    print("=" * 60)
+    print("Latenz pro Zug (µs):")
+    for name, histogram in report["latency"].items():
+        print(f"  {name}")
+        for bucket in sorted(histogram, key=int):
+            upper = 1 << int(bucket)
+            print(f"    < {upper:>8}: {histogram[bucket]}")
+
+
+def main():
+    """Einstiegspunkt für das Turnier"""
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe Strategie-Turnier")
+    parser.add_argument("policies", nargs="+",
+                        help="Strategien: random, minimax, table oder modul:factory")
+    parser.add_argument("--games", type=int, default=1000, help="Partien pro Paarung")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Anzahl Worker-Prozesse")
+    parser.add_argument("--seed", type=int, default=0, help="Basis-Seed")
+    parser.add_argument("--json", help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    if len(args.policies) < 2:
+        parser.error("Mindestens zwei Strategien angeben")
+
+    report = run_tournament(args.policies, args.games, args.workers, args.seed)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Virtuelle Geräte für Tic-Tac-Toe
+Keypad und Display ohne Hardware (für CI, Lasttests und Entwicklung am PC)
+"""
+
+from collections import deque
+from itertools import chain
+from time import monotonic, sleep
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+import queue
+
+from display import OLEDDisplay, PIL_AVAILABLE
+from framebuffer import PAGE_HEIGHT, SET_COLUMN_ADDRESS, SET_PAGE_ADDRESS, rows_to_pages
+from keypad_input import EXIT_KEY, InputAction, map_key_to_action
+import latency
+
+
+class ScriptedKeypad:
+    """Spielt eine Tastenfolge ab, mit derselben Schnittstelle wie KeypadInput
+
+    Mit rate (Tasten pro Sekunde) werden die Tasten im festen Takt geliefert,
+    ohne rate so schnell wie sie abgefragt werden. Ist die Folge zu Ende, folgt
+    mit exit_when_done die Beenden-Taste, sonst liefert das Keypad nur noch None.
+    """
+
+    edge_triggered = False
+
+    def __init__(self, keys: Iterable[Tuple[int, int]], rate: Optional[float] = None,
+                 exit_when_done: bool = True, clock: Callable[[], float] = monotonic):
+        if rate is not None and rate <= 0:
+            raise ValueError("Tastenrate muss positiv sein")
+
+        self._keys: Iterator[Tuple[int, int]] = (
+            chain(keys, [EXIT_KEY]) if exit_when_done else iter(keys)
+        )
+        self.rate = rate
+        self.clock = clock
+        self.delivered = 0
+        self.finished = False
+        self._start: Optional[float] = None
+
+        # Gleiche Attribute wie KeypadInput (z.B. für AsyncTicTacToeGame)
+        self.events: "queue.Queue[Tuple[int, int]]" = queue.Queue()
+        self.on_key: Optional[Callable[[Tuple[int, int]], None]] = None
+
+    def _time_until_due(self) -> float:
+        """Sekunden bis die nächste Taste fällig ist (0 ohne Taktvorgabe)"""
+        if self.rate is None:
+            return 0.0
+        now = self.clock()
+        if self._start is None:
+            self._start = now
+        return self._start + self.delivered / self.rate - now
+
+    def _next_key(self) -> Optional[Tuple[int, int]]:
+        """Nimmt die nächste Taste aus der Folge"""
+        if self.finished:
+            return None
+        try:
+            key = next(self._keys)
+        except StopIteration:
+            self.finished = True
+            return None
+        self.delivered += 1
+        if latency.tracer is not None:
+            latency.tracer.begin()
+        return key
+
+    def get_input_with_debounce(self) -> Optional[Tuple[int, int]]:
+        """Gibt die nächste Taste zurück, falls sie schon fällig ist"""
+        if self._time_until_due() > 0:
+            return None
+        return self._next_key()
+
+    def wait_for_input(self, timeout: float) -> Optional[Tuple[int, int]]:
+        """Wartet höchstens timeout Sekunden auf die nächste fällige Taste"""
+        wait = self._time_until_due()
+        if wait > timeout:
+            sleep(timeout)
+            return None
+        if wait > 0:
+            sleep(wait)
+
+        key = self._next_key()
+        if key is None:
+            sleep(timeout)
+        return key
+
+    def map_key_to_action(self, key: Tuple[int, int]) -> Tuple[InputAction, Optional[Tuple[int, int]]]:
+        """Mapped eine Tasteneingabe zu einer Aktion"""
+        return map_key_to_action(key)
+
+    def cleanup(self) -> None:
+        """Keine Hardware-Ressourcen vorhanden"""
+        self.finished = True
+
+
+class MemoryDevice:
+    """SSD1306 im Speicher: versteht die Aufrufe, die OLEDDisplay an luma sendet
+
+    display() übernimmt ein ganzes Bild, command() setzt das Adressfenster
+    (horizontaler Adressierungsmodus) und data() schreibt Page-Bytes hinein.
+    """
+
+    def __init__(self, width: int = OLEDDisplay.WIDTH, height: int = OLEDDisplay.HEIGHT):
+        self.width = width
+        self.height = height
+        self.page_count = height // PAGE_HEIGHT
+        self.pages = bytearray(width * self.page_count)
+        self.bytes_written = 0
+        self._columns = (0, width - 1)
+        self._page_range = (0, self.page_count - 1)
+        self._column = 0
+        self._page = 0
+
+    def display(self, img) -> None:
+        """Überträgt ein komplettes Bild"""
+        self.pages[:] = rows_to_pages(img.tobytes(), self.width, self.height)
+        self.bytes_written += len(self.pages)
+
+    def command(self, *command: int) -> None:
+        """Verarbeitet die Befehle für das Spalten- und Page-Adressfenster"""
+        if command[0] == SET_COLUMN_ADDRESS:
+            self._columns = (command[1], command[2])
+            self._column = command[1]
+        elif command[0] == SET_PAGE_ADDRESS:
+            self._page_range = (command[1], command[2])
+            self._page = command[1]
+
+    def data(self, values) -> None:
+        """Schreibt Page-Bytes ab der aktuellen Adresse (mit Zeilenumbruch im Fenster)"""
+        first_column, last_column = self._columns
+        first_page, last_page = self._page_range
+        for value in values:
+            self.pages[self._page * self.width + self._column] = value
+            self._column += 1
+            if self._column > last_column:
+                self._column = first_column
+                self._page = first_page if self._page >= last_page else self._page + 1
+        self.bytes_written += len(values)
+
+
+class RecordingDisplay(OLEDDisplay):
+    """OLEDDisplay auf einem MemoryDevice, das jeden übertragenen Frame aufzeichnet
+
+    frames enthält die Page-Bytes der letzten max_frames Frames (None: alle),
+    frame_count zählt alle Frames seit dem Start.
+    """
+
+    def __init__(self, board_size: int = 3, max_frames: Optional[int] = None):
+        if not PIL_AVAILABLE:
+            raise RuntimeError("Pillow wird für das Rendern der Frames benötigt")
+
+        super().__init__(board_size=board_size, device=MemoryDevice(self.WIDTH, self.HEIGHT))
+        self.frames: "deque[bytes]" = deque(maxlen=max_frames)
+        self.frame_count = 0
+
+    def _push_pages(self, pages: bytearray, img=None) -> None:
+        """Überträgt den Frame und zeichnet den Inhalt des Geräts auf"""
+        super()._push_pages(pages, img)
+        self.frames.append(bytes(self.device.pages))
+        self.frame_count += 1